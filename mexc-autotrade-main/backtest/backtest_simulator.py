@@ -1,24 +1,139 @@
 import csv
 import os
+import random
+import time
+from datetime import datetime
 from loguru import logger
+from config.config import EMA_SHORT, EMA_MID, EMA_LONG, PRICE_THRESHOLD
 from core.strategy import TradingStrategy
+from core.risk_manager import RiskManager
+from core.scheduler import Scheduler
+from core.clock import VirtualClock
+from backtest.sim_doubles import SimPositionTracker, SimOrderExecutor
 
 """
 백테스트 시뮬레이터 예시:
 - CSV (datetime, open, high, low, close, volume) 포맷
 - 종가만 읽어 strategy.on_new_price(close) 호출
+- VirtualClock + 메모리 대역(SimPositionTracker/SimOrderExecutor)으로
+  실전 RiskManager의 휴식 규칙(90분, 목표 거래량, 15:00 리셋)까지 빨리 감기로 재생
 """
 
 # 시세 데이터를 저장해둘 CSV 파일 경로 (예: btc_1m.csv)
 CSV_FILE = os.path.join("backtest", "data", "btc_1m.csv")
 
+
+def default_params() -> dict:
+    """전략/체결 파라미터 기본값 (config.py 값). 파라미터 스윕은 이 키들을 바꿔 넘김."""
+    return {
+        "ema_short": EMA_SHORT,
+        "ema_mid": EMA_MID,
+        "ema_long": EMA_LONG,
+        "price_threshold": PRICE_THRESHOLD,
+        "fee_rate": 0.0002,
+    }
+
+
 class BacktestSimulator:
-    def __init__(self, csv_file=CSV_FILE):
+    def __init__(self, csv_file=CSV_FILE, symbol="BTC_USDT", user_seed=1000.0, bar_sec=60, seed=None,
+                 params=None, record_fills=False):
+        """
+        user_seed: 운용 시드(USDT) = 시뮬레이션 시작 잔고
+        bar_sec: CSV에 datetime 열이 없을 때 행 간격(초)
+        seed: 휴식 시간 난수 시드 (같은 값이면 같은 결과)
+        params: default_params() 중 바꿀 값 (예: {"ema_long": 9})
+        record_fills: True면 체결 내역을 order_executor.fills에 기록
+        """
         self.csv_file = csv_file
-        self.strategy = TradingStrategy()
-        # 백테스트 시에는 실제 주문(OrderExecutor)이 필요 없으므로 None (또는 Mock) 할당
-        self.strategy.set_order_executor(None)
-        # TODO: 백테스트용 PositionTracker, RiskManager 등을 연결할 수도 있음.
+        self.bar_sec = bar_sec
+        self.clock = None
+        self.scheduler = None
+        self.params = {**default_params(), **(params or {})}
+
+        self.position_tracker = SimPositionTracker(symbol=symbol, balance=user_seed)
+        self.order_executor = SimOrderExecutor(
+            self.position_tracker, fee_rate=self.params["fee_rate"], record_fills=record_fills
+        )
+        self.position_tracker.temp_order_executor = self.order_executor
+        self.position_tracker.set_initial_balance()
+
+        self.user_seed = user_seed
+        self.rng = random.Random(seed)
+        self.risk_manager = None
+        self.strategy = None
+        self.symbol = symbol
+
+    def _setup(self, start_ts: float):
+        """첫 시세 시각에 맞춰 가상 시계와 RiskManager/전략/스케줄러 구성."""
+        self.clock = VirtualClock(start_ts)
+        self.scheduler = Scheduler(clock=self.clock)
+        self.risk_manager = RiskManager(
+            driver=None, position_tracker=self.position_tracker, user_seed=self.user_seed,
+            clock=self.clock, rng=self.rng
+        )
+        self.risk_manager.set_scheduler(self.scheduler)
+        self.scheduler.daily_at(15, 0, self._daily_reset, name="daily_reset")
+
+        self.strategy = TradingStrategy(
+            symbol=self.symbol, position_tracker=self.position_tracker, risk_manager=self.risk_manager
+        )
+        self.strategy.set_order_executor(self.order_executor)
+        self.strategy.set_user_seed(self.user_seed)
+        self.strategy.alpha_1 = 2 / (self.params["ema_short"] + 1)
+        self.strategy.alpha_3 = 2 / (self.params["ema_mid"] + 1)
+        self.strategy.alpha_7 = 2 / (self.params["ema_long"] + 1)
+        self.strategy.price_threshold = self.params["price_threshold"]
+
+    def _daily_reset(self):
+        self.position_tracker._accumulated_volume = 0.0
+        self.position_tracker._realized_pnl = 0.0
+
+    def on_price(self, ts: float, price: float):
+        """ts(epoch초)까지 예약 작업을 처리한 뒤 시세 1건 전달."""
+        if self.clock is None:
+            self._setup(ts)
+        self.scheduler.run_until(ts)
+        self.position_tracker.set_price(price, ts)
+        self.strategy.on_new_price(price)
+
+    def run_prices(self, prices) -> int:
+        """(ts, price) 시퀀스를 재생하고 처리 건수 반환."""
+        started = time.time()
+        count = 0
+        first_ts = last_ts = None
+        for ts, price in prices:
+            if first_ts is None:
+                first_ts = ts
+            last_ts = ts
+            self.on_price(ts, price)
+            count += 1
+
+        if count:
+            self._log_summary(count, last_ts - first_ts, time.time() - started)
+        return count
+
+    def summary(self) -> dict:
+        """재생 결과 요약 지표 (결과 캐시/스윕 비교용)."""
+        tracker = self.position_tracker
+        pause_job = self.risk_manager._pause_job if self.risk_manager else None
+        return {
+            "orders": self.order_executor.orders,
+            "pauses": pause_job.runs if pause_job else 0,
+            "volume": tracker.get_accumulated_volume(),
+            "profit": tracker.get_current_profit(),
+            "balance": tracker.get_total_balance(),
+            "long_size": self.strategy.long_size if self.strategy else 0,
+            "short_size": self.strategy.short_size if self.strategy else 0,
+        }
+
+    def _log_summary(self, count, sim_sec, wall_sec):
+        tracker = self.position_tracker
+        pauses = self.risk_manager._pause_job.runs if self.risk_manager._pause_job else 0
+        logger.info(
+            f"[BacktestSimulator] {count}건, 가상 {sim_sec / 3600:.1f}시간을 {wall_sec:.2f}s에 재생 | "
+            f"주문 {self.order_executor.orders}회, 휴식 {pauses}회, "
+            f"누적 거래량 {tracker.get_accumulated_volume():.2f}, 손익 {tracker.get_current_profit():.4f} USDT"
+        )
 
     def run(self):
         if not os.path.exists(self.csv_file):
@@ -29,21 +144,34 @@ class BacktestSimulator:
 
         with open(self.csv_file, "r", encoding="utf-8") as f:
             reader = csv.DictReader(f)
-            row_count = 0
-            for row in reader:
-                row_count += 1
-                # CSV에서 종가만 사용 (datetime, open, high, low 등은 생략)
-                close_price = float(row["close"])
-                # 새로운 종가가 들어올 때마다 전략 실행
-                self.strategy.on_new_price(close_price)
+            # 종가 + 시각만 사용 (open, high, low 등은 생략)
+            row_count = self.run_prices(self._iter_rows(reader))
 
         logger.info(f"[BacktestSimulator] 총 {row_count} 건 처리 완료.")
+        if not row_count:
+            return
         # 예시) 최종 포지션 상태
         logger.info(
             f"[BacktestSimulator] 최종 포지션: long={self.strategy.long_size}, "
             f"short={self.strategy.short_size}"
         )
 
+    def _iter_rows(self, reader, start_ts=None):
+        """
+        datetime 열이 없으면 start_ts(없으면 현재 시각)부터 bar_sec 간격으로 시각을 매김.
+        재현이 필요한 실행(결과 캐시 등)은 start_ts를 고정값으로 넘길 것.
+        """
+        ts = None
+        for row in reader:
+            raw = row.get("datetime")
+            if raw:
+                ts = datetime.fromisoformat(raw).timestamp()
+            elif ts is None:
+                ts = time.time() if start_ts is None else start_ts
+            else:
+                ts += self.bar_sec
+            yield ts, float(row["close"])
+
 if __name__ == "__main__":
     sim = BacktestSimulator()
     sim.run()
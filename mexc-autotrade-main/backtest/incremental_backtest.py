@@ -0,0 +1,221 @@
+import csv
+import hashlib
+import os
+import pickle
+import sys
+import time
+from loguru import logger
+from backtest.backtest_simulator import BacktestSimulator
+from backtest.result_cache import CODE_FILES, code_version
+from backtest.stream_backtest import DEFAULT_CHUNK_ROWS, StreamingBacktest, make_row_parser
+from utils.binlog import MAGIC, TICK_RECORD
+
+"""
+이어 돌리는(append-only) 백테스트:
+- 실행이 끝나면 시뮬레이터 전체(전략 EMA/포지션, 가상 계좌, 가상 시계, 스케줄러/휴식 예약, 난수 상태)를
+  데이터 파일의 처리 위치(바이트 오프셋)와 함께 스냅샷(pickle)으로 저장
+- 다음 실행은 스냅샷을 불러와 오프셋 이후에 추가된 행만 처리 => 처음부터 다시 돌린 결과와 동일
+- 스냅샷의 '처리한 구간 해시'로 기존 데이터가 바뀌지 않았는지 확인
+  (이미 처리한 행이 수정/삭제됐거나 전략 코드가 바뀌었으면 스냅샷을 버리고 처음부터 실행)
+- 파일 끝의 아직 다 쓰이지 않은 행(줄바꿈 없음)은 처리하지 않고 다음 실행으로 미룸
+
+지원 입력: stream_backtest와 동일 (CSV 봉/체결, BinaryTickLog .bin)
+스냅샷은 pickle이므로 직접 만든 파일만 불러올 것.
+
+실행 (프로젝트 루트에서, 매일 새 봉을 덧붙인 뒤):
+  python -m backtest.incremental_backtest backtest/data/btc_1m.csv [스냅샷 경로]
+"""
+
+SNAPSHOT_VERSION = 1
+
+# 스냅샷 유효성 검사용 코드 버전: 결과 캐시의 CODE_FILES + 시뮬레이터에 시세를 넣은 리더/루프
+# (파서가 고쳐지면 잘못 읽은 행으로 만든 기존 스냅샷은 버리고 처음부터 실행)
+SNAPSHOT_CODE_FILES = CODE_FILES + (
+    "backtest/stream_backtest.py",
+    "backtest/incremental_backtest.py",
+    "utils/binlog.py",
+)
+
+
+def snapshot_code_version() -> str:
+    return code_version(SNAPSHOT_CODE_FILES)
+
+
+# ----------------------------------------------------
+# 덧붙이기 전용 리더 (처리 위치 + 처리 구간 해시 유지)
+# ----------------------------------------------------
+class AppendReader:
+    """
+    path를 offset부터 완성된 레코드 단위로 읽음.
+    읽은 바이트는 모두 digest에 누적 => 끝나면 digest가 file[:offset] 전체의 sha256.
+    """
+
+    def __init__(self, path, offset=0):
+        self.path = path
+        self.offset = offset
+        self.binary = path.endswith(".bin")
+        self.digest = hashlib.sha256()
+
+    def verify(self, expected_sha256) -> bool:
+        """file[:offset]을 해시해 스냅샷 값과 비교 (처리한 구간이 그대로인지)."""
+        if os.path.getsize(self.path) < self.offset:
+            return False
+        remaining = self.offset
+        with open(self.path, "rb") as f:
+            while remaining:
+                block = f.read(min(remaining, 1024 * 1024))
+                if not block:
+                    return False
+                self.digest.update(block)
+                remaining -= len(block)
+        return self.digest.hexdigest() == expected_sha256
+
+    def chunks(self, chunk_rows=DEFAULT_CHUNK_ROWS):
+        """offset 이후의 [(ts, price), ...]를 chunk_rows건씩. 청크를 낼 때마다 offset/digest 갱신."""
+        with open(self.path, "rb") as f:
+            if self.binary:
+                yield from self._binary_chunks(f, chunk_rows)
+            else:
+                yield from self._csv_chunks(f, chunk_rows)
+
+    def _start(self, f, header):
+        """처음 읽는 파일이면 헤더(매직)까지 처리한 것으로 보고 offset을 헤더 뒤로."""
+        if self.offset == 0:
+            self.digest.update(header)
+            self.offset = len(header)
+        f.seek(self.offset)
+
+    def _binary_chunks(self, f, chunk_rows):
+        magic = f.read(len(MAGIC))
+        if magic != MAGIC:
+            raise ValueError(f"틱 바이너리 로그 파일이 아님: {self.path}")
+        self._start(f, magic)
+        while True:
+            data = f.read(TICK_RECORD.size * chunk_rows)
+            usable = len(data) - len(data) % TICK_RECORD.size
+            if not usable:
+                return
+            data = data[:usable]
+            self.digest.update(data)
+            self.offset += usable
+            yield [(record[0], record[1]) for record in TICK_RECORD.iter_unpack(data)]
+
+    def _csv_chunks(self, f, chunk_rows):
+        header = f.readline()
+        if not header.endswith(b"\n"):
+            return  # 헤더도 아직 다 쓰이지 않음
+        parse_row = make_row_parser(next(csv.reader([header.decode("utf-8")])), self.path)
+        self._start(f, header)
+        while True:
+            lines = []
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # 쓰는 중인 마지막 행
+                lines.append(line)
+                if len(lines) >= chunk_rows:
+                    break
+            if not lines:
+                return
+            data = b"".join(lines)
+            self.digest.update(data)
+            self.offset += len(data)
+            rows = [parse_row(row) for row in csv.reader(data.decode("utf-8").splitlines()) if row]
+            if rows:
+                yield rows
+            if len(lines) < chunk_rows:
+                return
+
+
+# ----------------------------------------------------
+# 스냅샷 저장 / 불러오기
+# ----------------------------------------------------
+def save_snapshot(path, simulator: BacktestSimulator, reader: AppendReader, rows: int):
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "code": snapshot_code_version(),
+        "data_path": os.path.abspath(reader.path),
+        "offset": reader.offset,
+        "sha256": reader.digest.hexdigest(),
+        "rows": rows,
+        "saved_at": time.time(),
+        "simulator": simulator,
+    }
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(path, data_path):
+    """
+    쓸 수 있는 스냅샷이면 (simulator, 검증된 AppendReader, 누적 행 수), 아니면 None.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            snapshot = pickle.load(f)
+    except Exception as e:
+        logger.warning(f"[IncrementalBacktest] 스냅샷 읽기 실패 => 처음부터 실행: {e}")
+        return None
+
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        reason = "스냅샷 형식 버전이 다름"
+    elif snapshot["code"] != snapshot_code_version():
+        reason = "전략/시뮬레이터/리더 코드가 바뀜"
+    elif snapshot["data_path"] != os.path.abspath(data_path):
+        reason = f"다른 데이터 파일의 스냅샷 ({snapshot['data_path']})"
+    else:
+        reader = AppendReader(data_path, snapshot["offset"])
+        if reader.verify(snapshot["sha256"]):
+            return snapshot["simulator"], reader, snapshot["rows"]
+        reason = "이미 처리한 구간의 데이터가 바뀜"
+    logger.warning(f"[IncrementalBacktest] 스냅샷 사용 불가({reason}) => 처음부터 실행")
+    return None
+
+
+# ----------------------------------------------------
+# 실행
+# ----------------------------------------------------
+def run_incremental(data_path, snapshot_path=None, chunk_rows=DEFAULT_CHUNK_ROWS, **sim_kwargs) -> dict:
+    """
+    스냅샷이 있으면 이어서, 없으면 처음부터 실행하고 스냅샷 갱신.
+    sim_kwargs: 처음부터 실행할 때 BacktestSimulator 인자 (symbol, user_seed, seed, params 등)
+    반환: {"resumed", "new_rows", "total_rows", "offset", "summary"}
+    """
+    snapshot_path = snapshot_path or f"{data_path}.snapshot"
+    loaded = load_snapshot(snapshot_path, data_path)
+    if loaded:
+        simulator, reader, total_rows = loaded
+        logger.info(f"[IncrementalBacktest] 스냅샷에서 이어서 실행: 누적 {total_rows:,}건, 오프셋 {reader.offset:,}B")
+    else:
+        simulator = BacktestSimulator(csv_file=data_path, **sim_kwargs)
+        reader = AppendReader(data_path)
+        total_rows = 0
+
+    stats = StreamingBacktest(simulator, chunk_rows).run(reader.chunks(chunk_rows))
+    total_rows += stats["rows"]
+    save_snapshot(snapshot_path, simulator, reader, total_rows)
+    logger.info(
+        f"[IncrementalBacktest] 새 행 {stats['rows']:,}건 처리 ({stats['wall_sec']:.2f}s), "
+        f"누적 {total_rows:,}건 => 스냅샷 저장: {snapshot_path}"
+    )
+    return {
+        "resumed": bool(loaded),
+        "new_rows": stats["rows"],
+        "total_rows": total_rows,
+        "offset": reader.offset,
+        "summary": simulator.summary() if simulator.strategy else {},
+    }
+
+
+if __name__ == "__main__":
+    logger.remove()
+    logger.add(sys.stderr, level="INFO", filter=lambda record: record["name"] == __name__)
+
+    if len(sys.argv) < 2:
+        print("사용법: python -m backtest.incremental_backtest <데이터 파일> [스냅샷 경로]")
+        sys.exit(1)
+    result = run_incremental(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else None, seed=0)
+    logger.info(f"[IncrementalBacktest] 결과: {result}")
@@ -0,0 +1,226 @@
+import csv
+import hashlib
+import itertools
+import json
+import os
+import sys
+import time
+from loguru import logger
+from backtest.backtest_simulator import BacktestSimulator, CSV_FILE, default_params
+
+"""
+백테스트 결과 캐시 (content-addressed):
+- 키 = sha256(입력 데이터 내용 해시 + 전략 코드 버전 + 파라미터/시뮬레이션 설정)
+  * 데이터: 파일 내용 해시 (같은 경로라도 행이 추가/수정되면 다른 키)
+  * 코드 버전: 결과에 영향을 주는 소스 파일(CODE_FILES) 내용 해시 => 전략 코드를 고치면 자동 무효화
+  * 파라미터: default_params() + 바꾼 값, 심볼/시드/난수 시드
+- 값 = 요약 지표 + 체결 내역(fill log), data/backtest_cache/<키>.json
+- 전체 크기가 max_bytes를 넘으면 가장 오래 안 쓴 항목부터 삭제 (LRU, 조회 시 mtime 갱신)
+- sweep(): 파라미터 격자를 돌리면서 캐시에 있는 격자점은 재계산 없이 바로 반환
+
+실행 (프로젝트 루트에서):
+  python -m backtest.result_cache [CSV 파일]   # config.py의 SHADOW_GRID_* 격자로 스윕
+"""
+
+CACHE_DIR = os.path.join("data", "backtest_cache")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# datetime 열이 없는 CSV의 가상 시각 시작점 (현재 시각을 쓰면 15:00 리셋/휴식 규칙이 실행 시각에 따라 달라짐)
+SYNTHETIC_START_TS = 0.0
+
+# 백테스트 결과를 바꿀 수 있는 소스 파일 (프로젝트 루트 기준)
+# - config.py: 전략이 읽는 EMA/임계값/MIN_TRADE_AMOUNT 기본값
+# - position_tracker.py: SimPositionTracker가 물려받는 거래량/손익 계산
+CODE_FILES = (
+    "config/config.py",
+    "core/strategy.py",
+    "core/position_tracker.py",
+    "core/risk_manager.py",
+    "core/scheduler.py",
+    "core/clock.py",
+    "backtest/sim_doubles.py",
+    "backtest/backtest_simulator.py",
+)
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# (경로, 크기, mtime_ns) => 데이터 해시 (같은 프로세스에서 스윕할 때 큰 파일을 매번 다시 읽지 않음)
+_fingerprints = {}
+
+
+# ----------------------------------------------------
+# 키 구성 요소
+# ----------------------------------------------------
+def data_fingerprint(path) -> str:
+    """입력 파일 내용의 sha256 (1MB 블록 단위로 읽음)."""
+    stat = os.stat(path)
+    memo_key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    fingerprint = _fingerprints.get(memo_key)
+    if fingerprint is None:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        fingerprint = _fingerprints[memo_key] = digest.hexdigest()
+    return fingerprint
+
+
+def code_version(files=CODE_FILES) -> str:
+    """CODE_FILES 내용의 sha256 앞 16자리."""
+    digest = hashlib.sha256()
+    for name in files:
+        digest.update(name.encode("utf-8"))
+        with open(os.path.join(_PROJECT_ROOT, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def make_key(data_hash: str, code_hash: str, settings: dict) -> str:
+    payload = json.dumps({"data": data_hash, "code": code_hash, "settings": settings},
+                         sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ----------------------------------------------------
+# 디스크 캐시 (크기 기준 LRU)
+# ----------------------------------------------------
+class ResultCache:
+    """
+    사용 예)
+        cache = ResultCache()
+        result = run_cached("backtest/data/btc_1m.csv", {"ema_long": 9}, cache)
+        result["summary"]["profit"], result["fills"][:5]
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        # 최근 사용 시각 갱신 (LRU 기준)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry: dict):
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self) -> int:
+        """전체 크기가 max_bytes 이하가 될 때까지 오래 안 쓴 항목 삭제. 삭제 개수 반환."""
+        entries = []
+        total = 0
+        with os.scandir(self.cache_dir) as it:
+            for item in it:
+                if item.name.endswith(".json") and item.is_file():
+                    stat = item.stat()
+                    entries.append((stat.st_mtime_ns, stat.st_size, item.path))
+                    total += stat.st_size
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        if removed:
+            logger.info(f"[ResultCache] LRU 정리: {removed}개 삭제 (남은 크기 {total / 1024 / 1024:.1f}MB)")
+        return removed
+
+    def size_bytes(self) -> int:
+        with os.scandir(self.cache_dir) as it:
+            return sum(item.stat().st_size for item in it if item.name.endswith(".json"))
+
+
+# ----------------------------------------------------
+# 캐시를 거치는 실행 / 파라미터 스윕
+# ----------------------------------------------------
+def run_cached(csv_file=CSV_FILE, params=None, cache=None, symbol="BTC_USDT", user_seed=1000.0, seed=0):
+    """
+    캐시에 같은 키가 있으면 저장된 결과를, 없으면 백테스트를 돌려 저장 후 반환.
+    반환: {"key", "params", "summary", "fills", "cached"}
+    seed는 휴식 시간 난수 시드 (결과가 재현 가능해야 캐시가 의미 있으므로 None 불가)
+    """
+    cache = cache or ResultCache()
+    params = {**default_params(), **(params or {})}
+    settings = {"params": params, "symbol": symbol, "user_seed": user_seed, "seed": seed}
+    key = make_key(data_fingerprint(csv_file), code_version(), settings)
+
+    entry = cache.get(key)
+    if entry is not None:
+        entry["cached"] = True
+        return entry
+
+    sim = BacktestSimulator(csv_file=csv_file, symbol=symbol, user_seed=user_seed, seed=seed,
+                            params=params, record_fills=True)
+    started = time.perf_counter()
+    with open(csv_file, "r", encoding="utf-8") as f:
+        rows = sim.run_prices(sim._iter_rows(csv.DictReader(f), start_ts=SYNTHETIC_START_TS))
+    summary = {**sim.summary(), "rows": rows, "wall_sec": time.perf_counter() - started} if rows else {"rows": 0}
+
+    fills = [list(fill) for fill in sim.order_executor.fills]
+    entry = {"key": key, "params": params, "summary": summary, "fills": fills}
+    cache.put(key, entry)
+    entry["cached"] = False
+    return entry
+
+
+def sweep(csv_file, grid: dict, cache=None, **run_kwargs) -> list:
+    """
+    grid: {"ema_short": (1, 2), "ema_long": (7, 9, 12), ...} 의 모든 조합을 실행.
+    반환: [{"params", "summary", "cached"}, ...] (격자 순서)
+    """
+    cache = cache or ResultCache()
+    names = list(grid)
+    results = []
+    started = time.perf_counter()
+    for values in itertools.product(*(grid[name] for name in names)):
+        entry = run_cached(csv_file, dict(zip(names, values)), cache, **run_kwargs)
+        results.append({"params": entry["params"], "summary": entry["summary"], "cached": entry["cached"]})
+
+    cached = sum(1 for result in results if result["cached"])
+    logger.info(
+        f"[ResultCache] 스윕 {len(results)}점 ({cached}점 캐시 적중, {len(results) - cached}점 계산) "
+        f"{time.perf_counter() - started:.2f}s"
+    )
+    return results
+
+
+if __name__ == "__main__":
+    from config.config import SHADOW_GRID_FAST_SPANS, SHADOW_GRID_MID_SPANS, SHADOW_GRID_SLOW_SPANS
+
+    logger.remove()
+    logger.add(sys.stderr, level="INFO", filter=lambda record: record["name"] == __name__)
+
+    csv_file = sys.argv[1] if len(sys.argv) > 1 else CSV_FILE
+    grid = {"ema_short": SHADOW_GRID_FAST_SPANS, "ema_mid": SHADOW_GRID_MID_SPANS, "ema_long": SHADOW_GRID_SLOW_SPANS}
+    results = sweep(csv_file, grid)
+    for result in sorted(results, key=lambda r: -r["summary"].get("profit", 0.0))[:10]:
+        params, summary = result["params"], result["summary"]
+        logger.info(
+            f"[ResultCache] EMA {params['ema_short']}/{params['ema_mid']}/{params['ema_long']}: "
+            f"손익 {summary.get('profit', 0.0):.4f}, 주문 {summary.get('orders', 0)}회"
+        )
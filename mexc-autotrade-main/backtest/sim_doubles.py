@@ -0,0 +1,100 @@
+from loguru import logger
+from core.position_tracker import PositionTracker
+
+"""
+백테스트/시뮬레이션용 메모리 내 대역(double):
+- SimPositionTracker: DOM 파싱 대신 메모리의 포지션/잔고로 응답
+- SimOrderExecutor: 클릭 대신 현재가로 즉시 체결
+실전 RiskManager/TradingStrategy를 그대로 연결해 휴식 규칙까지 재생할 수 있음.
+"""
+
+
+class SimPositionTracker(PositionTracker):
+    def __init__(self, symbol="BTC_USDT", balance=1000.0):
+        super().__init__(symbol=symbol, driver=None)
+        self.balance = balance
+        self.price = 0.0
+        self.ts = 0.0
+        # side -> [수량, 평균 진입가]
+        self.positions = {"LONG": [0.0, 0.0], "SHORT": [0.0, 0.0]}
+
+    def set_price(self, price: float, ts: float = 0.0):
+        self.price = price
+        self.ts = ts
+
+    # ------------------------------------------------------------
+    # 체결 반영 (SimOrderExecutor에서 호출)
+    # ------------------------------------------------------------
+    def fill_open(self, side: str, qty: float, price: float, fee_rate: float):
+        size, entry = self.positions[side]
+        new_size = size + qty
+        self.positions[side] = [new_size, (size * entry + qty * price) / new_size]
+        self.balance -= price * qty * fee_rate
+
+    def fill_close(self, side: str, qty: float, price: float, fee_rate: float) -> float:
+        """보유 수량까지만 청산하고 실제 청산 수량 반환."""
+        size, entry = self.positions[side]
+        qty = min(qty, size)
+        pnl = (price - entry) * qty if side == "LONG" else (entry - price) * qty
+        remaining = size - qty
+        self.positions[side] = [remaining, entry if remaining > 1e-12 else 0.0]
+        self.balance += pnl - price * qty * fee_rate
+        return qty
+
+    # ------------------------------------------------------------
+    # PositionTracker 조회 메서드 (DOM 대신 메모리)
+    # ------------------------------------------------------------
+    def get_open_positions(self):
+        return [
+            {"symbol": self.symbol, "positionSide": side, "size": size}
+            for side, (size, _) in self.positions.items()
+            if size > 1e-12
+        ]
+
+    def wait_positions_stable(self, timeout=1.0):
+        # 즉시 체결이므로 기다릴 것이 없음
+        pass
+
+    def get_unrealized_pnl(self) -> float:
+        long_size, long_entry = self.positions["LONG"]
+        short_size, short_entry = self.positions["SHORT"]
+        return (self.price - long_entry) * long_size + (short_entry - self.price) * short_size
+
+    def get_total_balance(self) -> float:
+        return self.balance + self.get_unrealized_pnl()
+
+
+class SimOrderExecutor:
+    """
+    OrderExecutor와 같은 인터페이스. 현재가(tracker.price)에 수수료를 떼고 즉시 체결.
+    record_fills=True면 체결마다 (ts, "open"/"close", side, 수량, 가격)을 fills에 기록.
+    """
+
+    def __init__(self, tracker: SimPositionTracker, fee_rate=0.0002, record_fills=False):
+        self.tracker = tracker
+        self.fee_rate = fee_rate
+        self.orders = 0
+        self.fills = [] if record_fills else None
+
+    def place_market_order(self, side: str, quantity: float) -> bool:
+        price = self.tracker.price
+        if quantity <= 0 or price <= 0:
+            return False
+        self.tracker.fill_open(side.upper(), quantity, price, self.fee_rate)
+        self.orders += 1
+        if self.fills is not None:
+            self.fills.append((self.tracker.ts, "open", side.upper(), quantity, price))
+        return True
+
+    def close_position(self, side: str, quantity: float) -> bool:
+        price = self.tracker.price
+        if quantity <= 0 or price <= 0:
+            return False
+        filled = self.tracker.fill_close(side.upper(), quantity, price, self.fee_rate)
+        if filled <= 0:
+            logger.debug(f"[SimOrderExecutor] 청산할 {side} 포지션 없음")
+            return False
+        self.orders += 1
+        if self.fills is not None:
+            self.fills.append((self.tracker.ts, "close", side.upper(), filled, price))
+        return True
@@ -0,0 +1,199 @@
+import csv
+import os
+import sys
+import time
+from datetime import datetime
+from itertools import islice
+from loguru import logger
+from backtest.backtest_simulator import BacktestSimulator
+from utils.binlog import read_ticks
+
+try:
+    import resource  # 최대 RSS 보고용 (Windows에는 없음)
+except ImportError:
+    resource = None
+
+"""
+메모리보다 큰 시세 데이터(수년치 틱/체결, 여러 심볼)를 고정 크기 청크로 나눠 흘려보내는 백테스트:
+- 입력 파일을 chunk_rows건씩 읽어 (ts, price) 리스트로 넘기는 제너레이터 파이프라인
+  => 한 번에 메모리에 올라가는 시세는 청크 1개뿐 (데이터 크기와 무관하게 메모리 일정)
+- 시뮬레이터(전략 EMA, 가상 계좌/포지션, 가상 시계, 스케줄러)는 청크 사이에 그대로 이어짐
+  => 같은 데이터를 BacktestSimulator.run_prices()로 한 번에 돌린 결과와 동일
+- 청크마다 진행률/처리량(건/s)/주문/손익/최대 RSS 로그
+
+지원 입력:
+- CSV 봉 데이터: datetime(ISO), close  (BacktestSimulator와 같은 형식)
+- CSV 체결(deals) 데이터: t 또는 ts(epoch ms/초), p 또는 price  (MEXC deals 필드 그대로, T는 매수/매도 방향)
+- 바이너리 틱 로그(.bin): utils.binlog.BinaryTickLog로 기록한 파일
+
+실행 (프로젝트 루트에서):
+  python -m backtest.stream_backtest BTC_USDT=backtest/data/btc_deals.csv ETH_USDT=data/ticks.bin
+"""
+
+DEFAULT_CHUNK_ROWS = 100_000
+
+TIME_COLUMNS = ("datetime", "t", "ts", "timestamp")
+PRICE_COLUMNS = ("close", "p", "price")
+
+
+# ----------------------------------------------------
+# 청크 리더 (제너레이터)
+# ----------------------------------------------------
+def _parse_ts(column):
+    """시각 열 이름 => 값 변환 함수 (epoch ms는 초로 환산)."""
+    if column == "datetime":
+        return lambda raw: datetime.fromisoformat(raw).timestamp()
+
+    def parse_epoch(raw):
+        value = float(raw)
+        return value / 1000.0 if value > 1e11 else value
+    return parse_epoch
+
+
+def _pick_column(fieldnames, candidates, path):
+    for name in candidates:
+        if name in fieldnames:
+            return fieldnames.index(name)
+    raise ValueError(f"{path}: {candidates} 중 하나의 열이 필요함 (헤더: {fieldnames})")
+
+
+def make_row_parser(fieldnames, path=""):
+    """CSV 헤더 => row(list) -> (ts, price) 변환 함수."""
+    ts_idx = _pick_column(fieldnames, TIME_COLUMNS, path)
+    price_idx = _pick_column(fieldnames, PRICE_COLUMNS, path)
+    parse_ts = _parse_ts(fieldnames[ts_idx])
+    return lambda row: (parse_ts(row[ts_idx]), float(row[price_idx]))
+
+
+def iter_csv_chunks(path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """CSV를 chunk_rows건씩 [(ts, price), ...]로 읽음."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        parse_row = make_row_parser(next(reader, None) or [], path)
+        while True:
+            rows = list(islice(reader, chunk_rows))
+            if not rows:
+                return
+            yield [parse_row(row) for row in rows]
+
+
+def iter_binlog_chunks(path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """BinaryTickLog 파일을 chunk_rows건씩 [(ts, price), ...]로 읽음."""
+    records = read_ticks(path)
+    while True:
+        chunk = [(record[0], record[1]) for record in islice(records, chunk_rows)]
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_chunks(path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """확장자로 리더 선택 (.bin => 바이너리 틱 로그, 그 외 => CSV)."""
+    if path.endswith(".bin"):
+        return iter_binlog_chunks(path, chunk_rows)
+    return iter_csv_chunks(path, chunk_rows)
+
+
+def _max_rss_mb():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+# ----------------------------------------------------
+# 스트리밍 실행
+# ----------------------------------------------------
+class StreamingBacktest:
+    """
+    BacktestSimulator 1개에 청크 단위로 시세를 흘려보냄.
+
+    사용 예)
+        sim = BacktestSimulator(symbol="BTC_USDT", user_seed=1000.0, seed=7)
+        stats = StreamingBacktest(sim).run_file("backtest/data/btc_deals.csv")
+    """
+
+    def __init__(self, simulator: BacktestSimulator, chunk_rows=DEFAULT_CHUNK_ROWS):
+        self.simulator = simulator
+        self.chunk_rows = chunk_rows
+        self.rows = 0
+        self.chunks = 0
+        self.first_ts = None
+        self.last_ts = None
+
+    def run_file(self, path) -> dict:
+        if not os.path.exists(path):
+            logger.error(f"[StreamingBacktest] 파일이 없습니다: {path}")
+            return self.stats(0.0)
+        logger.info(f"[StreamingBacktest] {self.simulator.symbol} <= {path} (청크 {self.chunk_rows}건)")
+        return self.run(iter_chunks(path, self.chunk_rows), total_bytes=os.path.getsize(path))
+
+    def run(self, chunks, total_bytes=None) -> dict:
+        """chunks: [(ts, price), ...] 리스트를 차례로 내는 iterable. 끝나면 요약 통계 반환."""
+        on_price = self.simulator.on_price
+        started = time.perf_counter()
+        for chunk in chunks:
+            chunk_started = time.perf_counter()
+            for ts, price in chunk:
+                on_price(ts, price)
+            if self.first_ts is None:
+                self.first_ts = chunk[0][0]
+            self.last_ts = chunk[-1][0]
+            self.rows += len(chunk)
+            self.chunks += 1
+            self._log_chunk(len(chunk), time.perf_counter() - chunk_started, time.perf_counter() - started)
+
+        stats = self.stats(time.perf_counter() - started)
+        if self.rows:
+            self.simulator._log_summary(self.rows, self.last_ts - self.first_ts, stats["wall_sec"])
+        return stats
+
+    def _log_chunk(self, rows, chunk_sec, wall_sec):
+        sim = self.simulator
+        rss = _max_rss_mb()
+        logger.info(
+            f"[StreamingBacktest] {sim.symbol} 청크 {self.chunks}: {rows}건 {rows / max(chunk_sec, 1e-9):,.0f}건/s | "
+            f"누적 {self.rows:,}건 ({datetime.fromtimestamp(self.last_ts):%Y-%m-%d %H:%M}까지, "
+            f"평균 {self.rows / max(wall_sec, 1e-9):,.0f}건/s) | "
+            f"주문 {sim.order_executor.orders}회, 손익 {sim.position_tracker.get_current_profit():.4f} USDT"
+            + (f" | 최대 RSS {rss:.0f}MB" if rss is not None else "")
+        )
+
+    def stats(self, wall_sec) -> dict:
+        sim = self.simulator
+        tracker = sim.position_tracker
+        return {
+            "symbol": sim.symbol,
+            "rows": self.rows,
+            "chunks": self.chunks,
+            "wall_sec": wall_sec,
+            "rows_per_sec": self.rows / wall_sec if wall_sec > 0 else 0.0,
+            "orders": sim.order_executor.orders,
+            "volume": tracker.get_accumulated_volume(),
+            "profit": tracker.get_current_profit(),
+            "max_rss_mb": _max_rss_mb(),
+        }
+
+
+def run_sources(sources: dict, chunk_rows=DEFAULT_CHUNK_ROWS, user_seed=1000.0, seed=None) -> dict:
+    """
+    심볼별 파일을 차례로 스트리밍 (심볼마다 독립된 시뮬레이터/가상 계좌).
+    sources: {"BTC_USDT": "backtest/data/btc_deals.csv", ...}
+    """
+    results = {}
+    for symbol, path in sources.items():
+        sim = BacktestSimulator(csv_file=path, symbol=symbol, user_seed=user_seed, seed=seed)
+        results[symbol] = StreamingBacktest(sim, chunk_rows).run_file(path)
+    return results
+
+
+if __name__ == "__main__":
+    # 매 주문 INFO 로그 대신 청크 진행 로그만 출력
+    logger.remove()
+    logger.add(sys.stderr, level="INFO", filter=lambda record: record["name"] == __name__)
+
+    args = sys.argv[1:] or [f"BTC_USDT={os.path.join('backtest', 'data', 'btc_1m.csv')}"]
+    sources = dict(arg.split("=", 1) if "=" in arg else ("BTC_USDT", arg) for arg in args)
+    for symbol, result in run_sources(sources).items():
+        logger.info(f"[StreamingBacktest] {symbol} 결과: {result}")
@@ -0,0 +1,87 @@
+# ----------------------------------------------------
+# bench_import_time.py
+#  - 모듈별 import 비용을 python -X importtime 으로 측정 (새 인터프리터에서 각각 import)
+#    * 누적 ms   : 해당 모듈 import에 걸린 전체 시간 (하위 import 포함, 반복 중 최소값)
+#    * 모듈 수   : 그 import로 새로 로드된 모듈 수
+#    * 브라우저  : selenium / undetected_chromedriver 가 딸려 들어왔는지
+#    * 무거운 패키지 : 최상위 패키지별 self 시간 합계 상위 3개
+#  - 목표: 전략/지표/정산(포지션 추적)/백테스트 모듈은 브라우저 스택 없이 import
+#          (Selenium은 main() 안에서 브라우저를 띄울 때, RiskManager/PositionTracker의 DOM 메서드에서만 로드)
+#
+# 실행 (프로젝트 루트에서):
+#   python -m benchmarks.bench_import_time
+#   python -m benchmarks.bench_import_time web_selenium.browser_stealth   # 특정 모듈만
+# ----------------------------------------------------
+
+import os
+import subprocess
+import sys
+
+TARGETS = (
+    "core.indicators",
+    "core.strategy",
+    "core.position_tracker",
+    "core.risk_manager",
+    "backtest.backtest_simulator",
+    "print_ema",
+    "main",
+    "web_selenium.browser_stealth",
+)
+BROWSER_PACKAGES = ("selenium", "undetected_chromedriver")
+
+
+def _importtime(module):
+    """[(self us, 누적 us, 모듈명), ...] (-X importtime 출력 순서 그대로)"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=root, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+def measure(module, repeat=3):
+    """반복 중 누적 시간이 가장 짧은 실행 기준으로 요약."""
+    best = None
+    for _ in range(repeat):
+        rows = _importtime(module)
+        if best is None or rows[-1][1] < best[-1][1]:
+            best = rows
+
+    by_package = {}
+    for self_us, _, name in best:
+        package = name.split(".", 1)[0]
+        by_package[package] = by_package.get(package, 0) + self_us
+    heavy = sorted(by_package.items(), key=lambda item: -item[1])[:3]
+    loaded = {name.split(".", 1)[0] for _, _, name in best}
+    return {
+        "cumulative_ms": best[-1][1] / 1000,
+        "modules": len(best),
+        "browser": [p for p in BROWSER_PACKAGES if p in loaded],
+        "heavy": heavy,
+    }
+
+
+def run(targets=TARGETS, repeat=3):
+    print(f"{'모듈':<30} {'누적 ms':>8} {'모듈 수':>7}  {'브라우저':<10} 무거운 패키지(self ms)")
+    for module in targets:
+        try:
+            result = measure(module, repeat)
+        except RuntimeError as e:
+            print(f"{module:<30} import 실패: {e}")
+            continue
+        heavy = ", ".join(f"{name} {us / 1000:.1f}" for name, us in result["heavy"])
+        browser = ",".join(result["browser"]) or "-"
+        print(f"{module:<30} {result['cumulative_ms']:>8.1f} {result['modules']:>7}  {browser:<10} {heavy}")
+
+
+if __name__ == "__main__":
+    run(tuple(sys.argv[1:]) or TARGETS)
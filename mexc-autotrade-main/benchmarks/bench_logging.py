@@ -0,0 +1,81 @@
+# ----------------------------------------------------
+# bench_logging.py
+#  - 틱마다 찍는 시세/EMA 로그가 틱 처리 스레드에서 차지하는 시간 측정
+#    (틱 사이 간격을 두고 로그 호출 구간만 합산 => 실제 폴링처럼 큐가 밀리지 않는 상태)
+#    1) sync_fstring : 동기 파일 sink + 매 틱 f-string (이전 방식)
+#    2) enqueue      : enqueue 파일 sink + 매 틱 지연 포맷
+#    3) throttled    : 동기 파일 sink + 5초에 1줄 (log_throttled, TICK_LOG_MODE="text" 기본값)
+#    4) binary       : BinaryTickLog (TICK_LOG_MODE="binary")
+#  - 목표: 틱 경로 로그 비용을 sync_fstring 대비 한 자릿수 이하로
+#
+# 실행 (프로젝트 루트에서):
+#   python -m benchmarks.bench_logging
+# ----------------------------------------------------
+
+import os
+import tempfile
+import time
+
+from loguru import logger
+
+from utils.binlog import BinaryTickLog
+from utils.logger import log_throttled
+
+TEMPLATE = "[시세] lastPrice={:.4f}, EMA1={:.4f}, EMA2={:.4f}, EMA3={:.4f}"
+
+
+def _ticks(n):
+    return [(3000.0 + i * 0.01, 3000.0 + i * 0.009, 3000.0 + i * 0.008, 3000.0 + i * 0.007) for i in range(n)]
+
+
+def _measure(emit, ticks, pace_sec):
+    """emit 호출 구간만 합산 => (평균 us, 최대 us)"""
+    total = worst = 0.0
+    for tick in ticks:
+        started = time.perf_counter()
+        emit(*tick)
+        elapsed = time.perf_counter() - started
+        total += elapsed
+        worst = max(worst, elapsed)
+        time.sleep(pace_sec)
+    return total / len(ticks) * 1e6, worst * 1e6
+
+
+def sync_fstring(price, e1, e2, e3):
+    logger.info(f"[시세] lastPrice={price:.4f}, EMA1={e1:.4f}, EMA2={e2:.4f}, EMA3={e3:.4f}")
+
+
+def lazy(price, e1, e2, e3):
+    logger.info(TEMPLATE, price, e1, e2, e3)
+
+
+def throttled(price, e1, e2, e3):
+    log_throttled("INFO", 5.0, TEMPLATE, price, e1, e2, e3)
+
+
+def run(n=3000, pace_sec=0.0003):
+    ticks = _ticks(n)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, emit, enqueue in (("sync_fstring", sync_fstring, False),
+                                    ("enqueue", lazy, True),
+                                    ("throttled", throttled, False)):
+            logger.remove()
+            logger.add(os.path.join(tmp, f"{name}.log"), level="INFO", enqueue=enqueue)
+            results[name] = _measure(emit, ticks, pace_sec)
+            logger.complete()
+
+        logger.remove()
+        tick_log = BinaryTickLog(os.path.join(tmp, "ticks.bin"))
+        now = time.time()
+        results["binary"] = _measure(lambda *tick: tick_log.write(now, *tick), ticks, pace_sec)
+        tick_log.close()
+
+    base = results["sync_fstring"][0]
+    print(f"{'방식':<14} {'평균 us':>9} {'최대 us':>9} {'절감':>8}")
+    for name, (avg, worst) in results.items():
+        print(f"{name:<14} {avg:>9.2f} {worst:>9.1f} {(1 - avg / base) * 100:>7.1f}%")
+
+
+if __name__ == "__main__":
+    run()
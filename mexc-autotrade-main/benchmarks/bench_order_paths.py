@@ -0,0 +1,60 @@
+# ----------------------------------------------------
+# bench_order_paths.py
+#  - OrderExecutor 주문 경로별 소요 시간 비교
+#    "clicks": 탭 클릭 / clear / send_keys / 버튼 클릭 / 모달 대기 (WebDriver 왕복 여러 번)
+#    "script": ORDER_SCRIPT 1회 (execute_async_script)
+#  - fixtures/order_form.html (주문 폼 XPath 구조만 흉내 낸 정적 페이지) 사용
+#  - Chrome 필요 (headless)
+#
+# 실행 (프로젝트 루트에서):
+#   python -m benchmarks.bench_order_paths
+# ----------------------------------------------------
+
+import os
+import sys
+
+from loguru import logger
+from selenium import webdriver
+
+from core.order_executor import OrderExecutor
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "order_form.html")
+
+
+def run(orders=50):
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=options)
+    try:
+        driver.get("file://" + FIXTURE)
+        executor = OrderExecutor(driver, symbol="ETH_USDT")
+        executor.compare_every = 0  # 모드별로 한 경로만 측정
+
+        for mode in ("clicks", "script"):
+            executor.submit_mode = mode
+            for i in range(orders):
+                side = "LONG" if i % 2 == 0 else "SHORT"
+                executor.place_market_order(side, 0.05)
+                executor.close_position(side, 0.05)
+
+        filled = driver.execute_script("return window.orders.length")
+        print(f"체결 {filled} / 요청 {orders * 4}")
+
+        means = {}
+        for path, samples in executor.latency.items():
+            ordered = sorted(samples)
+            means[path] = sum(ordered) / len(ordered)
+            print(f"{path:<7} {len(ordered)}회  평균 {means[path] * 1000:.1f}ms  "
+                  f"p50 {ordered[len(ordered) // 2] * 1000:.1f}ms  최대 {ordered[-1] * 1000:.1f}ms")
+        print(f"절감: 주문당 {(means['clicks'] - means['script']) * 1000:.1f}ms "
+              f"({(1 - means['script'] / means['clicks']) * 100:.0f}%)")
+        return means
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,45 @@
+# ----------------------------------------------------
+# bench_shadow_grid.py
+#  - ShadowGrid.on_tick() 1회당 소요 시간 측정
+#  - 목표: 격자 크기와 무관하게 틱당 1ms 미만
+#
+# 실행 (프로젝트 루트에서):
+#   python -m benchmarks.bench_shadow_grid
+# ----------------------------------------------------
+
+import math
+import random
+import time
+
+from core.shadow_grid import ShadowGrid
+
+
+def run(ticks=20_000):
+    grid = ShadowGrid(
+        fast_spans=(1, 2, 3),
+        mid_spans=(3, 4, 5, 6),
+        slow_spans=(7, 9, 12, 20, 30),
+        thresholds=(0.0002, 0.0003, 0.0005, 0.001),
+        leaderboard_sec=0,
+    )
+
+    price = 3000.0
+    prices = []
+    for i in range(ticks):
+        price *= 1 + random.gauss(0, 0.0004) + 0.0002 * math.sin(i / 300)
+        prices.append(price)
+
+    started = time.perf_counter()
+    for p in prices:
+        grid.on_tick(p)
+    elapsed = time.perf_counter() - started
+
+    per_tick_us = elapsed / ticks * 1e6
+    print(f"격자 {len(grid.params)}개, 틱 {ticks}개 => 틱당 {per_tick_us:.1f}µs")
+    for row in grid.leaderboard(top_n=5):
+        print(row)
+    return per_tick_us
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,97 @@
+# ----------------------------------------------------
+# bench_tick_alloc.py
+#  - 틱 1회 경로(피드 이벤트 => StrategyHost => TradingStrategy.on_new_price => 시세 로그)의
+#    메모리 할당을 tracemalloc으로 측정
+#  - legacy: 틱마다 data_dict/list 생성 + INFO f-string 포맷 (이전 방식)
+#  - pooled: EventPool의 TickEvent 재사용 + loguru 지연 포맷 (현재 방식)
+#  - 목표: pooled의 정상 상태 순증가(net) ≈ 0 B/틱, 틱 내 일시 할당(peak)도 legacy보다 작게
+#
+# 실행 (프로젝트 루트에서):
+#   python -m benchmarks.bench_tick_alloc
+# ----------------------------------------------------
+
+import math
+import sys
+import tracemalloc
+
+from loguru import logger
+
+from core.events import EventPool, TickEvent
+from core.strategy import TradingStrategy
+from core.strategy_host import StrategyHost, EmaScalpPlugin
+
+
+def _prices(n, start=3000.0):
+    # 교차가 자주 나지 않는 완만한 가격 (주문 없는 정상 상태 측정)
+    return [start * (1 + 0.002 * math.sin(i / 50)) for i in range(n)]
+
+
+def _make_host():
+    strategy = TradingStrategy(symbol="ETH_USDT")
+    host = StrategyHost()
+    host.add(EmaScalpPlugin(strategy))
+    return host, strategy
+
+
+def legacy_tick(host, strategy, pool, price):
+    data_dict = {"lastPrice": price, "deals": [], "kline": [], "bars": []}
+    host.on_data(data_dict)
+    logger.info(
+        f"[시세] lastPrice={float(price):.4f}, "
+        f"EMA1={strategy.ema1:.4f}, EMA2={strategy.ema2:.4f}, EMA3={strategy.ema3:.4f}"
+    )
+
+
+def pooled_tick(host, strategy, pool, price):
+    data_dict = pool.acquire()
+    data_dict["lastPrice"] = price
+    try:
+        host.on_data(data_dict)
+        logger.info(
+            "[시세] lastPrice={:.4f}, EMA1={:.4f}, EMA2={:.4f}, EMA3={:.4f}",
+            float(price), strategy.ema1, strategy.ema2, strategy.ema3
+        )
+    finally:
+        pool.release(data_dict)
+
+
+def measure(tick, warmup=2000, ticks=20000, peak_samples=2000):
+    host, strategy = _make_host()
+    pool = EventPool(TickEvent)
+    prices = _prices(warmup + ticks + peak_samples)
+
+    for price in prices[:warmup]:
+        tick(host, strategy, pool, price)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for price in prices[warmup:warmup + ticks]:
+        tick(host, strategy, pool, price)
+    after = tracemalloc.take_snapshot()
+    net = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+    # 틱 1회 안에서 잡았다 놓는 메모리 (peak - current)
+    transient = 0
+    for price in prices[warmup + ticks:]:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        tick(host, strategy, pool, price)
+        _, peak = tracemalloc.get_traced_memory()
+        transient += peak - base
+    tracemalloc.stop()
+    return net / ticks, transient / peak_samples, pool.created
+
+
+def run():
+    # 측정 중 시세 로그는 출력하지 않음 (INFO 비활성 => 지연 포맷 효과 포함)
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    print(f"{'경로':<8} {'순증가 B/틱':>12} {'일시 할당 B/틱':>14} {'이벤트 생성 수':>14}")
+    for name, tick in (("legacy", legacy_tick), ("pooled", pooled_tick)):
+        net, transient, created = measure(tick)
+        print(f"{name:<8} {net:>12.2f} {transient:>14.1f} {created:>14}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,52 @@
+# ----------------------------------------------------
+# bench_virtual_day.py
+#  - VirtualClock으로 하루치(0.5초 틱) 매매를 실전 RiskManager 규칙과 함께 재생
+#  - 목표: 가상 24시간을 수 초 안에 재생
+#
+# 실행 (프로젝트 루트에서):
+#   python -m benchmarks.bench_virtual_day
+# ----------------------------------------------------
+
+import math
+import random
+import sys
+import time
+from datetime import datetime
+
+from loguru import logger
+
+from backtest.backtest_simulator import BacktestSimulator
+
+
+def run(hours=24, tick_sec=0.5, seed=7):
+    # 매 주문마다 찍히는 INFO 로그는 측정에서 제외
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    rng = random.Random(seed)
+    start = datetime(2025, 3, 3, 0, 0).timestamp()
+    ticks = int(hours * 3600 / tick_sec)
+
+    def prices():
+        price = 3000.0
+        for i in range(ticks):
+            price *= 1 + rng.gauss(0, 0.0003) + 0.0001 * math.sin(i / 600)
+            yield start + i * tick_sec, price
+
+    sim = BacktestSimulator(symbol="ETH_USDT", user_seed=1000.0, seed=seed)
+    started = time.perf_counter()
+    sim.run_prices(prices())
+    elapsed = time.perf_counter() - started
+
+    tracker = sim.position_tracker
+    pause_job = sim.risk_manager._pause_job
+    print(f"가상 {hours}시간 ({ticks}틱) => {elapsed:.2f}s")
+    print(f"주문 {sim.order_executor.orders}회, 휴식 {pause_job.runs if pause_job else 0}회, "
+          f"누적 거래량 {tracker.get_accumulated_volume():.2f}, 손익 {tracker.get_current_profit():.4f}")
+    for row in sim.scheduler.report():
+        print(row)
+    return elapsed
+
+
+if __name__ == "__main__":
+    run()
@@ -15,16 +15,58 @@ EMA_SHORT = 1
 EMA_MID = 3
 EMA_LONG = 7
 
+# 다중 주기 EMA 엔진에서 유지할 주기 (빈 튜플이면 사용 안 함)
+MTF_TIMEFRAMES = ("1m", "5m", "15m")
+
+# 파라미터 격자 그림자 평가 (주문 없이 가상 손익만 추적, numpy 필요)
+SHADOW_GRID_ENABLED = False
+SHADOW_GRID_FAST_SPANS = (1, 2)
+SHADOW_GRID_MID_SPANS = (3, 4, 5)
+SHADOW_GRID_SLOW_SPANS = (7, 9, 12, 20)
+SHADOW_GRID_THRESHOLDS = (0.0003, 0.0005, 0.001)
+SHADOW_GRID_LEADERBOARD_SEC = 300
+
+# 후보 전략(strategyupdate.py) 신호 전용 그림자 실행 + 실전 결정과의 불일치 기록
+SHADOW_STRATEGIES_ENABLED = False
+SHADOW_REPORT_FILE = "shadow_divergence.csv"
+
+# 배포 모드: "single" (한 프로세스) / "multiprocess" (피드·전략·실행기 프로세스 분리, 공유메모리 링 버퍼)
+PIPELINE_MODE = "single"
+
+# 런타임 (single 모드): "thread" (폴링 스레드 + 5초 루프) / "asyncio" (피드·주기 작업·API 주문을 이벤트 루프 하나에서, aiohttp 필요)
+RUNTIME_MODE = "thread"
+# 주문 경로: "selenium" (버튼 클릭) / "api" (private API 주문, asyncio 런타임 + secrets.py의 API 키 필요)
+ORDER_ROUTE = "selenium"
+# 포지션/잔고 조회: "dom" (웹 화면 파싱) / "api" (private API, secrets.py의 API 키 필요, 실패 시 DOM으로 대체)
+POSITION_SOURCE = "dom"
+# (POSITION_SOURCE="api"일 때) private WebSocket으로 주문/체결/포지션/자산 변경을 푸시로 받아 메모리에 유지
+PRIVATE_WS_ENABLED = False
+
 # 변동성 기준: ±0.05% => 0.0005
 PRICE_THRESHOLD = 0.0005
 
 # 심볼별 최소 거래 단위 설정 (floor 처리용) 
+# - 실전에서는 ContractSpecCache(공개 contract/detail API)가 전 심볼 사양을 제공하고,
+#   이 표는 API/디스크 캐시 모두 실패했을 때의 대체값으로만 사용
 MIN_TRADE_AMOUNT = {
     "BTC_USDT": 0.0001,
     "ETH_USDT": 0.01,
     "SOL_USDT": 0.1,
     "XRP_USDT": 1
 }
+# 계약 사양 디스크 캐시 유효 시간(초)
+CONTRACT_SPEC_TTL_SEC = 86400
+
+# ----------------------------
+# [시세 피드 설정]
+# ----------------------------
+# 체결(deals)로 로컬 봉을 만들 주기 ("1s", "1m", "5m" 등). None이면 매 폴링마다 kline 호출
+LOCAL_BAR_INTERVAL = "1m"
+# 로컬 봉 <-> REST kline 대조 주기(초)
+KLINE_VERIFY_SEC = 60
+# K라인 캐시 저장 폴더 / 시작 시 채울 과거 캔들 수
+KLINE_CACHE_DIR = "data"
+KLINE_BACKFILL_BARS = 1440
 
 # ----------------------------
 # [Selenium 브라우저 설정]
@@ -32,6 +74,13 @@ MIN_TRADE_AMOUNT = {
 SELENIUM_HEADLESS = False
 ORDER_CLICK_DELAY = 0.1
 MAX_ORDER_RETRY = 3
+# 주문 경로: "script" (탭/수량/버튼/확인 모달을 execute_async_script 1회로, 실패 시 클릭 경로로 재시도) / "clicks" (요소별 클릭)
+ORDER_SUBMIT_MODE = "script"
+# "script" 모드에서 N번째 주문마다 클릭 경로로 보내 두 경로의 실측 지연을 비교 (0이면 비교 안 함)
+ORDER_LATENCY_COMPARE_EVERY = 50
+# WebDriver 호출 계측 (호출 함수별 횟수/소요 시간, 1분마다 상위 N개 로그)
+DRIVER_PROFILER_ENABLED = False
+DRIVER_PROFILER_TOP_N = 10
 
 # ----------------------------
 # [안티봇 (무작위 딜레이 등)]
@@ -44,6 +93,37 @@ MAX_LONG_REST_SEC = 60
 
 UID_AUTH_REQUIRED = True
 
+# ----------------------------
+# [메트릭 엔드포인트]
+# ----------------------------
+# True면 http://METRICS_HOST:METRICS_PORT/metrics 에 Prometheus 텍스트 형식으로 실시간 지표 노출 (pull 전용)
+METRICS_ENABLED = False
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = 9108
+
+# 샘플링 프로파일러: SIGUSR1(Windows: Ctrl+Break) 또는 GET /profile?seconds=N (메트릭 엔드포인트 사용 시)으로
+# 실행 중에 켜서 전 스레드 스택을 SAMPLING_PROFILER_SEC초 동안 수집 => profiles/stacks_*.txt (flamegraph용)
+# (켜면 프로세스 전체에 SIGUSR1 핸들러를 설치하므로 기본은 끔, 샘플링 중이 아닐 때 오버헤드 없음)
+SAMPLING_PROFILER_ENABLED = False
+SAMPLING_PROFILER_HZ = 200
+SAMPLING_PROFILER_SEC = 30
+SAMPLING_PROFILER_DIR = "profiles"
+
+# ----------------------------
+# [로그 설정]
+# ----------------------------
+LOG_LEVEL = "INFO"
+# 파일 로그 경로 (None이면 콘솔만)
+LOG_FILE = None
+# True면 콘솔/파일 쓰기를 백그라운드 스레드가 처리 (느린 콘솔/네트워크 드라이브에서 쓰기 대기 제거)
+#  - 레코드마다 pickle 비용이 있어 빠른 로컬 디스크에서는 오히려 느림 (benchmarks/bench_logging.py)
+LOG_ENQUEUE = False
+# 틱마다 찍는 시세/EMA 로그: "text" (텍스트, TICK_LOG_INTERVAL_SEC마다 1줄) / "binary" (TICK_BINLOG_FILE에 전부) / "off"
+TICK_LOG_MODE = "text"
+# text 모드 출력 간격(초), 0이면 매 틱
+TICK_LOG_INTERVAL_SEC = 5.0
+TICK_BINLOG_FILE = "data/ticks.bin"
+
 # ----------------------------
 # [PyInstaller / 난독화]
 # ----------------------------
@@ -2,6 +2,10 @@
 민감 정보 파일.
 """
 
+# MEXC API 키 (ORDER_ROUTE = "api" 일 때만 사용)
+MEXC_API_KEY = ""
+MEXC_API_SECRET = ""
+
 UIDS_PER_SYMBOL = {
     "BTC_USDT": [
     ],
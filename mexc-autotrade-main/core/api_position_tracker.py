@@ -0,0 +1,236 @@
+# core/api_position_tracker.py
+
+import time
+from typing import NamedTuple, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from loguru import logger
+from core.position_tracker import PositionTracker
+from utils.signer import sign_request
+
+BASE_URL = "https://futures.mexc.com"
+POSITIONS_URL = f"{BASE_URL}/api/v1/private/position/open_positions"
+ASSET_URL = f"{BASE_URL}/api/v1/private/account/asset/USDT"
+REQUEST_TIMEOUT = 5
+# wait_positions_stable() 재조회 간격(초)
+POSITIONS_POLL_SEC = 0.1
+
+# open_positions 응답의 positionType
+POSITION_TYPES = {1: "LONG", 2: "SHORT"}
+
+
+class ApiPosition(NamedTuple):
+    symbol: str
+    side: str             # "LONG" / "SHORT"
+    size: float           # 코인 수량 (= 계약 수 * contract_size)
+    contracts: float      # 계약 수 (holdVol)
+    entry_price: float    # 평균 진입가
+    liquidate_price: float
+    leverage: int
+
+
+class ApiAsset(NamedTuple):
+    currency: str
+    equity: float         # 총 자산 (미실현 손익 포함)
+    available: float      # 사용 가능 잔고
+    position_margin: float
+    unrealized: float     # 미실현 손익
+
+
+class ApiPositionTracker(PositionTracker):
+    """
+    MEXC 선물 private REST API(HMAC 서명)로 포지션/총 자산/미실현 손익을 조회하는 PositionTracker.
+    DOM 클래스명이 바뀌어도 영향이 없고, 문자열 파싱 대신 숫자 필드를 그대로 사용.
+
+    - requests.Session 1개를 재사용 (keep-alive 커넥션 풀)
+    - API 실패 시 fallback(DOM PositionTracker)으로 같은 값을 조회
+    - 누적 거래량/실현손익/close_all_positions 등은 PositionTracker 그대로
+
+    사용 예)
+        dom_tracker = PositionTracker(symbol="BTC_USDT", driver=driver)
+        tracker = ApiPositionTracker("BTC_USDT", api_key, api_secret, contract_size=0.0001, fallback=dom_tracker)
+    """
+
+    def __init__(self, symbol, api_key, api_secret, contract_size: float, fallback=None, session=None,
+                 base_url=BASE_URL):
+        """
+        contract_size: 계약 1개당 코인 수량 (holdVol -> 코인 수량 환산)
+        fallback: API 실패 시 사용할 PositionTracker (없으면 빈 값 반환)
+        base_url: 테스트 시 로컬 서버 주소로 교체 가능
+        """
+        super().__init__(symbol=symbol, driver=None)
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.contract_size = contract_size
+        self.fallback = fallback
+        self.base_url = base_url
+        self.positions_url = POSITIONS_URL.replace(BASE_URL, base_url)
+        self.asset_url = ASSET_URL.replace(BASE_URL, base_url)
+
+        self.session = session or requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        # API 실패로 fallback을 쓴 횟수
+        self.fallback_count = 0
+        # private WebSocket이 채우는 AccountState (live인 동안은 REST 호출 없이 메모리에서 응답)
+        self.account_state = None
+
+    def _live_state(self):
+        state = self.account_state
+        return state if state is not None and state.live else None
+
+    # ------------------------------------------------------------
+    # REST 호출
+    # ------------------------------------------------------------
+    def _get(self, url, params=None):
+        """서명된 GET => data 필드 (실패 시 None)."""
+        # 서명 문자열과 같은 순서(key 오름차순)로 쿼리 전송
+        query = sorted((params or {}).items())
+        headers, _ = sign_request(self.api_key, self.api_secret, params=params)
+        try:
+            resp = self.session.get(url, params=query, headers=headers, timeout=REQUEST_TIMEOUT)
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"[ApiPositionTracker] 요청 실패 ({url}): {e!r}")
+            return None
+        if not resp.ok:
+            logger.warning(f"[ApiPositionTracker] 요청 실패 ({url}): HTTP {resp.status_code}")
+            return None
+        try:
+            js = resp.json()
+        except ValueError as e:
+            logger.warning(f"[ApiPositionTracker] JSON 아님 ({url}): {e!r}")
+            return None
+
+        if not isinstance(js, dict):
+            logger.warning(f"[ApiPositionTracker] 응답 형식 이상 ({url}): {type(js).__name__}")
+            return None
+        if not js.get("success"):
+            logger.warning(f"[ApiPositionTracker] 요청 거부 ({url}): code={js.get('code')}, msg={js.get('message')}")
+            return None
+        return js.get("data")
+
+    def fetch_positions(self) -> Optional[list]:
+        """현재 심볼의 오픈 포지션 => [ApiPosition, ...] (API 실패 시 None)."""
+        data = self._get(self.positions_url, {"symbol": self.symbol})
+        if data is None:
+            return None
+        if not isinstance(data, list):
+            logger.warning(f"[ApiPositionTracker] 포지션 응답 형식 이상: {type(data).__name__}")
+            return None
+
+        positions = []
+        for row in data:
+            side = POSITION_TYPES.get(row.get("positionType"))
+            contracts = float(row.get("holdVol") or 0)
+            if row.get("symbol") != self.symbol or side is None or contracts <= 0:
+                continue
+            positions.append(ApiPosition(
+                symbol=row["symbol"],
+                side=side,
+                size=round(contracts * self.contract_size, 10),
+                contracts=contracts,
+                entry_price=float(row.get("holdAvgPrice") or row.get("openAvgPrice") or 0),
+                liquidate_price=float(row.get("liquidatePrice") or 0),
+                leverage=int(row.get("leverage") or 0),
+            ))
+        return positions
+
+    def fetch_asset(self) -> Optional[ApiAsset]:
+        """USDT 자산 => ApiAsset (API 실패 시 None)."""
+        data = self._get(self.asset_url)
+        if not isinstance(data, dict) or "equity" not in data:
+            return None
+        return ApiAsset(
+            currency=data.get("currency", "USDT"),
+            equity=float(data.get("equity") or 0),
+            available=float(data.get("availableBalance") or 0),
+            position_margin=float(data.get("positionMargin") or 0),
+            unrealized=float(data.get("unrealized") or 0),
+        )
+
+    def fetch_snapshot(self):
+        """(포지션 목록, 자산) 한 번에 조회 (PrivateWsClient 재연결 스냅샷용)."""
+        return self.fetch_positions(), self.fetch_asset()
+
+    def snapshot_provider(self):
+        """
+        PrivateWsClient용 스냅샷 함수. WS 스레드에서 호출되므로 거래 스레드가 쓰는 self.session을
+        공유하지 않도록 전용 Session을 가진 조회용 인스턴스의 fetch_snapshot을 반환.
+        """
+        reader = ApiPositionTracker(self.symbol, self.api_key, self.api_secret, self.contract_size,
+                                    base_url=self.base_url)
+        return reader.fetch_snapshot
+
+    def _use_fallback(self, what):
+        self.fallback_count += 1
+        if self.fallback is None:
+            logger.warning(f"[ApiPositionTracker] {what} API 조회 실패 (fallback 없음)")
+            return False
+        logger.warning(f"[ApiPositionTracker] {what} API 조회 실패 => DOM 파싱으로 대체")
+        return True
+
+    # ------------------------------------------------------------
+    # PositionTracker 인터페이스
+    # ------------------------------------------------------------
+    def get_open_positions(self):
+        state = self._live_state()
+        if state is not None:
+            return state.get_open_positions()
+
+        positions = self.fetch_positions()
+        if positions is None:
+            return self.fallback.get_open_positions() if self._use_fallback("포지션") else []
+
+        results = [
+            {"symbol": p.symbol, "positionSide": p.side, "size": p.size}
+            for p in positions
+        ]
+        logger.info(f"[ApiPositionTracker] get_open_positions() => {[(p.side, p.size) for p in positions]}")
+        return results
+
+    def _cached_asset(self):
+        state = self._live_state()
+        return state.asset if state is not None else None
+
+    def _positions_key(self):
+        """비교용 포지션 상태 ((side, 계약 수), ...) - 조회 실패 시 None."""
+        state = self._live_state()
+        positions = list(state.positions.values()) if state is not None else self.fetch_positions()
+        if positions is None:
+            return None
+        return tuple(sorted((p.side, p.contracts) for p in positions))
+
+    def wait_positions_stable(self, timeout=1.0):
+        """
+        주문 직후 체결이 포지션에 반영될 때까지 대기 (RiskManager가 청산/진입 직후 재조회 전에 호출).
+        POSITIONS_POLL_SEC 간격으로 포지션을 읽어 연속 두 번 같으면 반환 (최대 timeout초).
+        API 조회가 실패하면 fallback(DOM)의 화면 안정화 대기로 대체.
+        """
+        deadline = time.monotonic() + timeout
+        previous = self._positions_key()
+        while previous is not None and time.monotonic() < deadline:
+            time.sleep(POSITIONS_POLL_SEC)
+            current = self._positions_key()
+            if current == previous:
+                return
+            previous = current
+        if previous is None and self.fallback is not None:
+            self.fallback.wait_positions_stable(max(0.0, deadline - time.monotonic()))
+
+    def get_total_balance(self) -> float:
+        asset = self._cached_asset() or self.fetch_asset()
+        if asset is None:
+            return self.fallback.get_total_balance() if self._use_fallback("총 자산") else 0.0
+        return asset.equity
+
+    def get_unrealized_pnl(self) -> float:
+        asset = self._cached_asset() or self.fetch_asset()
+        if asset is None:
+            return self.fallback.get_unrealized_pnl() if self._use_fallback("미실현 손익") else 0.0
+        return asset.unrealized
+
+    def get_realized_pnl_by_balance(self) -> float:
+        # 총 자산/미실현 손익을 한 번의 자산 조회로 계산 (DOM 버전은 2번 조회)
+        asset = self._cached_asset() or self.fetch_asset()
+        if asset is None:
+            return super().get_realized_pnl_by_balance()
+        return (asset.equity - self._initial_balance) - asset.unrealized
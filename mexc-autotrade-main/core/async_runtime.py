@@ -0,0 +1,438 @@
+# core/async_runtime.py
+
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import aiohttp
+from loguru import logger
+from core.kline_cache import KlineCache, KLINE_URL
+from core.events import EventPool, TickEvent
+from core.metrics import FEED_LATENCY, FEED_ERRORS, ORDER_LATENCY, endpoint_name
+from utils.signer import sign_request
+
+BASE_URL = "https://futures.mexc.com"
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/110.0.0.0 Safari/537.36"
+)
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+
+class AsyncMexcFeed:
+    """
+    MexcRestPollingFeed의 asyncio 버전.
+
+    - ticker/deals를 한 세션에서 동시에 요청 (asyncio.gather)
+    - 백오프(429, 5xx)는 asyncio.sleep으로 처리 => 대기 중에도 이벤트 루프는 다른 작업 수행
+    - bar_builder / kline_cache 사용 방식은 MexcRestPollingFeed와 동일
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        poll_interval=0.5,
+        kline_interval="Min1",
+        max_retries=3,
+        bar_builder=None,
+        kline_verify_sec=60,
+        kline_cache=None,
+        backfill_bars=0
+    ):
+        """
+        backfill_bars: 시작 시 kline_cache에 채울 과거 캔들 수 (0이면 생략)
+        session: AsyncRuntime.run()에서 연결
+        """
+        self.symbol = symbol
+        self.poll_interval = poll_interval
+        self.kline_interval = kline_interval
+        self.max_retries = max_retries
+        self.bar_builder = bar_builder
+        self.kline_verify_sec = kline_verify_sec
+        self.kline_cache = kline_cache
+        self.backfill_bars = backfill_bars
+        self._last_kline_check = 0.0
+        self._stopped = False
+        self.session = None
+        # poll() 결과 TickEvent 재사용 (AsyncRuntime이 처리 후 반납)
+        self.pool = EventPool(TickEvent)
+
+    def stop(self):
+        self._stopped = True
+
+    async def run(self, publish):
+        """poll_interval + 무작위 지연(jitter)마다 poll() 결과를 publish(data_dict)로 전달."""
+        logger.info("[AsyncMexcFeed] 폴링 시작.")
+        while not self._stopped:
+            publish(await self.poll())
+            await asyncio.sleep(self.poll_interval + random.uniform(0, 0.5))
+        logger.info("[AsyncMexcFeed] 폴링 종료.")
+
+    async def poll(self) -> TickEvent:
+        deal_limit = 100 if self.bar_builder else 5
+        last_price, deals = await asyncio.gather(
+            self._get_last_price(),
+            self._get_recent_deals(limit=deal_limit)
+        )
+        data_dict = self.pool.acquire()
+        data_dict["lastPrice"] = last_price
+        data_dict["deals"] = deals
+
+        if not self.bar_builder:
+            data_dict["kline"] = await self._get_kline_data(limit=5)
+            return data_dict
+
+        closed_bars = self.bar_builder.add_deals(deals)
+        closed_bars.extend(self.bar_builder.close_expired(int(time.time() * 1000)))
+        data_dict["bars"] = closed_bars
+
+        if time.time() - self._last_kline_check >= self.kline_verify_sec:
+            data_dict["kline"] = await self._get_kline_data(limit=5)
+            self.bar_builder.verify(data_dict["kline"])
+            self._last_kline_check = time.time()
+        return data_dict
+
+    async def backfill(self, bars) -> int:
+        """KlineCache.backfill()과 같은 페이지들을 동시에 요청."""
+        pages = self.kline_cache.backfill_pages(bars)
+        if not pages:
+            return 0
+        started = time.time()
+        results = await asyncio.gather(*(self._safe_get(self.kline_cache.url, page) for page in pages))
+        return self.kline_cache.merge_pages([KlineCache.extract(js) for js in results], started)
+
+    # ------------------------------------------------------------
+    # GET helper (with retry/backoff)
+    # ------------------------------------------------------------
+    async def _safe_get(self, url, params=None):
+        attempt = 0
+        backoff_sec = 2
+        endpoint = endpoint_name(url)
+
+        while attempt < self.max_retries:
+            attempt += 1
+            try:
+                started = time.perf_counter()
+                async with self.session.get(url, params=params, timeout=REQUEST_TIMEOUT) as resp:
+                    FEED_LATENCY.labels(endpoint).observe(time.perf_counter() - started)
+                    if resp.status >= 400:
+                        FEED_ERRORS.labels(endpoint).inc()
+                    if resp.status == 429:
+                        logger.warning(f"[AsyncMexcFeed] 429 Too Many Requests. 백오프 {backoff_sec}s 후 재시도.")
+                        await asyncio.sleep(backoff_sec)
+                        backoff_sec *= 2
+                        continue
+
+                    if 500 <= resp.status < 600:
+                        logger.warning(f"[AsyncMexcFeed] 서버 오류({resp.status}). 백오프 {backoff_sec}s 후 재시도.")
+                        await asyncio.sleep(backoff_sec)
+                        backoff_sec *= 2
+                        continue
+
+                    if resp.status >= 400:
+                        logger.warning(f"[AsyncMexcFeed] HTTP {resp.status} 오류. 재시도 불가.")
+                        return None
+
+                    return await resp.json(content_type=None)
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                FEED_ERRORS.labels(endpoint).inc()
+                logger.warning(f"[AsyncMexcFeed] 연결 에러({e!r}). 백오프 {backoff_sec}s 후 재시도.")
+                await asyncio.sleep(backoff_sec)
+                backoff_sec *= 2
+
+        logger.error(f"[AsyncMexcFeed] {self.max_retries}번 재시도 후 실패 => None 반환.")
+        return None
+
+    # ------------------------------------------------------------
+    # 실제 API 호출 함수들
+    # ------------------------------------------------------------
+    async def _get_recent_deals(self, limit=1):
+        js = await self._safe_get(f"{BASE_URL}/api/v1/contract/deals/{self.symbol}")
+        if not js or not js.get("success"):
+            return []
+        return js.get("data", [])[:limit]
+
+    async def _get_last_price(self):
+        js = await self._safe_get(f"{BASE_URL}/api/v1/contract/ticker", {"symbol": self.symbol})
+        if not js or not js.get("success"):
+            return None
+        return js.get("data", {}).get("lastPrice")
+
+    async def _get_kline_data(self, limit=1):
+        if self.kline_cache:
+            js = await self._safe_get(self.kline_cache.url, self.kline_cache.sync_params(limit))
+            self.kline_cache.merge(KlineCache.extract(js))
+            return self.kline_cache.to_kline_dict(limit)
+
+        js = await self._safe_get(f"{KLINE_URL}/{self.symbol}", {"interval": self.kline_interval, "limit": limit})
+        if not js or not js.get("success"):
+            return []
+        return js.get("data", [])
+
+
+# ----------------------------------------------------------------
+# API 주문
+# ----------------------------------------------------------------
+# MEXC 주문 side 코드
+ORDER_SIDES = {
+    ("OPEN", "LONG"): 1,
+    ("CLOSE", "SHORT"): 2,
+    ("OPEN", "SHORT"): 3,
+    ("CLOSE", "LONG"): 4,
+}
+ORDER_TYPE_MARKET = 5
+OPEN_TYPE_CROSS = 2
+
+
+class AsyncOrderClient:
+    """
+    MEXC 선물 private API 주문 (HMAC 서명, utils/signer.py).
+    세션과 이벤트 루프는 AsyncRuntime.run()에서 attach()로 연결.
+    """
+
+    SUBMIT_URL = f"{BASE_URL}/api/v1/private/order/submit"
+
+    def __init__(self, api_key: str, api_secret: str, leverage=50, open_type=OPEN_TYPE_CROSS):
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.leverage = leverage
+        self.open_type = open_type
+        self.session = None
+        self.loop = None
+        self.loop_thread = None
+
+    def attach(self, session):
+        self.session = session
+        self.loop = asyncio.get_running_loop()
+        self.loop_thread = threading.current_thread()
+
+    async def submit_market_order(self, symbol: str, action: str, side: str, vol: int):
+        """
+        시장가 주문. action: "OPEN"/"CLOSE", side: "LONG"/"SHORT", vol: 계약 수.
+        성공 시 주문 ID, 실패 시 None.
+        """
+        body = {
+            "symbol": symbol,
+            "price": 0,
+            "vol": vol,
+            "side": ORDER_SIDES[(action, side.upper())],
+            "type": ORDER_TYPE_MARKET,
+            "openType": self.open_type,
+            "leverage": self.leverage,
+        }
+        headers, body_str = sign_request(self.api_key, self.api_secret, body=body)
+        try:
+            async with self.session.post(self.SUBMIT_URL, data=body_str, headers=headers,
+                                         timeout=REQUEST_TIMEOUT) as resp:
+                js = await resp.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.warning(f"[AsyncOrderClient] 주문 요청 실패: {e!r}")
+            return None
+
+        if not js or not js.get("success"):
+            logger.warning(f"[AsyncOrderClient] 주문 거부: code={js and js.get('code')}, msg={js and js.get('message')}")
+            return None
+        return js.get("data")
+
+
+class ApiOrderExecutor:
+    """
+    OrderExecutor와 같은 동기 인터페이스로 AsyncOrderClient를 호출.
+    전략은 AsyncRuntime의 blocking 스레드에서 실행되므로,
+    코루틴을 이벤트 루프에 넘기고(run_coroutine_threadsafe) 결과를 기다림.
+    """
+
+    def __init__(self, client: AsyncOrderClient, symbol: str, contract_size: float, timeout=10,
+                 contract_specs=None):
+        """
+        contract_size: 계약 1개당 코인 수량 (수량 -> 계약 수 환산)
+        contract_specs: ContractSpecCache (주문 전 최소/최대/수량 단위 검사, 없으면 생략)
+        """
+        self.client = client
+        self.symbol = symbol
+        self.contract_size = contract_size
+        self.timeout = timeout
+        self.contract_specs = contract_specs
+
+    def place_market_order(self, side: str, quantity: float) -> bool:
+        return self._submit("OPEN", side, quantity)
+
+    def close_position(self, side: str, quantity: float) -> bool:
+        return self._submit("CLOSE", side, quantity)
+
+    def _submit(self, action, side, quantity) -> bool:
+        loop = self.client.loop
+        if loop is None:
+            logger.error("[ApiOrderExecutor] 이벤트 루프가 아직 시작되지 않았습니다.")
+            return False
+        if threading.current_thread() is self.client.loop_thread:
+            raise RuntimeError("[ApiOrderExecutor] 이벤트 루프 스레드에서 동기 주문 호출 불가")
+
+        vol = int(round(quantity / self.contract_size))
+        if vol <= 0:
+            logger.warning(f"[ApiOrderExecutor] 수량 {quantity}가 계약 1개 미만 => 주문 생략")
+            return False
+        if self.contract_specs:
+            ok, reason = self.contract_specs.validate_qty(self.symbol, quantity)
+            if not ok:
+                logger.warning(f"[ApiOrderExecutor] {action} {side} 수량 {quantity} 주문 불가 ({reason}) => 주문 생략")
+                return False
+
+        started = time.time()
+        future = asyncio.run_coroutine_threadsafe(
+            self.client.submit_market_order(self.symbol, action, side, vol), loop
+        )
+        try:
+            order_id = future.result(timeout=self.timeout)
+        except Exception as e:
+            future.cancel()
+            logger.warning(f"[ApiOrderExecutor] {action} {side} 응답 대기 실패: {e!r}")
+            return False
+
+        ORDER_LATENCY.labels("api").observe(time.time() - started)
+        logger.info(
+            f"[ApiOrderExecutor] {action} {side.upper()} {vol}계약 => "
+            f"{'성공' if order_id else '실패'} ({time.time() - started:.3f}s)"
+        )
+        return order_id is not None
+
+
+# ----------------------------------------------------------------
+# 런타임
+# ----------------------------------------------------------------
+class AsyncRuntime:
+    """
+    피드, 주기 작업, API 주문을 이벤트 루프 하나에서 코루틴으로 실행.
+
+    - Selenium(팝업 닫기, 전략의 클릭 주문, 잔고 조회 등) 같은 블로킹 호출은
+      전용 단일 스레드 executor에서 실행 => 루프는 막히지 않고, 드라이버 호출은 항상 한 스레드에서 순차 실행
+    - 전략 처리 중 새 시세가 오면 최신 것 하나만 남김 (마감 봉은 합쳐서 전달)
+
+    사용 예)
+        runtime = AsyncRuntime(feed, on_data)
+        runtime.every(60, write_log, name="minute_log")
+        runtime.daily_at(15, 0, reset, name="daily_reset")
+        asyncio.run(runtime.run())
+    """
+
+    def __init__(self, feed: AsyncMexcFeed, on_data, order_client: AsyncOrderClient = None, on_ready=None):
+        """
+        on_data: 시세 콜백 (blocking 스레드에서 호출)
+        order_client: API 주문 사용 시 세션/루프를 연결할 AsyncOrderClient
+        on_ready: 과거 캔들 backfill 후, 첫 시세 전달 전에 1회 호출 (blocking 스레드)
+        """
+        self.feed = feed
+        self.on_data = on_data
+        self.order_client = order_client
+        self.on_ready = on_ready
+        self.blocking_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="selenium")
+        self._jobs = []
+        self._latest = None
+        self.loop = None
+
+        # 통계
+        self.coalesced = 0
+
+    # ------------------------------------------------------------
+    # 작업 등록
+    # ------------------------------------------------------------
+    def queue_depth(self) -> int:
+        """아직 처리하지 못한 시세 수 (0 또는 1, 밀리면 병합됨 => coalesced)."""
+        return self._latest.qsize() if self._latest else 0
+
+    def every(self, interval_sec: float, func, name=None, blocking=True):
+        """interval_sec마다 func() 실행 (blocking=True면 Selenium 스레드에서)."""
+        self._jobs.append((self._every_loop, interval_sec, func, name or func.__name__, blocking))
+
+    def daily_at(self, hour: int, minute: int, func, name=None, blocking=True):
+        """매일 hour:minute(로컬 시각)에 func() 실행."""
+        self._jobs.append((self._daily_loop, (hour, minute), func, name or func.__name__, blocking))
+
+    async def run_blocking(self, func, *args):
+        return await self.loop.run_in_executor(self.blocking_pool, func, *args)
+
+    # ------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------
+    async def run(self):
+        self.loop = asyncio.get_running_loop()
+        self._latest = asyncio.Queue(maxsize=1)
+
+        async with aiohttp.ClientSession(headers={"User-Agent": USER_AGENT}) as session:
+            self.feed.session = session
+            if self.order_client:
+                self.order_client.attach(session)
+
+            tasks = [asyncio.create_task(self._consume(), name="consume")]
+            tasks += [asyncio.create_task(loop_fn(arg, func, name, blocking), name=name)
+                      for loop_fn, arg, func, name, blocking in self._jobs]
+            logger.info(f"[AsyncRuntime] 시작 (작업: {[t.get_name() for t in tasks[1:]]})")
+
+            try:
+                await self._start_feed()
+            finally:
+                self.feed.stop()
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                # 실행 중인 Selenium 호출이 끝날 때까지 대기 (이후 종료 처리와 드라이버 동시 사용 방지)
+                self.blocking_pool.shutdown(wait=True, cancel_futures=True)
+                logger.info(f"[AsyncRuntime] 종료 (건너뛴 시세 {self.coalesced}건)")
+
+    async def _start_feed(self):
+        if self.feed.kline_cache and self.feed.backfill_bars:
+            await self.feed.backfill(self.feed.backfill_bars)
+            self.feed.backfill_bars = 0
+        if self.on_ready:
+            await self.run_blocking(self.on_ready)
+        await self.feed.run(self._publish)
+
+    def _publish(self, data_dict):
+        if self._latest.full():
+            stale = self._latest.get_nowait()
+            # 처리 못 한 마감 봉은 버리지 않고 이어 붙임
+            if stale.get("bars"):
+                data_dict["bars"] = list(stale["bars"]) + list(data_dict.get("bars", []))
+            self.feed.pool.release(stale)
+            self.coalesced += 1
+        self._latest.put_nowait(data_dict)
+
+    async def _consume(self):
+        while True:
+            data_dict = await self._latest.get()
+            try:
+                await self.run_blocking(self.on_data, data_dict)
+            except Exception as e:
+                logger.warning(f"[AsyncRuntime] 시세 처리 실패(무시): {e}")
+            finally:
+                self.feed.pool.release(data_dict)
+
+    async def _every_loop(self, interval_sec, func, name, blocking):
+        while True:
+            await asyncio.sleep(interval_sec)
+            await self._call(func, name, blocking)
+
+    async def _daily_loop(self, at, func, name, blocking):
+        hour, minute = at
+        while True:
+            now = datetime.now()
+            target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if target <= now:
+                target += timedelta(days=1)
+            await asyncio.sleep((target - now).total_seconds())
+            await self._call(func, name, blocking)
+
+    async def _call(self, func, name, blocking):
+        started = time.time()
+        try:
+            if blocking:
+                await self.run_blocking(func)
+            else:
+                func()
+        except Exception as e:
+            logger.warning(f"[AsyncRuntime] 작업 {name} 실패(무시): {e}")
+            return
+        logger.debug(f"[AsyncRuntime] 작업 {name} 완료 ({time.time() - started:.3f}s)")
@@ -0,0 +1,235 @@
+# core/bar_builder.py
+
+from collections import deque
+from loguru import logger
+
+
+def parse_interval_sec(interval) -> int:
+    """
+    봉 주기 문자열을 초 단위로 변환.
+    - "1s", "15s", "1m", "5m", "1h" 형식
+    - MEXC kline 형식("Min1", "Min5", "Min15", "Min30", "Min60", "Hour4", "Hour8", "Day1")
+    - 정수(초)는 그대로 반환
+    """
+    if isinstance(interval, (int, float)):
+        return int(interval)
+
+    text = str(interval).strip()
+    mexc_units = {"Min": 60, "Hour": 3600, "Day": 86400, "Week": 604800}
+    for prefix, unit_sec in mexc_units.items():
+        if text.startswith(prefix):
+            return int(text[len(prefix):]) * unit_sec
+
+    short_units = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+    unit = text[-1:].lower()
+    if unit in short_units and text[:-1].isdigit():
+        return int(text[:-1]) * short_units[unit]
+
+    raise ValueError(f"알 수 없는 봉 주기: {interval}")
+
+
+class Bar:
+    """
+    OHLCV 봉 1개.
+    start_ts: 봉 시작 시각(ms), interval_sec: 봉 주기(초)
+    """
+
+    __slots__ = ("start_ts", "interval_sec", "open", "high", "low", "close", "volume", "trade_count")
+
+    def __init__(self, start_ts: int, interval_sec: int, price: float, volume: float = 0.0):
+        self.start_ts = start_ts
+        self.interval_sec = interval_sec
+        self.open = price
+        self.high = price
+        self.low = price
+        self.close = price
+        self.volume = volume
+        self.trade_count = 1
+
+    @property
+    def end_ts(self) -> int:
+        return self.start_ts + self.interval_sec * 1000
+
+    def update(self, price: float, volume: float = 0.0):
+        if price > self.high:
+            self.high = price
+        if price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += volume
+        self.trade_count += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "time": self.start_ts // 1000,
+            "open": self.open,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "vol": self.volume,
+            "count": self.trade_count,
+        }
+
+    def __repr__(self):
+        return (
+            f"Bar(t={self.start_ts}, o={self.open}, h={self.high}, "
+            f"l={self.low}, c={self.close}, v={self.volume})"
+        )
+
+
+class BarBuilder:
+    """
+    체결(deals) 스트림을 받아 임의 주기(1s, 1m, 5m ...)의 OHLCV 봉을 점진적으로 만드는 클래스.
+
+    - 매 폴링마다 새로 들어온 체결만 반영(타임스탬프 기준 중복 제거)
+    - 봉 주기가 지나면(close_grace_ms 유예 후) 봉을 마감하고 반환
+    - REST kline과 주기적으로 대조(verify)하여 누락/오차를 경고
+    """
+
+    def __init__(self, interval="1m", close_grace_ms=1500, history_size=200, on_bar_closed=None):
+        """
+        interval: 봉 주기 ("1s", "1m", "5m", "Min1" 등)
+        close_grace_ms: 봉 종료 시각 이후 늦게 도착하는 체결을 기다리는 유예 시간(ms)
+        history_size: 검증용으로 보관할 마감 봉 개수
+        on_bar_closed: 봉 마감 시 호출할 콜백 (bar) -> None
+        """
+        self.interval_sec = parse_interval_sec(interval)
+        self.interval_ms = self.interval_sec * 1000
+        self.close_grace_ms = close_grace_ms
+        self.on_bar_closed = on_bar_closed
+
+        self.current_bar = None
+        self.closed_bars = deque(maxlen=history_size)
+        # 마지막으로 마감한 봉의 시작 시각(ms). 이 주기 이하의 체결은 봉을 다시 열지 않고 버림
+        self.last_closed_start = None
+
+        # 중복 제거용: 마지막으로 반영한 체결 시각과 그 시각의 체결 키 목록
+        self._last_deal_ts = 0
+        self._last_deal_keys = set()
+
+        # 통계
+        self.late_deals = 0
+        self.verify_mismatches = 0
+
+    # ------------------------------------------------------------
+    # 체결 반영
+    # ------------------------------------------------------------
+    def add_deals(self, deals) -> list:
+        """
+        MEXC deals 응답(최신순 리스트: {"p","v","T","t",...})을 반영.
+        이미 반영한 체결은 건너뛰고, 이번 호출로 마감된 봉 리스트를 반환.
+        """
+        if not deals:
+            return []
+
+        closed = []
+        for deal in sorted(deals, key=lambda d: d.get("t", 0)):
+            ts = int(deal.get("t", 0))
+            key = (deal.get("p"), deal.get("v"), deal.get("T"))
+
+            if ts < self._last_deal_ts:
+                continue
+            if ts == self._last_deal_ts:
+                if key in self._last_deal_keys:
+                    continue
+                self._last_deal_keys.add(key)
+            else:
+                self._last_deal_ts = ts
+                self._last_deal_keys = {key}
+
+            closed.extend(self.update(float(deal["p"]), float(deal.get("v", 0.0)), ts))
+        return closed
+
+    def update(self, price: float, volume: float, ts_ms: int) -> list:
+        """
+        체결 1건(또는 틱 1개)을 반영. 새 주기로 넘어가면 이전 봉을 마감해 반환.
+        """
+        bucket = ts_ms - (ts_ms % self.interval_ms)
+        bar = self.current_bar
+
+        if self.last_closed_start is not None and bucket <= self.last_closed_start:
+            # 이미 마감된 주기에 늦게 도착한 체결 (close_expired로 현재 봉이 비어 있어도) => 버림
+            self.late_deals += 1
+            logger.trace(f"[BarBuilder] 지연 체결 무시 (t={ts_ms}, 마감봉={self.last_closed_start})")
+            return []
+
+        if bar is None:
+            self.current_bar = Bar(bucket, self.interval_sec, price, volume)
+            return []
+
+        if bucket == bar.start_ts:
+            bar.update(price, volume)
+            return []
+
+        if bucket < bar.start_ts:
+            # 이미 마감된 주기에 늦게 도착한 체결 => 버림
+            self.late_deals += 1
+            logger.trace(f"[BarBuilder] 지연 체결 무시 (t={ts_ms}, 현재봉={bar.start_ts})")
+            return []
+
+        closed = [self._close_current()]
+        self.current_bar = Bar(bucket, self.interval_sec, price, volume)
+        return closed
+
+    def close_expired(self, now_ms: int) -> list:
+        """
+        새 체결이 없어도 봉 종료 시각 + 유예 시간이 지났으면 현재 봉을 마감.
+        """
+        bar = self.current_bar
+        if bar is None or now_ms < bar.end_ts + self.close_grace_ms:
+            return []
+        self.current_bar = None
+        return [self._close_current(bar)]
+
+    def _close_current(self, bar=None):
+        bar = bar or self.current_bar
+        self.last_closed_start = bar.start_ts
+        self.closed_bars.append(bar)
+        logger.trace(f"[BarBuilder] 봉 마감: {bar}")
+        if self.on_bar_closed:
+            self.on_bar_closed(bar)
+        return bar
+
+    # ------------------------------------------------------------
+    # REST kline 대조
+    # ------------------------------------------------------------
+    def verify(self, kline_data, tolerance=0.0005) -> int:
+        """
+        REST kline 응답({"time":[..], "open":[..], "high":[..], "low":[..], "close":[..]})과
+        같은 시각의 마감 봉을 비교. 상대 오차가 tolerance를 넘는 봉 개수를 반환.
+        (deals 엔드포인트는 최근 100건만 주므로, 체결이 몰리면 봉이 어긋날 수 있음)
+        """
+        if not kline_data or not isinstance(kline_data, dict):
+            return 0
+
+        times = kline_data.get("time", [])
+        if not times:
+            return 0
+
+        # kline 주기와 봉 주기가 다르면 비교 불가
+        if len(times) >= 2 and (times[1] - times[0]) != self.interval_sec:
+            return 0
+
+        by_time = {bar.start_ts // 1000: bar for bar in self.closed_bars}
+        mismatches = 0
+        for i, t in enumerate(times):
+            bar = by_time.get(t)
+            if bar is None:
+                continue
+            for field in ("open", "high", "low", "close"):
+                rest_val = float(kline_data[field][i])
+                if rest_val <= 0:
+                    continue
+                diff = abs(getattr(bar, field) - rest_val) / rest_val
+                if diff > tolerance:
+                    mismatches += 1
+                    logger.warning(
+                        f"[BarBuilder] kline 불일치 t={t} {field}: "
+                        f"로컬={getattr(bar, field)}, REST={rest_val} (오차 {diff:.4%})"
+                    )
+                    break
+
+        self.verify_mismatches += mismatches
+        if mismatches == 0:
+            logger.trace(f"[BarBuilder] kline 대조 OK ({len(times)}개)")
+        return mismatches
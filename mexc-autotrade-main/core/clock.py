@@ -0,0 +1,53 @@
+# core/clock.py
+
+import time
+from datetime import datetime
+
+
+class SystemClock:
+    """실제 시각 (기본값)."""
+
+    def time(self) -> float:
+        return time.time()
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def sleep(self, seconds: float):
+        time.sleep(seconds)
+
+
+class VirtualClock:
+    """
+    시뮬레이션용 가상 시각.
+    sleep()은 실제로 기다리지 않고 시각만 앞으로 이동 => 하루치 매매를 몇 초 만에 재생.
+    """
+
+    def __init__(self, start=None):
+        """start: epoch초 또는 datetime (없으면 현재 시각)"""
+        if start is None:
+            start = time.time()
+        elif isinstance(start, datetime):
+            start = start.timestamp()
+        self._now = float(start)
+
+    def time(self) -> float:
+        return self._now
+
+    def now(self) -> datetime:
+        return datetime.fromtimestamp(self._now)
+
+    def sleep(self, seconds: float):
+        self.advance(seconds)
+
+    def advance(self, seconds: float):
+        if seconds > 0:
+            self._now += seconds
+
+    def set(self, ts: float):
+        """ts(epoch초)로 이동. 시간은 거꾸로 가지 않음."""
+        if ts > self._now:
+            self._now = ts
+
+
+SYSTEM_CLOCK = SystemClock()
@@ -0,0 +1,188 @@
+# core/contract_spec.py
+
+import json
+import math
+import os
+import time
+from typing import NamedTuple
+import requests
+from loguru import logger
+from config.config import MIN_TRADE_AMOUNT
+
+CONTRACT_DETAIL_URL = "https://futures.mexc.com/api/v1/contract/detail"
+REQUEST_TIMEOUT = 10
+
+
+class ContractSpec(NamedTuple):
+    symbol: str
+    contract_size: float   # 계약 1개당 코인 수량
+    min_vol: float         # 최소 주문 계약 수
+    vol_unit: float        # 계약 수 단위
+    max_vol: float         # 최대 주문 계약 수
+    price_unit: float      # 호가 단위 (tick), None이면 모름 => 가격 보정 안 함
+    max_leverage: int
+    qty_step: float        # 코인 수량 단위 = contract_size * vol_unit
+    qty_decimals: int      # qty_step 소수 자릿수 (float 오차 제거용)
+    price_decimals: int    # price_unit이 None이면 None
+
+
+def _decimals(step: float) -> int:
+    text = f"{step:.12f}".rstrip("0")
+    return len(text.split(".")[1]) if "." in text else 0
+
+
+def make_spec(symbol, contract_size, min_vol=1, vol_unit=1, max_vol=float("inf"), price_unit=None,
+              max_leverage=0) -> ContractSpec:
+    qty_step = contract_size * vol_unit
+    return ContractSpec(
+        symbol=symbol,
+        contract_size=contract_size,
+        min_vol=min_vol,
+        vol_unit=vol_unit,
+        max_vol=max_vol,
+        price_unit=price_unit,
+        max_leverage=max_leverage,
+        qty_step=qty_step,
+        qty_decimals=_decimals(qty_step),
+        price_decimals=_decimals(price_unit) if price_unit else None,
+    )
+
+
+class ContractSpecCache:
+    """
+    전 심볼 계약 사양(계약 크기, 수량 단위, 호가 단위, 최대 레버리지) 캐시.
+
+    - refresh(): 공개 contract/detail 엔드포인트 1회 호출로 전 심볼을 받아옴
+    - 디스크(cache_dir/contract_specs.json)에 저장, ttl_sec 안이면 API 호출 없이 재사용
+    - API 실패 시 만료된 디스크 캐시 => config.MIN_TRADE_AMOUNT 순으로 대체
+    - quantize_qty()/quantize_price()/validate_qty(): dict 조회 + 산술만 (O(1))
+
+    사용 예)
+        specs = ContractSpecCache(cache_dir="data")
+        specs.ensure()
+        qty = specs.quantize_qty("BTC_USDT", 0.012345)   # 0.0123
+    """
+
+    def __init__(self, cache_dir="data", ttl_sec=86400, fetch_json=None, url=CONTRACT_DETAIL_URL):
+        """
+        fetch_json: (url, params) -> dict 응답 (없으면 requests.get)
+        url: 테스트 시 로컬 서버 주소로 교체 가능
+        """
+        self.cache_path = os.path.join(cache_dir, "contract_specs.json")
+        self.ttl_sec = ttl_sec
+        self.fetch_json = fetch_json or self._fetch_json
+        self.url = url
+        self.specs = {}
+        self.fetched_at = 0.0
+
+    # ------------------------------------------------------------
+    # 로드 / 갱신
+    # ------------------------------------------------------------
+    def ensure(self) -> int:
+        """신선한 디스크 캐시가 있으면 그대로, 아니면 API로 갱신. 로드된 심볼 수 반환."""
+        self.load()
+        if self.specs and time.time() - self.fetched_at < self.ttl_sec:
+            return len(self.specs)
+        if not self.refresh() and self.specs:
+            logger.warning(f"[ContractSpecCache] 갱신 실패 => 만료된 디스크 캐시 사용 ({len(self.specs)}개)")
+        return len(self.specs)
+
+    def refresh(self) -> bool:
+        try:
+            js = self.fetch_json(self.url, None)
+        except Exception as e:
+            logger.warning(f"[ContractSpecCache] contract/detail 요청 실패: {e!r}")
+            return False
+        if not js or not js.get("success") or not js.get("data"):
+            logger.warning(f"[ContractSpecCache] contract/detail 응답 이상: code={js and js.get('code')}")
+            return False
+
+        rows = js["data"] if isinstance(js["data"], list) else [js["data"]]
+        self.specs = {row["symbol"]: self._parse(row) for row in rows if row.get("contractSize")}
+        self.fetched_at = time.time()
+        self.save(rows)
+        logger.info(f"[ContractSpecCache] 계약 사양 {len(self.specs)}개 갱신")
+        return True
+
+    @staticmethod
+    def _parse(row) -> ContractSpec:
+        return make_spec(
+            row["symbol"],
+            contract_size=float(row["contractSize"]),
+            min_vol=float(row.get("minVol") or 1),
+            vol_unit=float(row.get("volUnit") or 1),
+            max_vol=float(row.get("maxVol") or float("inf")),
+            price_unit=float(row["priceUnit"]) if row.get("priceUnit") else None,
+            max_leverage=int(row.get("maxLeverage") or 0),
+        )
+
+    def load(self) -> int:
+        if not os.path.exists(self.cache_path):
+            return 0
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+            self.specs = {row["symbol"]: self._parse(row) for row in saved["rows"]}
+            self.fetched_at = saved["fetched_at"]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"[ContractSpecCache] 디스크 캐시 로드 실패(무시): {e}")
+            return 0
+        return len(self.specs)
+
+    def save(self, rows):
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump({"fetched_at": self.fetched_at, "rows": rows}, f)
+        except OSError as e:
+            logger.warning(f"[ContractSpecCache] 디스크 저장 실패(무시): {e}")
+
+    @staticmethod
+    def _fetch_json(url, params):
+        return requests.get(url, params=params, timeout=REQUEST_TIMEOUT).json()
+
+    # ------------------------------------------------------------
+    # 조회 / 수량·가격 보정
+    # ------------------------------------------------------------
+    def get(self, symbol: str) -> ContractSpec:
+        spec = self.specs.get(symbol)
+        if spec is None:
+            # 사양을 못 받은 심볼 => 기존 고정 표(없으면 0.0001)로 대체, 호가 단위는 모름
+            logger.warning(f"[ContractSpecCache] {symbol} 사양 없음 => MIN_TRADE_AMOUNT 사용 (호가 단위 미상)")
+            spec = self.specs[symbol] = make_spec(symbol, MIN_TRADE_AMOUNT.get(symbol, 0.0001))
+        return spec
+
+    def contract_size(self, symbol: str) -> float:
+        return self.get(symbol).contract_size
+
+    def qty_step(self, symbol: str) -> float:
+        return self.get(symbol).qty_step
+
+    def quantize_qty(self, symbol: str, qty: float) -> float:
+        """코인 수량을 수량 단위로 내림 (float 오차 제거)."""
+        spec = self.get(symbol)
+        steps = math.floor(qty / spec.qty_step + 1e-9)
+        return round(steps * spec.qty_step, spec.qty_decimals)
+
+    def quantize_price(self, symbol: str, price: float) -> float:
+        """가격을 호가 단위로 반올림 (호가 단위를 모르면 그대로 반환)."""
+        spec = self.get(symbol)
+        if spec.price_unit is None:
+            return price
+        return round(round(price / spec.price_unit) * spec.price_unit, spec.price_decimals)
+
+    def to_contracts(self, symbol: str, qty: float) -> int:
+        """코인 수량 => 계약 수."""
+        return int(round(qty / self.get(symbol).contract_size))
+
+    def validate_qty(self, symbol: str, qty: float):
+        """주문 가능 수량인지 검사 => (True, "") / (False, 사유)."""
+        spec = self.get(symbol)
+        vol = qty / spec.contract_size
+        if vol < spec.min_vol - 1e-9:
+            return False, f"최소 {spec.min_vol * spec.contract_size} 미만"
+        if vol > spec.max_vol + 1e-9:
+            return False, f"최대 {spec.max_vol * spec.contract_size} 초과"
+        if abs(vol / spec.vol_unit - round(vol / spec.vol_unit)) > 1e-6:
+            return False, f"수량 단위 {spec.qty_step}의 배수가 아님"
+        return True, ""
@@ -0,0 +1,180 @@
+# core/driver_profiler.py
+
+import sys
+import threading
+import time
+from loguru import logger
+from selenium.webdriver.remote.webelement import WebElement
+
+# 호출 위치(tag)를 찾을 때 건너뛸 모듈 (WebDriverWait 내부 호출은 바깥 호출자로 집계)
+_SKIP_MODULES = (__name__, "selenium")
+
+# 드라이버에서 계측할 메서드/속성
+DRIVER_METHODS = ("get", "refresh", "back")
+DRIVER_PROPERTIES = ("current_url", "title", "page_source")
+
+
+def _caller_tag() -> str:
+    """profiler/selenium 바깥의 첫 호출 함수 (예: RiskManager.close_popups)."""
+    frame = sys._getframe(2)
+    while frame and frame.f_globals.get("__name__", "").startswith(_SKIP_MODULES):
+        frame = frame.f_back
+    if frame is None:
+        return "?"
+    code = frame.f_code
+    return getattr(code, "co_qualname", code.co_name)
+
+
+class DriverProfiler:
+    """
+    WebDriver 호출 횟수/소요 시간을 (호출 함수, 명령)별로 집계.
+    report_sec마다 총 소요 시간 기준 상위 top_n개를 로그로 출력하고 집계를 초기화.
+    """
+
+    def __init__(self, report_sec=60, top_n=10):
+        self.report_sec = report_sec
+        self.top_n = top_n
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._window_start = time.time()
+        # 누적 (op -> [횟수, 총 초]) - report()로 초기화되지 않음 (메트릭 엔드포인트용)
+        self.totals = {}
+
+    def timed(self, op, func, *args, **kwargs):
+        tag = _caller_tag()
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._record(tag, op, time.perf_counter() - started)
+
+    def _record(self, tag, op, elapsed):
+        with self._lock:
+            stat = self._stats.get((tag, op))
+            if stat is None:
+                self._stats[(tag, op)] = [1, elapsed, elapsed]
+            else:
+                stat[0] += 1
+                stat[1] += elapsed
+                if elapsed > stat[2]:
+                    stat[2] = elapsed
+            total = self.totals.get(op)
+            if total is None:
+                self.totals[op] = [1, elapsed]
+            else:
+                total[0] += 1
+                total[1] += elapsed
+        if time.time() - self._window_start >= self.report_sec:
+            self.report()
+
+    def snapshot(self, reset=False) -> list:
+        """[(tag, op, 횟수, 총 초, 최대 초), ...] 총 소요 시간 내림차순."""
+        with self._lock:
+            rows = [(tag, op, c, total, mx) for (tag, op), (c, total, mx) in self._stats.items()]
+            if reset:
+                self._stats = {}
+                self._window_start = time.time()
+        rows.sort(key=lambda r: r[3], reverse=True)
+        return rows
+
+    def report(self):
+        window = time.time() - self._window_start
+        rows = self.snapshot(reset=True)
+        if not rows:
+            return
+        calls = sum(r[2] for r in rows)
+        total = sum(r[3] for r in rows)
+        lines = [
+            f"[DriverProfiler] 최근 {window:.0f}s: WebDriver 호출 {calls}회, 총 {total * 1000:.0f}ms "
+            f"(상위 {min(self.top_n, len(rows))}개)"
+        ]
+        for tag, op, count, t, mx in rows[:self.top_n]:
+            lines.append(
+                f"  {tag:<45} {op:<16} {count:>6}회  총 {t * 1000:>8.1f}ms  "
+                f"평균 {t / count * 1000:>6.2f}ms  최대 {mx * 1000:>7.1f}ms"
+            )
+        logger.info("\n".join(lines))
+
+
+class ProfiledElement(WebElement):
+    """
+    계측용 WebElement. 실제 요소와 같은 id/parent를 가지므로 ActionChains, execute_script 인자 등에
+    그대로 넘길 수 있음 (isinstance(WebElement) 유지).
+    """
+
+    def __init__(self, element: WebElement, profiler: DriverProfiler):
+        super().__init__(element.parent, element.id)
+        self._profiler = profiler
+
+    def click(self):
+        return self._profiler.timed("click", super().click)
+
+    def clear(self):
+        return self._profiler.timed("clear", super().clear)
+
+    def send_keys(self, *value):
+        return self._profiler.timed("send_keys", super().send_keys, *value)
+
+    def get_attribute(self, name):
+        return self._profiler.timed("get_attribute", super().get_attribute, name)
+
+    def get_property(self, name):
+        return self._profiler.timed("get_property", super().get_property, name)
+
+    def is_displayed(self):
+        return self._profiler.timed("is_displayed", super().is_displayed)
+
+    def is_enabled(self):
+        return self._profiler.timed("is_enabled", super().is_enabled)
+
+    @property
+    def text(self):
+        return self._profiler.timed("text", lambda: WebElement.text.fget(self))
+
+    def find_element(self, by="id", value=None):
+        found = self._profiler.timed("el.find_element", super().find_element, by, value)
+        return ProfiledElement(found, self._profiler)
+
+    def find_elements(self, by="id", value=None):
+        found = self._profiler.timed("el.find_elements", super().find_elements, by, value)
+        return [ProfiledElement(e, self._profiler) for e in found]
+
+
+class ProfiledDriver:
+    """
+    Selenium 드라이버 프록시. find_element(s), execute_script/execute_async_script(주문 스크립트, UiWaiter),
+    요소의 click/send_keys/get_attribute 등
+    모든 왕복 호출을 호출 함수별로 집계 (그 외 속성은 실제 드라이버로 위임).
+
+    사용 예)
+        driver = ProfiledDriver(stealth.init_driver(), report_sec=60, top_n=10)
+    """
+
+    def __init__(self, driver, report_sec=60, top_n=10):
+        self.__dict__["_driver"] = driver
+        self.__dict__["profiler"] = DriverProfiler(report_sec=report_sec, top_n=top_n)
+
+    def find_element(self, by="id", value=None):
+        found = self.profiler.timed("find_element", self._driver.find_element, by, value)
+        return ProfiledElement(found, self.profiler)
+
+    def find_elements(self, by="id", value=None):
+        found = self.profiler.timed("find_elements", self._driver.find_elements, by, value)
+        return [ProfiledElement(e, self.profiler) for e in found]
+
+    def execute_script(self, script, *args):
+        return self.profiler.timed("execute_script", self._driver.execute_script, script, *args)
+
+    def execute_async_script(self, script, *args):
+        return self.profiler.timed("execute_async_script", self._driver.execute_async_script, script, *args)
+
+    def __getattr__(self, name):
+        if name in DRIVER_PROPERTIES:
+            return self.profiler.timed(name, getattr, self._driver, name)
+        attr = getattr(self._driver, name)
+        if name in DRIVER_METHODS:
+            return lambda *args, **kwargs: self.profiler.timed(name, attr, *args, **kwargs)
+        return attr
+
+    def __setattr__(self, name, value):
+        setattr(self._driver, name, value)
@@ -0,0 +1,112 @@
+# core/element_cache.py
+
+from loguru import logger
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import (
+    NoSuchElementException, StaleElementReferenceException
+)
+
+
+class ElementCache:
+    """
+    이름 -> (로케이터, 찾은 WebElement) 캐시.
+
+    - get(): 캐시에 있으면 그대로 반환(hit), 없으면 그때 찾음(miss)
+    - click()/fill(): 동작 중 StaleElementReferenceException이 나면 해당 항목만 다시 찾아 1회 재시도(re-resolve)
+    - invalidate(): 페이지 이동/재로그인 시 전체 폐기 => 다음 사용 시 다시 찾음
+    """
+
+    def __init__(self, driver, name="ElementCache"):
+        self.driver = driver
+        self.name = name
+        self.locators = {}
+        self.elements = {}
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.re_resolves = 0
+        self.invalidations = 0
+
+    def register(self, key: str, value: str, by=By.XPATH):
+        self.locators[key] = (by, value)
+        self.elements.pop(key, None)
+
+    def get(self, key: str):
+        """캐시된 요소 (없으면 찾아서 캐시). 페이지에 없으면 None."""
+        element = self.elements.get(key)
+        if element is not None:
+            self.hits += 1
+            return element
+        self.misses += 1
+        return self._resolve(key)
+
+    def _resolve(self, key):
+        by, value = self.locators[key]
+        try:
+            element = self.driver.find_element(by, value)
+        except NoSuchElementException:
+            logger.debug(f"[{self.name}] '{key}' 요소 없음")
+            return None
+        self.elements[key] = element
+        return element
+
+    def call(self, key: str, action):
+        """
+        action(element) 실행. stale이면 다시 찾아 1회 재시도.
+        요소가 없으면 NoSuchElementException.
+        """
+        element = self.elements.get(key) or self._resolve(key)
+        if element is None:
+            raise NoSuchElementException(f"[{self.name}] '{key}' 요소 없음")
+        try:
+            return action(element)
+        except StaleElementReferenceException:
+            self.re_resolves += 1
+            logger.debug(f"[{self.name}] '{key}' stale => 다시 찾음")
+            element = self._resolve(key)
+            if element is None:
+                raise NoSuchElementException(f"[{self.name}] '{key}' 재탐색 실패")
+            return action(element)
+
+    def click(self, key: str) -> bool:
+        """클릭. 요소가 페이지에 없으면 False."""
+        if self.get(key) is None:
+            return False
+        self.call(key, lambda el: el.click())
+        return True
+
+    def fill(self, key: str, text: str) -> bool:
+        """입력창 비우고 text 입력. 요소가 페이지에 없으면 False."""
+        if self.get(key) is None:
+            return False
+
+        def _fill(el):
+            el.clear()
+            el.send_keys(text)
+        self.call(key, _fill)
+        return True
+
+    def invalidate(self, key: str = None):
+        """key 하나 또는 (None이면) 전체 폐기."""
+        if key is None:
+            self.elements.clear()
+            self.invalidations += 1
+            logger.info(f"[{self.name}] 캐시 전체 무효화 => 다음 사용 시 다시 찾음")
+        else:
+            self.elements.pop(key, None)
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "re_resolves": self.re_resolves,
+            "invalidations": self.invalidations,
+        }
+
+    def log_stats(self):
+        s = self.stats()
+        logger.info(
+            f"[{self.name}] hit={s['hits']}, miss={s['misses']}, "
+            f"re-resolve={s['re_resolves']}, 무효화={s['invalidations']}"
+        )
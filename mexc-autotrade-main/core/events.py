@@ -0,0 +1,99 @@
+# core/events.py
+
+"""
+틱 경로에서 매번 dict/list를 새로 만들지 않도록 __slots__ 이벤트 객체를 풀(pool)에서 재사용.
+
+- TickEvent: 피드 1회 폴링 결과 (기존 data_dict 대체, data.get("lastPrice") 같은 dict식 조회 그대로 지원)
+- TradeEvent: 주문 체결 알림 (StrategyHost.on_fill, 기존 fill dict 대체)
+- 봉은 core/bar_builder.Bar (__slots__)
+
+풀에서 꺼낸 이벤트는 콜백이 끝나면 release()로 반납되므로, 콜백 밖에서 보관하려면 필요한 값만 복사할 것.
+"""
+
+EMPTY = ()
+
+
+class _DictView:
+    """기존 dict 소비 코드(data.get("bars", []), fill["side"] 등) 호환용 조회."""
+
+    __slots__ = ()
+    _KEYS = {}
+
+    def get(self, key, default=None):
+        value = getattr(self, self._KEYS.get(key, "_missing"), None)
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, self._KEYS[key])
+        except (KeyError, AttributeError):
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        setattr(self, self._KEYS[key], value)
+
+    def __contains__(self, key):
+        return key in self._KEYS and getattr(self, self._KEYS[key], None) is not None
+
+
+class TickEvent(_DictView):
+    __slots__ = ("last_price", "deals", "kline", "bars")
+    _KEYS = {"lastPrice": "last_price", "deals": "deals", "kline": "kline", "bars": "bars"}
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.last_price = None
+        self.deals = EMPTY
+        self.kline = EMPTY
+        self.bars = EMPTY
+        return self
+
+    def __repr__(self):
+        return f"TickEvent(lastPrice={self.last_price}, deals={len(self.deals)}, bars={len(self.bars)})"
+
+
+class TradeEvent(_DictView):
+    __slots__ = ("strategy", "action", "side", "qty", "price")
+    _KEYS = {name: name for name in __slots__}
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.strategy = None
+        self.action = None
+        self.side = None
+        self.qty = 0.0
+        self.price = None
+        return self
+
+    def __repr__(self):
+        return f"TradeEvent({self.strategy} {self.action} {self.side} qty={self.qty} @ {self.price})"
+
+
+class EventPool:
+    """
+    이벤트 객체 free-list. acquire()는 초기화된 객체를 꺼내고, release()는 초기화(참조 해제) 후 반납.
+    정상 상태에서는 같은 객체 몇 개가 계속 재사용되므로 틱당 새 할당이 없음.
+    (단일 생산자/소비자 스레드 전제 - list.append/pop은 GIL 하에서 원자적)
+    """
+
+    __slots__ = ("factory", "_free", "max_free", "created")
+
+    def __init__(self, factory, max_free=64):
+        self.factory = factory
+        self._free = []
+        self.max_free = max_free
+        self.created = 0
+
+    def acquire(self):
+        if self._free:
+            return self._free.pop()
+        self.created += 1
+        return self.factory()
+
+    def release(self, event):
+        if len(self._free) < self.max_free:
+            self._free.append(event.reset())
@@ -0,0 +1,84 @@
+# core/indicators.py
+
+"""
+점진(incremental) 지표 계산기 모음.
+값을 하나씩 넣을 때마다 O(1)로 갱신되며, Selenium 등 외부 의존성 없음.
+"""
+
+
+class EMA:
+    """지수이동평균. alpha = 2/(span+1), 첫 값으로 초기화."""
+
+    def __init__(self, span: int):
+        self.span = span
+        self.alpha = 2 / (span + 1)
+        self.value = None
+
+    def update(self, x: float) -> float:
+        if self.value is None:
+            self.value = x
+        else:
+            self.value += (x - self.value) * self.alpha
+        return self.value
+
+
+class RSI:
+    """Wilder 방식 RSI. period개 변화량이 쌓이기 전에는 None."""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.prev = None
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.count = 0
+        self.value = None
+
+    def update(self, x: float):
+        if self.prev is None:
+            self.prev = x
+            return None
+
+        change = x - self.prev
+        self.prev = x
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+
+        self.count += 1
+        if self.count <= self.period:
+            # 초기 구간: 단순 평균
+            self.avg_gain += (gain - self.avg_gain) / self.count
+            self.avg_loss += (loss - self.avg_loss) / self.count
+            if self.count < self.period:
+                return None
+        else:
+            self.avg_gain = (self.avg_gain * (self.period - 1) + gain) / self.period
+            self.avg_loss = (self.avg_loss * (self.period - 1) + loss) / self.period
+
+        if self.avg_loss == 0:
+            self.value = 100.0
+        else:
+            rs = self.avg_gain / self.avg_loss
+            self.value = 100 - 100 / (1 + rs)
+        return self.value
+
+
+class MACD:
+    """MACD(fast, slow, signal). macd = EMA(fast)-EMA(slow), signal = EMA(macd)."""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = EMA(fast)
+        self.slow = EMA(slow)
+        self.signal_ema = EMA(signal)
+        self.macd = None
+        self.signal = None
+
+    def update(self, x: float):
+        self.macd = self.fast.update(x) - self.slow.update(x)
+        self.signal = self.signal_ema.update(self.macd)
+        return self.macd, self.signal
+
+    @property
+    def histogram(self):
+        if self.macd is None:
+            return None
+        return self.macd - self.signal
@@ -0,0 +1,219 @@
+# core/kline_cache.py
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from loguru import logger
+from core.bar_builder import parse_interval_sec
+
+KLINE_URL = "https://futures.mexc.com/api/v1/contract/kline"
+
+# MEXC kline 1회 요청 최대 캔들 수
+MAX_CANDLES_PER_REQUEST = 2000
+
+FIELDS = ("open", "high", "low", "close", "vol")
+
+
+class KlineCache:
+    """
+    (심볼, 주기)별 K라인 캐시.
+
+    - sync(): 마지막으로 저장된 캔들 시각 이후만 요청(start=마지막 시각)
+      => 아직 열려 있는 캔들은 제자리 갱신, 새 캔들만 추가
+    - closes()/history(): 지표 계산용 이력을 메모리에서 바로 제공
+    - backfill(): 시작 시 과거 이력을 여러 페이지로 나눠 동시 요청
+    - load()/save(): 디스크에 저장해 다음 실행 시 재사용
+    """
+
+    def __init__(self, symbol: str, interval="Min1", fetch_json=None, max_size=10_000, cache_dir="data"):
+        """
+        symbol: "BTC_USDT" 등
+        interval: MEXC kline 주기 ("Min1", "Min5" ...)
+        fetch_json: (url, params) -> dict 응답 (예: MexcRestPollingFeed._safe_get)
+        max_size: 메모리에 보관할 최대 캔들 수
+        cache_dir: 디스크 저장 폴더
+        """
+        self.symbol = symbol
+        self.interval = interval
+        self.interval_sec = parse_interval_sec(interval)
+        self.fetch_json = fetch_json
+        self.max_size = max_size
+        self.cache_path = os.path.join(cache_dir, f"kline_{symbol}_{interval}.json")
+
+        # [time(초), open, high, low, close, vol] 리스트, 시각 오름차순
+        self.candles = []
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------
+    @property
+    def last_time(self):
+        return self.candles[-1][0] if self.candles else None
+
+    def closes(self, n=None) -> list:
+        rows = self.candles if n is None else self.candles[-n:]
+        return [row[4] for row in rows]
+
+    def history(self, n=None) -> list:
+        """최근 n개 캔들을 dict 리스트로 반환 (n=None이면 전체)."""
+        rows = self.candles if n is None else self.candles[-n:]
+        return [dict(zip(("time",) + FIELDS, row)) for row in rows]
+
+    def to_kline_dict(self, n=5) -> dict:
+        """REST kline 응답과 같은 열(column) 형식으로 최근 n개 반환."""
+        rows = self.candles[-n:]
+        result = {"time": [row[0] for row in rows]}
+        for i, field in enumerate(FIELDS, start=1):
+            result[field] = [row[i] for row in rows]
+        return result
+
+    # ------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------
+    def merge(self, kline_data) -> int:
+        """
+        REST kline 응답(data)을 캐시에 병합. 새로 추가된 캔들 수를 반환.
+        - 마지막 캔들과 같은 시각 => 제자리 갱신 (아직 열린 캔들)
+        - 더 최신 시각 => 추가
+        - 더 과거 시각 => 중간 삽입 (backfill용)
+        """
+        if not kline_data or not isinstance(kline_data, dict):
+            return 0
+        times = kline_data.get("time", [])
+        if not times:
+            return 0
+
+        rows = [
+            [int(t)] + [float(kline_data[field][i]) for field in FIELDS]
+            for i, t in enumerate(times)
+        ]
+
+        added = 0
+        with self._lock:
+            for row in rows:
+                if not self.candles or row[0] > self.candles[-1][0]:
+                    self.candles.append(row)
+                    added += 1
+                elif row[0] == self.candles[-1][0]:
+                    self.candles[-1] = row
+                else:
+                    added += self._insert_past(row)
+
+            if len(self.candles) > self.max_size:
+                del self.candles[:len(self.candles) - self.max_size]
+        return added
+
+    def _insert_past(self, row) -> int:
+        lo, hi = 0, len(self.candles)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.candles[mid][0] < row[0]:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self.candles) and self.candles[lo][0] == row[0]:
+            self.candles[lo] = row
+            return 0
+        self.candles.insert(lo, row)
+        return 1
+
+    @property
+    def url(self):
+        return f"{KLINE_URL}/{self.symbol}"
+
+    def sync_params(self, initial_limit=5) -> dict:
+        """
+        증분 요청 파라미터: 마지막 저장 시각 이후만.
+        캐시가 비어 있으면 최근 initial_limit개만.
+        """
+        if self.last_time is None:
+            return {"interval": self.interval, "limit": initial_limit}
+        return {"interval": self.interval, "start": self.last_time}
+
+    def sync(self, initial_limit=5) -> int:
+        """마지막 저장 시각 이후의 캔들만 요청해 병합."""
+        return self.merge(self._fetch(self.sync_params(initial_limit)))
+
+    def _fetch(self, params):
+        if not self.fetch_json:
+            return None
+        return self.extract(self.fetch_json(self.url, params=params))
+
+    @staticmethod
+    def extract(js):
+        """API 응답에서 kline 데이터만 꺼냄 (실패 시 None)."""
+        if not js or not js.get("success"):
+            return None
+        return js.get("data")
+
+    # ------------------------------------------------------------
+    # 시작 시 과거 이력 채우기
+    # ------------------------------------------------------------
+    def backfill_pages(self, bars=1440) -> list:
+        """
+        최근 bars개 캔들(단, 캐시에 이미 있는 구간 이후부터)을
+        MAX_CANDLES_PER_REQUEST 단위로 나눈 요청 파라미터 목록.
+        """
+        now = int(time.time())
+        end = now - (now % self.interval_sec)
+        start = end - bars * self.interval_sec
+        if self.last_time is not None:
+            start = max(start, self.last_time)
+        if start >= end:
+            return []
+
+        page_sec = MAX_CANDLES_PER_REQUEST * self.interval_sec
+        return [
+            {"interval": self.interval, "start": s, "end": min(s + page_sec, end)}
+            for s in range(start, end, page_sec)
+        ]
+
+    def backfill(self, bars=1440, workers=4) -> int:
+        """backfill_pages()의 페이지들을 동시에 요청해 병합."""
+        pages = self.backfill_pages(bars)
+        if not pages:
+            return 0
+
+        started = time.time()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(self._fetch, pages))
+        return self.merge_pages(results, started)
+
+    def merge_pages(self, results, started) -> int:
+        added = sum(self.merge(data) for data in results)
+        logger.info(
+            f"[KlineCache] {self.symbol} {self.interval} backfill: 페이지 {len(results)}개, "
+            f"{added}개 추가 ({time.time() - started:.2f}s), 총 {len(self.candles)}개"
+        )
+        return added
+
+    # ------------------------------------------------------------
+    # 디스크 저장/로드
+    # ------------------------------------------------------------
+    def load(self) -> int:
+        if not os.path.exists(self.cache_path):
+            return 0
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                self.candles = json.load(f)[-self.max_size:]
+            logger.info(f"[KlineCache] 캐시 로드: {self.cache_path} ({len(self.candles)}개)")
+        except (OSError, ValueError) as e:
+            logger.warning(f"[KlineCache] 캐시 로드 실패(무시): {e}")
+            self.candles = []
+        return len(self.candles)
+
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            with self._lock:
+                snapshot = list(self.candles)
+            tmp_path = self.cache_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, self.cache_path)
+            logger.info(f"[KlineCache] 캐시 저장: {self.cache_path} ({len(snapshot)}개)")
+        except OSError as e:
+            logger.warning(f"[KlineCache] 캐시 저장 실패: {e}")
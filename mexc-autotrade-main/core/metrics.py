@@ -0,0 +1,280 @@
+# core/metrics.py
+
+import bisect
+import threading
+from urllib.parse import parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from loguru import logger
+
+# 지연 시간 히스토그램 기본 구간(초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _format_labels(labelnames, values, extra=""):
+    pairs = [f'{name}="{value}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+# ----------------------------------------------------------------
+# 지표 (값은 제자리 갱신, 문자열은 스크레이프 때만 생성)
+# ----------------------------------------------------------------
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values):
+        """라벨 값별 하위 지표 (한 번 만들면 캐시 => 호출부에서 보관해 두면 조회도 생략 가능)."""
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def samples(self):
+        """[(라벨 값 튜플, 하위 지표), ...]"""
+        if not self.labelnames:
+            return [((), self)]
+        return list(self._children.items())
+
+
+class _CounterValue:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount=1.0):
+        self.value += amount
+
+
+class Counter(_Metric, _CounterValue):
+    kind = "counter"
+
+    def __init__(self, name, help_text, labelnames=()):
+        _Metric.__init__(self, name, help_text, labelnames)
+        _CounterValue.__init__(self)
+
+    def _new_child(self):
+        return _CounterValue()
+
+    def render(self, lines):
+        for values, child in self.samples():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}")
+
+
+class _GaugeValue(_CounterValue):
+    __slots__ = ()
+
+    def set(self, value):
+        self.value = value
+
+
+class Gauge(_Metric, _GaugeValue):
+    kind = "gauge"
+
+    def __init__(self, name, help_text, labelnames=()):
+        _Metric.__init__(self, name, help_text, labelnames)
+        _GaugeValue.__init__(self)
+
+    def _new_child(self):
+        return _GaugeValue()
+
+    render = Counter.render
+
+
+class _HistogramValue:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Histogram(_Metric, _HistogramValue):
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labelnames=(), buckets=LATENCY_BUCKETS):
+        _Metric.__init__(self, name, help_text, labelnames)
+        _HistogramValue.__init__(self, tuple(buckets))
+
+    def _new_child(self):
+        return _HistogramValue(self.bounds)
+
+    def render(self, lines):
+        for values, child in self.samples():
+            cumulative = 0
+            for bound, count in zip(self.bounds + (float("inf"),), child.counts):
+                cumulative += count
+                le = _format_labels(self.labelnames, values, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+
+
+class Callback(_Metric):
+    """스크레이프 때 func()를 호출해 값을 읽는 지표. func는 숫자 또는 {라벨 값 튜플: 숫자} 반환."""
+
+    def __init__(self, name, help_text, func, labelnames=(), kind="gauge"):
+        super().__init__(name, help_text, labelnames)
+        self.func = func
+        self.kind = kind
+
+    def render(self, lines):
+        result = self.func()
+        if result is None:
+            return
+        items = result.items() if self.labelnames else [((), result)]
+        for values, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(value)}")
+
+
+# ----------------------------------------------------------------
+# 레지스트리 / HTTP 엔드포인트
+# ----------------------------------------------------------------
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = {}
+
+    def _register(self, metric):
+        # 같은 이름을 다시 등록하면 교체 (재시작/테스트 시 콜백 갱신)
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, help_text, labelnames=()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name, help_text, labelnames=()) -> Gauge:
+        return self._register(Gauge(name, help_text, labelnames))
+
+    def histogram(self, name, help_text, labelnames=(), buckets=LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def callback(self, name, help_text, func, labelnames=(), kind="gauge") -> Callback:
+        return self._register(Callback(name, help_text, func, labelnames, kind))
+
+    def render(self) -> str:
+        """Prometheus text exposition format (0.0.4)."""
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            try:
+                metric.render(lines)
+            except Exception as e:
+                logger.debug(f"[Metrics] {metric.name} 수집 실패(생략): {e}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# 공통 지표 (호출부에서 import해 제자리 갱신)
+TICKS = REGISTRY.counter("mexc_ticks_total", "처리한 시세 틱 수")
+LAST_TICK_TS = REGISTRY.gauge("mexc_last_tick_timestamp_seconds", "마지막 틱 처리 시각(epoch초)")
+FEED_LATENCY = REGISTRY.histogram("mexc_feed_request_seconds", "시세 REST 요청 소요 시간", ("endpoint",))
+FEED_ERRORS = REGISTRY.counter("mexc_feed_request_errors_total", "시세 REST 요청 실패(재시도 포함)", ("endpoint",))
+ORDER_LATENCY = REGISTRY.histogram("mexc_order_seconds", "주문 제출 소요 시간", ("route",))
+UNREALIZED_PNL = REGISTRY.gauge("mexc_unrealized_pnl_usdt", "미실현 손익 (1분 스냅샷 값)")
+REALIZED_PNL = REGISTRY.gauge("mexc_realized_pnl_usdt", "실현 손익 (1분 스냅샷 값)")
+CURRENT_PROFIT = REGISTRY.gauge("mexc_current_profit_usdt", "총 자산 - 시작 자산 (1분 스냅샷 값)")
+
+
+def endpoint_name(url: str) -> str:
+    """MEXC REST URL => 엔드포인트 이름 (".../contract/deals/BTC_USDT" => "deals")."""
+    path = url.split("?", 1)[0]
+    if "/contract/" in path:
+        return path.split("/contract/", 1)[1].split("/", 1)[0]
+    return path.rsplit("/", 1)[-1]
+
+
+class BadRequest(ValueError):
+    """
+    add_route() 핸들러가 잘못된 쿼리에 대해 던지면 400 응답.
+    메시지는 사용자 입력을 담을 수 있으므로 상태줄(latin-1 고정)이 아니라 UTF-8 본문에 넣음.
+    """
+
+
+class MetricsServer:
+    """
+    로컬 HTTP 엔드포인트 (GET /metrics). 스크레이프 요청이 올 때만 문자열을 만들므로
+    틱 경로 비용은 지표 값 갱신(숫자 덧셈)뿐.
+    add_route()로 로컬 제어용 경로(예: /profile)를 더 붙일 수 있음.
+
+    사용 예)
+        server = MetricsServer(REGISTRY, port=9108)
+        server.start()   # http://127.0.0.1:9108/metrics
+    """
+
+    def __init__(self, registry=REGISTRY, host="127.0.0.1", port=9108):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server = None
+        self._thread = None
+        self.routes = {"/metrics": lambda query: self.registry.render()}
+
+    def add_route(self, path, handler):
+        """handler(query: dict) -> 응답 텍스트 (잘못된 쿼리는 BadRequest => 400)"""
+        self.routes[path] = handler
+
+    def start(self):
+        routes = self.routes
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path, _, query = self.path.partition("?")
+                handler = routes.get(path)
+                if handler is None:
+                    self.send_error(404)
+                    return
+                try:
+                    body = handler(parse_qs(query)).encode("utf-8")
+                except BadRequest as e:
+                    self.send_error(400, "bad request", str(e))
+                    return
+                except Exception as e:
+                    logger.warning(f"[MetricsServer] {path} 처리 실패: {e}")
+                    self.send_error(500)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True, name="metrics")
+        self._thread.start()
+        logger.info(f"[MetricsServer] http://{self.host}:{self.port}/metrics")
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,116 @@
+# core/multi_timeframe.py
+
+import time
+from loguru import logger
+from core.bar_builder import BarBuilder
+
+
+class TimeframeEMA:
+    """
+    한 주기(예: 5m)의 봉 + EMA 상태.
+
+    - 봉 마감 시에만 EMA(마감 기준)를 갱신 => 틱당 O(1)
+    - 진행 중인 봉은 조회 시점에 live EMA = alpha*현재가 + (1-alpha)*마감EMA 로 계산
+    - 교차(크로스)는 직전 마감 EMA와 이번 마감 EMA를 비교
+    """
+
+    def __init__(self, interval, spans):
+        self.interval = interval
+        self.builder = BarBuilder(interval=interval, close_grace_ms=0)
+        self.alphas = {span: 2 / (span + 1) for span in spans}
+
+        self.ema = {span: None for span in spans}       # 마감 봉 기준 EMA
+        self.prev_ema = {span: None for span in spans}  # 직전 마감 봉 기준 EMA
+        self.last_price = None
+        self.bar_count = 0
+
+    def on_tick(self, price: float, ts_ms: int):
+        self.last_price = price
+        for bar in self.builder.update(price, 0.0, ts_ms):
+            self._on_bar_closed(bar.close)
+
+    def _on_bar_closed(self, close: float):
+        self.bar_count += 1
+        for span, alpha in self.alphas.items():
+            prev = self.ema[span]
+            self.prev_ema[span] = prev
+            self.ema[span] = close if prev is None else (close * alpha + prev * (1 - alpha))
+
+    def value(self, span: int, live=True):
+        closed = self.ema[span]
+        if not live or self.last_price is None:
+            return closed
+        if closed is None:
+            return self.last_price
+        alpha = self.alphas[span]
+        return self.last_price * alpha + closed * (1 - alpha)
+
+
+class MultiTimeframeEMA:
+    """
+    하나의 틱 스트림을 여러 주기(1m, 5m, 15m ...)로 점진 리샘플링하고
+    주기별 EMA/크로스 상태를 유지하는 엔진.
+
+    사용 예)
+        mtf = MultiTimeframeEMA(["1m", "5m", "15m"], spans=(1, 3, 7))
+        mtf.on_tick(price)
+        if mtf.is_above("5m", 3, 7): ...      # 5m EMA3 > EMA7
+        if mtf.crossed_up("1m", 1, 3): ...    # 1m 마감 봉 기준 골든크로스
+    """
+
+    def __init__(self, timeframes=("1m", "5m", "15m"), spans=(1, 3, 7)):
+        self.spans = tuple(spans)
+        self.frames = {tf: TimeframeEMA(tf, self.spans) for tf in timeframes}
+
+    def on_tick(self, price: float, ts_ms: int = None):
+        if ts_ms is None:
+            ts_ms = int(time.time() * 1000)
+        for frame in self.frames.values():
+            frame.on_tick(price, ts_ms)
+
+    def warm_up(self, candles):
+        """
+        KlineCache.history() 형식의 과거 캔들({"time","close",...})로 EMA를 미리 채움.
+        (추가 HTTP 요청 없이 시작 직후부터 상위 주기 EMA 사용 가능)
+        """
+        for candle in candles:
+            self.on_tick(float(candle["close"]), int(candle["time"]) * 1000)
+        logger.info(
+            "[MultiTimeframeEMA] warm-up 완료: "
+            + ", ".join(f"{tf}={frame.bar_count}봉" for tf, frame in self.frames.items())
+        )
+
+    # ------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------
+    def ema(self, timeframe: str, span: int, live=True):
+        """timeframe 주기의 EMA(span). live=False면 마지막 마감 봉 기준 값."""
+        return self.frames[timeframe].value(span, live=live)
+
+    def is_above(self, timeframe: str, fast: int, slow: int, live=True) -> bool:
+        a = self.ema(timeframe, fast, live=live)
+        b = self.ema(timeframe, slow, live=live)
+        return a is not None and b is not None and a > b
+
+    def is_below(self, timeframe: str, fast: int, slow: int, live=True) -> bool:
+        a = self.ema(timeframe, fast, live=live)
+        b = self.ema(timeframe, slow, live=live)
+        return a is not None and b is not None and a < b
+
+    def crossed_up(self, timeframe: str, fast: int, slow: int) -> bool:
+        """직전 마감 봉에서 fast <= slow 였다가 이번 마감 봉에서 fast > slow (골든크로스)."""
+        frame = self.frames[timeframe]
+        pf, ps = frame.prev_ema[fast], frame.prev_ema[slow]
+        cf, cs = frame.ema[fast], frame.ema[slow]
+        if None in (pf, ps, cf, cs):
+            return False
+        return pf <= ps and cf > cs
+
+    def crossed_down(self, timeframe: str, fast: int, slow: int) -> bool:
+        """직전 마감 봉에서 fast >= slow 였다가 이번 마감 봉에서 fast < slow (데드크로스)."""
+        frame = self.frames[timeframe]
+        pf, ps = frame.prev_ema[fast], frame.prev_ema[slow]
+        cf, cs = frame.ema[fast], frame.ema[slow]
+        if None in (pf, ps, cf, cs):
+            return False
+        return pf >= ps and cf < cs
@@ -1,31 +1,119 @@
 import time
+from collections import deque
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, ElementClickInterceptedException, NoSuchElementException
 from loguru import logger
 from config.config import (
-    MAX_ORDER_RETRY,
+    MAX_ORDER_RETRY, ORDER_SUBMIT_MODE, ORDER_LATENCY_COMPARE_EVERY, MIN_TRADE_AMOUNT
+)
+from core.contract_spec import make_spec
+from core.element_cache import ElementCache
+from core.metrics import ORDER_LATENCY
+
+# 주문 확인 모달 / 확인 버튼
+CONFIRM_MODAL_XPATH = (
+    '//div[contains(@class,"ant-modal-content")]'
+    '//div[@class="ant-modal-title" and contains(text(),"주문 확인")]'
+)
+CONFIRM_BUTTON_XPATH = (
+    '//div[@class="ForcedReminder_buttonWrapper__p_dYb"]'
+    '//button[contains(@class,"ant-btn-primary")]'
 )
 
+# 탭 선택 → 수량 입력 → 주문 버튼 → 확인 모달을 브라우저 안에서 한 번에 처리 (WebDriver 왕복 1회)
+# - 수량은 React가 인식하도록 input의 native value setter + input/change 이벤트로 입력
+# - 입력값이 확인되지 않으면 버튼을 누르지 않음
+# - 결과: {ok, steps: {tab, qty, button, modal, confirm}, error}
+ORDER_SCRIPT = r"""
+const [tabXpath, inputXpath, buttonXpath, qty, modalXpath, confirmXpath, modalWaitMs] = arguments;
+const done = arguments[arguments.length - 1];
+const find = (xp) => document.evaluate(
+    xp, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const tick = () => new Promise((resolve) => setTimeout(resolve, 16));
+const waitFor = async (xp, ms) => {
+    const end = performance.now() + ms;
+    let el = find(xp);
+    while (!el && performance.now() < end) { await tick(); el = find(xp); }
+    return el;
+};
+(async () => {
+    const steps = {tab: false, qty: false, button: false, modal: false, confirm: false};
+    try {
+        const tab = find(tabXpath);
+        if (tab) { tab.click(); steps.tab = true; }
+
+        const input = await waitFor(inputXpath, 300);
+        if (!input) return done({ok: false, steps, error: "수량 입력창 없음"});
+        const setter = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set;
+        setter.call(input, qty);
+        input.dispatchEvent(new Event("input", {bubbles: true}));
+        input.dispatchEvent(new Event("change", {bubbles: true}));
+        steps.qty = input.value === qty;
+        if (!steps.qty) return done({ok: false, steps, error: "수량 입력 확인 실패: " + input.value});
+
+        const button = find(buttonXpath);
+        if (!button) return done({ok: false, steps, error: "주문 버튼 없음"});
+        button.click();
+        steps.button = true;
+
+        const modal = await waitFor(modalXpath, modalWaitMs);
+        if (modal) {
+            steps.modal = true;
+            const confirm = find(confirmXpath);
+            if (confirm) { confirm.click(); steps.confirm = true; }
+        }
+        done({ok: true, steps, error: null});
+    } catch (e) {
+        done({ok: steps.button, steps, error: String(e)});
+    }
+})();
+"""
+
+# _submit_by_script() 결과
+SUBMIT_SENT = "sent"            # 주문 버튼이 눌림
+SUBMIT_NOT_SENT = "not_sent"    # 버튼을 누르기 전에 실패 => 클릭 경로로 재시도해도 안전
+SUBMIT_UNKNOWN = "unknown"      # 스크립트 도중 예외 (타임아웃/연결 끊김) => 버튼이 눌렸을 수 있음
+                                #   => 실제 포지션을 다시 읽어 체결 여부 판정 (_resolve_unknown)
+
 class OrderExecutor:
     """
     MEXC 웹페이지에서 포지션 오픈/청산(롱/숏) 버튼을 클릭하는 클래스.
     UI 변경 시 XPATH 수정 필요.
     """
 
-    def __init__(self, driver, symbol="BTC_USDT", risk_manager=None):
+    def __init__(self, driver, symbol="BTC_USDT", risk_manager=None, contract_specs=None):
+        """
+        contract_specs: ContractSpecCache (수량 표기 자릿수 + 주문 전 수량 검사용,
+                        없으면 MIN_TRADE_AMOUNT 표로 자릿수만 맞추고 검사는 생략)
+        """
         self.driver = driver
         self.symbol = symbol
         self.risk_manager = risk_manager
+        self.contract_specs = contract_specs
+
+        # 수량 입력 문자열의 소수 자릿수 (수량 단위 기준) => str(0.1 + 0.2) 같은 float 잔여 자릿수 제거
+        spec = contract_specs.get(symbol) if contract_specs else make_spec(symbol, MIN_TRADE_AMOUNT.get(symbol, 0.0001))
+        self.qty_decimals = spec.qty_decimals
+
+        # 이 실행기로 체결시킨 주문 기준 방향별 예상 포지션 수량(코인).
+        # 전송 여부 불명 주문의 체결 판정 기준이며, 판정 때 실제 포지션으로 다시 맞춤
+        self.expected_size = {"LONG": 0.0, "SHORT": 0.0}
 
         logger.info("[OrderExecutor] DOM 요소를 한 번만 찾아서 캐싱합니다. (주문/청산용)")
+        # 요소 캐시: 리렌더링으로 stale이 되면 해당 요소만 다시 찾고, 재로그인/페이지 이동 시 전체 폐기
+        self.elements = ElementCache(driver, name="OrderExecutor")
+        if risk_manager:
+            risk_manager.add_page_change_listener(self.elements.invalidate)
+
         # 주문/청산 탭 버튼
-        self.open_tab = self._find_element_quick('//span[@data-testid="contract-trade-order-form-tab-open"]')
-        self.close_tab = self._find_element_quick('//span[@data-testid="contract-trade-order-form-tab-close"]')
+        self.elements.register("open_tab", '//span[@data-testid="contract-trade-order-form-tab-open"]')
+        self.elements.register("close_tab", '//span[@data-testid="contract-trade-order-form-tab-close"]')
 
         # '포지션 오픈' 탭의 수량 입력창
-        self.open_qty_input = self._find_element_quick(
+        self.elements.register(
+            "open_qty_input",
             '//div[@class="component_container___navi"]'
             '//div[@class="component_inputWrapper__PxwkC"]'
             '//div[contains(@class,"component_numberInput")]'
@@ -33,36 +121,64 @@ class OrderExecutor:
         )
 
         # 롱/숏 버튼 (포지션 오픈)
-        self.open_long_btn = self._find_element_quick('//button[@data-testid="contract-trade-open-long-btn"]')
-        self.open_short_btn = self._find_element_quick('//button[@data-testid="contract-trade-open-short-btn"]')
+        self.elements.register("open_long_btn", '//button[@data-testid="contract-trade-open-long-btn"]')
+        self.elements.register("open_short_btn", '//button[@data-testid="contract-trade-open-short-btn"]')
 
-        # '포지션 청산' 탭의 수량 입력창
+        # '포지션 청산' 탭의 수량 입력창 / 롱 청산 / 숏 청산 버튼
         # (주의: '포지션 청산' 탭은 초기 로딩 시 숨겨져 있을 수 있으므로, 탭 클릭 후 찾음)
-        if self.close_tab:
-            self.close_tab.click()
-            time.sleep(0.3)  # 탭 전환 잠깐 대기
-
-        self.close_qty_input = self._find_element_quick(
+        self.elements.register(
+            "close_qty_input",
             '//div[@style="display: block;"]'
             '//div[@class="InputNumberHandle_inputOuterWrapper__8w_l1"]'
             '//input[@class="ant-input"]'
         )
-
-        # 롱 청산 / 숏 청산 버튼
-        self.close_long_btn = self._find_element_quick(
+        self.elements.register(
+            "close_long_btn",
             '//div[@style="display: block;"]//button[@data-testid="contract-trade-close-long-btn"]'
         )
-        self.close_short_btn = self._find_element_quick(
+        self.elements.register(
+            "close_short_btn",
             '//div[@style="display: block;"]//button[@data-testid="contract-trade-close-short-btn"]'
         )
 
-        # 다시 '포지션 오픈' 탭으로 복귀
-        if self.open_tab:
-            self.open_tab.click()
+        # 미리 찾아 두기 (청산 탭 요소는 탭 전환 후 찾고 다시 '포지션 오픈' 탭으로 복귀)
+        for key in ("open_tab", "close_tab", "open_qty_input", "open_long_btn", "open_short_btn"):
+            self.elements.get(key)
+        if self.elements.click("close_tab"):
+            time.sleep(0.3)  # 탭 전환 잠깐 대기
+        for key in ("close_qty_input", "close_long_btn", "close_short_btn"):
+            self.elements.get(key)
+        if self.elements.click("open_tab"):
             time.sleep(0.3)
 
         logger.info("[OrderExecutor] 캐싱 완료. 주문/청산 시에는 이미 찾은 요소를 그대로 씁니다.")
 
+        # 주문 경로별 소요 시간(초): "script" = ORDER_SCRIPT 1회, "clicks" = 기존 클릭 경로
+        self.submit_mode = ORDER_SUBMIT_MODE
+        self.latency = {"script": deque(maxlen=500), "clicks": deque(maxlen=500)}
+        # "script" 모드에서도 compare_every번째 주문은 클릭 경로로 보내 두 경로 실측치를 함께 모음
+        self.compare_every = ORDER_LATENCY_COMPARE_EVERY
+        self.submits = 0
+
+    def _format_qty(self, quantity: float) -> str:
+        """수량 입력 문자열 (수량 단위 자릿수로 반올림, 끝자리 0 제거: 0.30000000000000004 => "0.3")."""
+        text = f"{quantity:.{self.qty_decimals}f}"
+        return text.rstrip("0").rstrip(".") if "." in text else text
+
+    def _check_qty(self, action: str, quantity: float) -> bool:
+        """최소/최대/수량 단위 검사 (계약 사양이 없으면 통과). 실패 시 UI로 보내지 않음."""
+        if not self.contract_specs:
+            return True
+        ok, reason = self.contract_specs.validate_qty(self.symbol, quantity)
+        if not ok:
+            logger.warning(f"[OrderExecutor] {action} 수량 {quantity} 주문 불가 ({reason}) => 전송 안 함")
+        return ok
+
+    def _book(self, side: str, delta: float):
+        side = side.upper()
+        if side in self.expected_size:
+            self.expected_size[side] = max(0.0, round(self.expected_size[side] + delta, 10))
+
 
     def place_market_order(self, side: str, quantity: float) -> bool:
         """
@@ -72,38 +188,45 @@ class OrderExecutor:
         [포지션 오픈 시도]
         """
         logger.info(f"[OrderExecutor] 시장가 {side}, 수량={quantity:.4f} 주문 시도")
+        if not self._check_qty(f"{side} 오픈", quantity):
+            return False
+        button = {"LONG": "open_long_btn", "SHORT": "open_short_btn"}.get(side.upper())
+        outcome = self._submit_by_script("open_tab", "open_qty_input", button, quantity) if button else SUBMIT_NOT_SENT
+        if outcome == SUBMIT_SENT:
+            logger.info(f"[OrderExecutor] 시장가 {side} {quantity:.4f} 주문 완료. (script)")
+            self._book(side, quantity)
+            return True
+        if outcome == SUBMIT_UNKNOWN:
+            return self._resolve_unknown(side, quantity)
+
         attempt = 0
         success = False
 
         while attempt < MAX_ORDER_RETRY and not success:
             attempt += 1
+            started = time.perf_counter()
 
             if self.risk_manager:
                 self.risk_manager.close_popups()
 
             try:
-                # (1) '포지션 오픈' 탭 클릭
-                if self.open_tab:
-                    self.open_tab.click()
+                # (1) '포지션 오픈' 탭 클릭 (없으면 건너뜀)
+                self.elements.click("open_tab")
 
                 # (2) 수량 입력창
-                if self.open_qty_input:
-                    self.open_qty_input.clear()
-                    self.open_qty_input.send_keys(str(quantity))
+                self.elements.fill("open_qty_input", self._format_qty(quantity))
 
                 # (3) 롱/숏 버튼
-                if side.upper() == "LONG" and self.open_long_btn:
-                    self.open_long_btn.click()
-                elif side.upper() == "SHORT" and self.open_short_btn:
-                    self.open_short_btn.click()
-                else:
+                if not button or not self.elements.click(button):
                     logger.warning("[OrderExecutor] 올바른 side가 아니거나 버튼 없음.")
                     return False
 
                 # (4) 주문 확인 모달 처리
                 self._handle_order_confirm_modal(side)
 
+                self._record_latency("clicks", time.perf_counter() - started)
                 logger.info(f"[OrderExecutor] 시장가 {side} {quantity:.4f} 주문 완료.")
+                self._book(side, quantity)
                 success = True
 
             except Exception as e:
@@ -125,38 +248,45 @@ class OrderExecutor:
         5) 실패 시 최대 MAX_ORDER_RETRY번 재시도
         """
         logger.info(f"[OrderExecutor] {side} 포지션 청산 시도, 수량={quantity:.4f}")
+        if not self._check_qty(f"{side} 청산", quantity):
+            return False
+        button = {"LONG": "close_long_btn", "SHORT": "close_short_btn"}.get(side.upper())
+        outcome = self._submit_by_script("close_tab", "close_qty_input", button, quantity) if button else SUBMIT_NOT_SENT
+        if outcome == SUBMIT_SENT:
+            logger.info(f"[OrderExecutor] {side} 청산 {quantity:.4f} 완료. (script)")
+            self._book(side, -quantity)
+            return True
+        if outcome == SUBMIT_UNKNOWN:
+            return self._resolve_unknown(side, -quantity)
+
         attempt = 0
         success = False
 
         while attempt < MAX_ORDER_RETRY and not success:
             attempt += 1
+            started = time.perf_counter()
 
             if self.risk_manager:
                 self.risk_manager.close_popups()
 
             try:
-                # (1) '포지션 청산' 탭 클릭
-                if self.close_tab:
-                    self.close_tab.click()
+                # (1) '포지션 청산' 탭 클릭 (없으면 건너뜀)
+                self.elements.click("close_tab")
 
                 # (2) 수량 입력창
-                if self.close_qty_input:
-                    self.close_qty_input.clear()
-                    self.close_qty_input.send_keys(str(quantity))
+                self.elements.fill("close_qty_input", self._format_qty(quantity))
 
                 # (3) '롱 청산' / '숏 청산' 버튼
-                if side.upper() == "LONG" and self.close_long_btn:
-                    self.close_long_btn.click()
-                elif side.upper() == "SHORT" and self.close_short_btn:
-                    self.close_short_btn.click()
-                else:
+                if not button or not self.elements.click(button):
                     logger.warning("[OrderExecutor] 올바른 side가 아니거나 청산 버튼 없음.")
                     return False
 
                 # (4) 주문 확인 모달 처리
                 self._handle_order_confirm_modal(side, is_close=True)
 
+                self._record_latency("clicks", time.perf_counter() - started)
                 logger.info(f"[OrderExecutor] {side} 청산 {quantity:.4f} 완료.")
+                self._book(side, -quantity)
                 success = True
 
             except (TimeoutException, ElementClickInterceptedException, NoSuchElementException) as e:
@@ -183,35 +313,120 @@ class OrderExecutor:
         - 이후 모달이 안 뜰 수도 있으므로, 실패해도 그냥 스킵
         """
         try:
-            modal_xpath = (
-                '//div[contains(@class,"ant-modal-content")]'
-                '//div[@class="ant-modal-title" and contains(text(),"주문 확인")]'
-            )
-            confirm_btn_xpath = (
-                '//div[@class="ForcedReminder_buttonWrapper__p_dYb"]'
-                '//button[contains(@class,"ant-btn-primary")]'
-            )
-
             # 모달이 매우 짧게 뜨고 사라질 수 있으므로, 짧게만 검사
             modal = WebDriverWait(self.driver, 0.1).until(
-                EC.visibility_of_element_located((By.XPATH, modal_xpath))
+                EC.visibility_of_element_located((By.XPATH, CONFIRM_MODAL_XPATH))
             )
 
             # '더 이상 표시하지 않기' 체크 등은 생략
-            confirm_btn = modal.find_element(By.XPATH, confirm_btn_xpath)
+            confirm_btn = modal.find_element(By.XPATH, CONFIRM_BUTTON_XPATH)
             confirm_btn.click()
             logger.debug("[OrderExecutor] 주문 확인 모달 확인 버튼 클릭.")
         except:
             # 모달 안 뜨면 그냥 스킵
             pass
 
-    def _find_element_quick(self, xpath: str):
+    # -----------------------------------------------------
+    # [단일 스크립트 주문] WebDriver 왕복 1회
+    # -----------------------------------------------------
+    def _submit_by_script(self, tab_key, input_key, button_key, quantity) -> str:
+        """
+        ORDER_SCRIPT로 탭 선택~확인 모달까지 한 번에 처리.
+        - SUBMIT_SENT: 주문 버튼이 눌림
+        - SUBMIT_NOT_SENT: 스크립트가 버튼을 누르기 전 단계에서 실패를 보고 => 기존 클릭 경로로 재시도
+        - SUBMIT_UNKNOWN: execute_async_script 예외 (스크립트 타임아웃, WebDriver 연결 끊김 등).
+          버튼 클릭 뒤 확인 모달을 기다리다 난 예외일 수 있으므로 클릭 경로로 다시 보내지 않음
+          (호출부가 _resolve_unknown()으로 실제 포지션을 읽어 체결 여부 판정)
+        """
+        if self.submit_mode != "script":
+            return SUBMIT_NOT_SENT
+        self.submits += 1
+        if self.compare_every and self.submits % self.compare_every == 0:
+            logger.debug(f"[OrderExecutor] 지연 비교용 클릭 경로 주문 ({self.submits}번째)")
+            return SUBMIT_NOT_SENT
+
+        xpath = lambda key: self.elements.locators[key][1]
+        started = time.perf_counter()
+        try:
+            result = self.driver.execute_async_script(
+                ORDER_SCRIPT, xpath(tab_key), xpath(input_key), xpath(button_key),
+                self._format_qty(quantity), CONFIRM_MODAL_XPATH, CONFIRM_BUTTON_XPATH, 100
+            )
+        except Exception as e:
+            logger.error(f"[OrderExecutor] 스크립트 주문 도중 예외 => 전송 여부 불명, 재전송하지 않음: {e}")
+            return SUBMIT_UNKNOWN
+        elapsed = time.perf_counter() - started
+
+        result = result or {}
+        if not result.get("ok"):
+            logger.warning(
+                f"[OrderExecutor] 스크립트 주문 실패 => 클릭 경로로 재시도: "
+                f"{result.get('error')} (단계 {result.get('steps')})"
+            )
+            return SUBMIT_NOT_SENT
+
+        self._record_latency("script", elapsed)
+        logger.debug(f"[OrderExecutor] 스크립트 주문 {elapsed * 1000:.1f}ms, 단계 {result.get('steps')}")
+        if result.get("error"):
+            logger.warning(f"[OrderExecutor] 주문 버튼 클릭 후 오류(주문은 전송됨): {result['error']}")
+        return SUBMIT_SENT
+
+    def _resolve_unknown(self, side: str, delta: float) -> bool:
         """
-        WebDriverWait 대신 즉시 한 번 시도해보고,
-        실패하면 None 반환 (지연 최소화).
+        전송 여부가 불명인 주문(delta: 오픈 +수량, 청산 -수량)의 체결 여부를 실제 포지션으로 판정.
+        - 주문 전 예상 수량(held)과 체결 시 예상 수량(held + delta) 중 다시 읽은 수량에 더 가까운 쪽
+          (청산 요청은 최소 그 수량을 보유했다는 뜻이므로 held는 청산 수량 이상으로 봄)
+        - 체결이면 True => 호출부(TradingStrategy)가 포지션 상태를 갱신해 거래소와 어긋나지 않음
+        - 포지션을 읽을 수 없으면 False (다음 조회에서 다시 맞춤)
         """
+        side = side.upper()
+        tracker = getattr(self.risk_manager, "position_tracker", None)
+        if tracker is None or side not in self.expected_size:
+            logger.warning("[OrderExecutor] 포지션 조회 수단 없음 => 전송 여부 불명 주문을 실패로 처리")
+            return False
         try:
-            return self.driver.find_element(By.XPATH, xpath)
-        except (NoSuchElementException, ElementClickInterceptedException, TimeoutException):
-            return None
-        
\ No newline at end of file
+            tracker.wait_positions_stable(1.0)
+            positions = tracker.get_open_positions()
+        except Exception as e:
+            logger.warning(f"[OrderExecutor] 포지션 재확인 실패 => 실패로 처리: {e}")
+            return False
+
+        actual = {s: 0.0 for s in self.expected_size}
+        for pos in positions:
+            pos_side = pos.get("positionSide", "").upper()
+            if pos_side in actual:
+                actual[pos_side] += pos.get("size", 0.0)
+
+        held = self.expected_size[side] if delta > 0 else max(self.expected_size[side], -delta)
+        target = max(0.0, held + delta)
+        filled = abs(actual[side] - target) < abs(actual[side] - held)
+        self.expected_size.update(actual)
+        logger.warning(
+            f"[OrderExecutor] 전송 여부 불명 주문 판정: {side} 예상 {held:g} => {target:g}, "
+            f"실제 {actual[side]:g} => {'체결' if filled else '미체결'}"
+        )
+        return filled
+
+    def _record_latency(self, path, elapsed):
+        self.latency[path].append(elapsed)
+        ORDER_LATENCY.labels(path).observe(elapsed)
+
+    def log_latency(self):
+        """주문 경로별 소요 시간과 (둘 다 기록이 있으면) 절감률 출력."""
+        means = {}
+        for path, samples in self.latency.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            means[path] = sum(ordered) / len(ordered)
+            logger.info(
+                f"[OrderExecutor] {path} 경로: {len(ordered)}회, 평균 {means[path] * 1000:.1f}ms, "
+                f"p50 {ordered[len(ordered) // 2] * 1000:.1f}ms, 최대 {ordered[-1] * 1000:.1f}ms"
+            )
+        if "script" in means and "clicks" in means:
+            saving = 1 - means["script"] / means["clicks"]
+            logger.info(f"[OrderExecutor] 스크립트 경로 절감: 주문당 평균 {saving * 100:.0f}% "
+                        f"({(means['clicks'] - means['script']) * 1000:.1f}ms)")
+        elif means:
+            logger.info(f"[OrderExecutor] 절감률 비교 불가: 한 경로만 기록됨 "
+                        f"(ORDER_LATENCY_COMPARE_EVERY={self.compare_every})")
@@ -0,0 +1,359 @@
+# core/pipeline.py
+
+import math
+import multiprocessing as mp
+import os
+import time
+from datetime import datetime
+from loguru import logger
+from config.config import LOCAL_BAR_INTERVAL, KLINE_VERIFY_SEC, KLINE_CACHE_DIR, CONTRACT_SPEC_TTL_SEC
+from core.contract_spec import ContractSpecCache
+from core.shm_ring import ShmRing, ShmState, TICK_RECORD, COMMAND_RECORD, RESULT_RECORD
+
+"""
+멀티 프로세스 배포 모드:
+  [피드 프로세스] --틱 링--> [전략 프로세스] --명령 링--> [실행기 프로세스]
+                                  ^------- 결과 링 / 공유 상태 -------'
+
+- 각 프로세스는 자기 GIL을 가지므로 Selenium(실행기), HTTP/JSON(피드), 전략 계산이 서로 막지 않음
+- 링 버퍼는 고정 레이아웃 레코드(core/shm_ring.py)만 주고받음
+- 전략 프로세스는 주문을 명령 링에 넣고 바로 반환(낙관적 성공) => 실행기가 바빠도 틱→결정 지연 불변
+- 휴식(pause) 상태는 실행기 프로세스의 RiskManager가 계산해 공유 상태(ShmState)로 전달
+"""
+
+SIDES = ("LONG", "SHORT")
+TRADE_TYPES = (
+    "LONG50", "SHORT50", "HEDGE_LONG", "HEDGE_SHORT",
+    "LONG50_CLOSED", "SHORT50_CLOSED", "LONG_ALL_CLOSED", "SHORT_ALL_CLOSED",
+)
+
+KIND_OPEN, KIND_CLOSE, KIND_RECORD, KIND_VOLUME, KIND_PNL = range(5)
+
+# 링이 비었을 때 대기 시간(초)
+IDLE_SLEEP = 0.0005
+# 기록성 명령(거래량/실현손익/매매 기록)이 가득 찬 명령 링에 들어갈 때까지 재시도하는 최대 시간(초)
+RECORD_PUSH_RETRY_SEC = 0.05
+
+
+# ----------------------------------------------------------------
+# 전략 프로세스 쪽 대리 객체 (실제 Selenium 객체는 실행기 프로세스에만 존재)
+# ----------------------------------------------------------------
+class RingOrderExecutor:
+    """OrderExecutor 대리: 주문을 명령 링에 넣고 즉시 True 반환."""
+
+    def __init__(self, commands: ShmRing, strategy):
+        self.commands = commands
+        self.strategy = strategy
+        self.seq = 0
+
+    def _push(self, kind, side, quantity) -> bool:
+        self.seq += 1
+        ok = self.commands.push(
+            self.seq, time.time(), kind, SIDES.index(side.upper()), quantity, self.strategy.current_price
+        )
+        if not ok:
+            logger.error("[Pipeline] 명령 링 가득 참 => 주문 실패 처리")
+        return ok
+
+    def place_market_order(self, side: str, quantity: float) -> bool:
+        return self._push(KIND_OPEN, side, quantity)
+
+    def close_position(self, side: str, quantity: float) -> bool:
+        return self._push(KIND_CLOSE, side, quantity)
+
+
+class _RecordWriter:
+    """
+    기록성 명령 전송. 버리면 실행기 쪽 누적 거래량/실현손익/매매 기록이 어긋나므로
+    명령 링이 가득 차면 RECORD_PUSH_RETRY_SEC 동안 재시도하고, 그래도 실패하면 dropped에 집계 + 오류 로그.
+    """
+
+    def __init__(self, commands: ShmRing):
+        self.commands = commands
+        self.dropped = 0
+
+    def _push_record(self, what, kind, code, a, b) -> bool:
+        deadline = time.monotonic() + RECORD_PUSH_RETRY_SEC
+        while not self.commands.push(0, time.time(), kind, code, a, b):
+            if time.monotonic() >= deadline:
+                self.dropped += 1
+                logger.error(f"[Pipeline] 명령 링 가득 참 => {what} 기록 유실 (누적 {self.dropped}건)")
+                return False
+            time.sleep(IDLE_SLEEP)
+        return True
+
+
+class RemotePositionTracker(_RecordWriter):
+    """PositionTracker 대리: 거래량/실현손익 누적을 실행기 프로세스로 전달."""
+
+    def add_trade_volume(self, volume_usdt: float):
+        self._push_record("거래량", KIND_VOLUME, 0, volume_usdt, 0.0)
+
+    def add_realized_pnl(self, pnl: float):
+        self._push_record("실현손익", KIND_PNL, 0, pnl, 0.0)
+
+
+class RemoteRiskManager(_RecordWriter):
+    """RiskManager 대리: 매매 기록은 실행기 프로세스로 전달, 휴식 여부는 공유 상태에서 읽음."""
+
+    def __init__(self, commands: ShmRing, state: ShmState):
+        super().__init__(commands)
+        self.state = state
+
+    def record_trade(self, trade_type: str, last_entry_price: float = None, close_price: float = None):
+        self._push_record(
+            f"매매({trade_type})", KIND_RECORD, TRADE_TYPES.index(trade_type),
+            last_entry_price or 0.0, close_price or 0.0
+        )
+
+    def is_paused(self) -> bool:
+        return time.time() < self.state.get("pause_until")
+
+
+# ----------------------------------------------------------------
+# 프로세스 진입점 (spawn 방식에서도 동작하도록 모듈 최상위 함수)
+# ----------------------------------------------------------------
+def _feed_process(symbol, names, stop_event):
+    from core.websocket_feed import MexcRestPollingFeed
+    from core.bar_builder import BarBuilder
+
+    ticks = ShmRing(names["tick"], TICK_RECORD)
+    counters = {"seq": 0, "dropped": 0}
+
+    def on_data(data_dict):
+        price = data_dict.get("lastPrice")
+        if price is None:
+            return
+        bars = data_dict.get("bars", [])
+        bar_close = bars[-1].close if bars else math.nan
+        counters["seq"] += 1
+        if not ticks.push(counters["seq"], time.time(), float(price), bar_close):
+            counters["dropped"] += 1
+            logger.warning(f"[Pipeline] 틱 링 가득 참 => 틱 버림 (누적 {counters['dropped']})")
+
+    feed = MexcRestPollingFeed(
+        symbol=symbol,
+        on_data_callback=on_data,
+        poll_interval=0.5,
+        kline_interval="Min1",
+        bar_builder=BarBuilder(interval=LOCAL_BAR_INTERVAL) if LOCAL_BAR_INTERVAL else None,
+        kline_verify_sec=KLINE_VERIFY_SEC
+    )
+    feed.start()
+    stop_event.wait()
+    feed.stop()
+    ticks.close()
+
+
+def _strategy_process(symbol, user_seed, names, stop_event):
+    from core.strategy import TradingStrategy
+
+    ticks = ShmRing(names["tick"], TICK_RECORD)
+    commands = ShmRing(names["command"], COMMAND_RECORD)
+    results = ShmRing(names["result"], RESULT_RECORD)
+    state = ShmState(names["state"])
+
+    strategy = TradingStrategy(
+        symbol=symbol,
+        position_tracker=RemotePositionTracker(commands),
+        risk_manager=RemoteRiskManager(commands, state)
+    )
+    strategy.set_order_executor(RingOrderExecutor(commands, strategy))
+    strategy.set_user_seed(user_seed)
+    # 부모가 미리 받아 둔 디스크 캐시를 읽음 => 실행기와 같은 수량 단위로 주문 수량 계산
+    strategy.set_contract_specs(_contract_specs())
+
+    latency_sum, latency_max, latency_n = 0.0, 0.0, 0
+    last_report = time.time()
+
+    while not stop_event.is_set():
+        tick = ticks.pop()
+
+        # 실행기(브라우저 로그인/설정)가 준비되기 전 틱은 버림 (단일 프로세스 모드와 동일하게
+        # 준비 완료 후부터 매매)
+        if tick is not None and not state.get("executor_ready"):
+            continue
+
+        if tick is None:
+            # 실행 결과 확인 (실패한 주문만 로그)
+            result = results.pop()
+            while result is not None:
+                seq, _, success, elapsed = result
+                if not success:
+                    logger.warning(f"[Pipeline] 주문 #{seq} 실행 실패 (소요 {elapsed:.3f}s)")
+                result = results.pop()
+            time.sleep(IDLE_SLEEP)
+            continue
+
+        _, received_at, price, bar_close = tick
+        strategy.on_new_price(price, candle_closed=not math.isnan(bar_close))
+
+        latency = time.time() - received_at
+        latency_sum += latency
+        latency_max = max(latency_max, latency)
+        latency_n += 1
+        if time.time() - last_report >= 60:
+            logger.info(
+                f"[Pipeline] 틱→결정 지연: 평균 {latency_sum / latency_n * 1000:.3f}ms, "
+                f"최대 {latency_max * 1000:.3f}ms ({latency_n}틱), 대기 명령 {len(commands)}개"
+            )
+            latency_sum, latency_max, latency_n = 0.0, 0.0, 0
+            last_report = time.time()
+
+    for ring in (ticks, commands, results):
+        ring.close()
+    state.close()
+
+
+def _executor_process(symbol, user_seed, names, stop_event):
+    from web_selenium.browser_stealth import BrowserStealth, set_cross_and_leverage_50
+    from core.order_executor import OrderExecutor
+    from core.position_tracker import PositionTracker
+    from core.risk_manager import RiskManager
+
+    commands = ShmRing(names["command"], COMMAND_RECORD)
+    results = ShmRing(names["result"], RESULT_RECORD)
+    state = ShmState(names["state"])
+
+    # 브라우저 초기화 + 로그인 + 심볼/교차/레버리지 설정 (main.main과 동일 순서)
+    stealth = BrowserStealth()
+    driver = stealth.init_driver()
+    stealth.login_mexc(driver)
+    stealth.go_to_usdt_m_futures(driver)
+
+    risk_manager = RiskManager(driver=driver, position_tracker=None, user_seed=user_seed)
+    risk_manager.close_popups()
+    stealth.select_symbol(driver, symbol)
+    set_cross_and_leverage_50(driver)
+    stealth.set_futures_unit_coin(driver, symbol)
+    risk_manager.close_popups()
+
+    position_tracker = PositionTracker(symbol=symbol, driver=driver)
+    position_tracker.set_initial_balance()
+    risk_manager.position_tracker = position_tracker
+    order_executor = OrderExecutor(driver, symbol=symbol, risk_manager=risk_manager,
+                                   contract_specs=_contract_specs())
+    position_tracker.temp_order_executor = order_executor
+    position_tracker.close_all_positions()
+    state.set("executor_ready", 1.0)
+    logger.info("[Pipeline] 실행기 준비 완료 => 매매 시작")
+
+    last_housekeeping = 0.0
+    last_session_check = time.time()
+    last_reset_date = None
+
+    try:
+        while not stop_event.is_set():
+            cmd = commands.pop()
+            if cmd is None:
+                now = time.time()
+                # 유휴 시간에만 팝업 닫기 / 목표 거래량 체크 / 세션 체크 / 15:00 리셋
+                if now - last_housekeeping >= 1.0:
+                    risk_manager.close_popups()
+                    risk_manager.check_volume_goal_and_sleep()
+                    last_housekeeping = now
+                if now - last_session_check >= 5.0:
+                    risk_manager.check_session_and_relogin()
+                    last_session_check = now
+                today = datetime.now()
+                if today.hour == 15 and last_reset_date != today.date():
+                    position_tracker._accumulated_volume = 0.0
+                    position_tracker._realized_pnl = 0.0
+                    last_reset_date = today.date()
+                    logger.info("[Pipeline] 15:00 거래량/손익 초기화.")
+                _publish_state(state, risk_manager, position_tracker, busy=False)
+                time.sleep(IDLE_SLEEP)
+                continue
+
+            state.set("executor_busy", 1.0)
+            seq, _, kind, code, a, b = cmd
+            started = time.time()
+            success = True
+            if kind == KIND_OPEN:
+                success = order_executor.place_market_order(SIDES[code], a)
+            elif kind == KIND_CLOSE:
+                success = order_executor.close_position(SIDES[code], a)
+            elif kind == KIND_RECORD:
+                risk_manager.record_trade(TRADE_TYPES[code], last_entry_price=a, close_price=b)
+            elif kind == KIND_VOLUME:
+                position_tracker.add_trade_volume(a)
+            elif kind == KIND_PNL:
+                position_tracker.add_realized_pnl(a)
+
+            if kind in (KIND_OPEN, KIND_CLOSE):
+                results.push(seq, time.time(), 1 if success else 0, time.time() - started)
+            _publish_state(state, risk_manager, position_tracker, busy=False)
+    finally:
+        logger.info("[Pipeline] 실행기 종료 전, 모든 포지션 강제 청산 시도.")
+        position_tracker.close_all_positions()
+        driver.quit()
+        for ring in (commands, results):
+            ring.close()
+        state.close()
+
+
+def _contract_specs():
+    specs = ContractSpecCache(cache_dir=KLINE_CACHE_DIR, ttl_sec=CONTRACT_SPEC_TTL_SEC)
+    specs.ensure()
+    return specs
+
+
+def _publish_state(state, risk_manager, position_tracker, busy):
+    pause_end = risk_manager.pause_end_time
+    state.set("pause_until", pause_end.timestamp() if pause_end else 0.0)
+    state.set("accumulated_volume", position_tracker.get_accumulated_volume())
+    state.set("realized_pnl", position_tracker.get_realized_pnl())
+    state.set("executor_busy", 1.0 if busy else 0.0)
+
+
+# ----------------------------------------------------------------
+# 실행
+# ----------------------------------------------------------------
+def run_pipeline(symbol: str, user_seed: float, ring_capacity=4096):
+    """
+    피드/전략/실행기를 각각 별도 프로세스로 띄우고, Ctrl+C까지 대기.
+    공유 메모리는 부모 프로세스가 만들고 종료 시 해제.
+    """
+    # 계약 사양은 부모가 한 번 받아 디스크에 저장 => 하위 프로세스는 API 호출 없이 디스크에서 읽음
+    _contract_specs()
+
+    prefix = f"mexc_{os.getpid()}"
+    names = {
+        "tick": f"{prefix}_tick",
+        "command": f"{prefix}_cmd",
+        "result": f"{prefix}_res",
+        "state": f"{prefix}_state",
+    }
+    owned = [
+        ShmRing(names["tick"], TICK_RECORD, ring_capacity, create=True),
+        ShmRing(names["command"], COMMAND_RECORD, ring_capacity, create=True),
+        ShmRing(names["result"], RESULT_RECORD, ring_capacity, create=True),
+        ShmState(names["state"], create=True),
+    ]
+
+    stop_event = mp.Event()
+    processes = [
+        mp.Process(target=_executor_process, args=(symbol, user_seed, names, stop_event), name="executor"),
+        mp.Process(target=_strategy_process, args=(symbol, user_seed, names, stop_event), name="strategy"),
+        mp.Process(target=_feed_process, args=(symbol, names, stop_event), name="feed"),
+    ]
+    for proc in processes:
+        proc.start()
+        logger.info(f"[Pipeline] {proc.name} 프로세스 시작 (pid={proc.pid})")
+
+    try:
+        while all(proc.is_alive() for proc in processes):
+            time.sleep(1)
+        logger.error("[Pipeline] 하위 프로세스가 종료되어 파이프라인을 중단합니다.")
+    except KeyboardInterrupt:
+        logger.info("사용자 Ctrl+C 종료.")
+    finally:
+        stop_event.set()
+        for proc in reversed(processes):
+            proc.join(timeout=30)
+            if proc.is_alive():
+                proc.terminate()
+        for shm in owned:
+            shm.close()
+            shm.unlink()
+        logger.info("=== 파이프라인 종료 ===")
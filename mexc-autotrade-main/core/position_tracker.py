@@ -1,10 +1,30 @@
-import time
 from loguru import logger
 
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import re
+from core.ui_wait import UiWaiter
+
+# Selenium은 DOM 파싱 메서드 안에서만 import (SimPositionTracker/ApiPositionTracker는 브라우저 없이 사용)
+
+# '포지션 청산 가능' 행 (롱/숏 청산 가능 수량)
+CLOSE_AVAILABLE_ROW_XPATH = '//div[contains(@class,"component_closeAvaibleRow__htwY_")]'
+
+# 포지션 표시 안정화: 2프레임 연속 같은 텍스트면 갱신 완료로 봄 (60fps 기준 약 33ms)
+# 타임아웃은 프레임 창보다 충분히 길게 (최소 0.2초) => 실제 안정화 시간이 통계에 잡힘
+POSITIONS_STABLE_FRAMES = 2
+POSITIONS_STABLE_MIN_TIMEOUT = 0.2
+
+# 자산 카드 / 카드 안의 '총 자산' 값 / '미실현 손익' 값
+ASSET_CARD_CSS = 'div._symbol__gridLayoutAssetsCard__wLdUx'
+TOTAL_BALANCE_XPATH = (
+    './/div[contains(@class,"assets_walletRow__")]'
+    '   //div[@class="ant-col assets_walletLabel__w3vaw" and span[text()="총 자산"]]'
+    '/following-sibling::div[@class="ant-col assets_walletVal__7l0C2"]'
+)
+UNREALIZED_PNL_XPATH = (
+    '//div[contains(@class,"assets_pnlItem__")]'
+    '//span[text()="미실현 손익"]/ancestor::span'
+    '//span[contains(@class,"assets_pnl__")]'
+)
 
 class PositionTracker:
     """
@@ -18,6 +38,8 @@ class PositionTracker:
         self._realized_pnl = 0.0
         self.temp_order_executor = None
         self._initial_balance = 0.0
+        # 고정 sleep 대신 조건 대기 (대기 시간 통계는 waiter.log_stats())
+        self.waiter = UiWaiter(driver, name="PositionTracker") if driver is not None else None
 
     def add_trade_volume(self, volume_usdt: float):
         """
@@ -34,6 +56,10 @@ class PositionTracker:
           1) '포지션 청산' 탭 클릭 -> 파싱
           2) 파싱 후, 다시 '포지션 오픈' 탭으로 복귀
         """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
         results = []
         short_amt = 0.0
         long_amt = 0.0
@@ -60,9 +86,8 @@ class PositionTracker:
                 close_tab.click()
 
             # (B) '포지션 청산 가능' 행(롱/숏)에 접근
-            row_xpath = '//div[contains(@class,"component_closeAvaibleRow__htwY_")]'
             row_elem = WebDriverWait(self.driver, 0.1).until(
-                EC.presence_of_element_located((By.XPATH, row_xpath))
+                EC.presence_of_element_located((By.XPATH, CLOSE_AVAILABLE_ROW_XPATH))
             )
 
             # (C) 해당 행 내부의 'div' 2개 가져오기
@@ -116,6 +141,16 @@ class PositionTracker:
 
         return results
 
+    def wait_positions_stable(self, timeout=1.0):
+        """
+        체결 직후 '포지션 청산 가능' 행의 표시가 더 이상 바뀌지 않을 때까지 대기 (최대 timeout초).
+        고정 sleep 후 여러 번 재조회하던 방식 대체.
+        """
+        self.waiter.settled(
+            CLOSE_AVAILABLE_ROW_XPATH, timeout=max(timeout, POSITIONS_STABLE_MIN_TIMEOUT),
+            stable_frames=POSITIONS_STABLE_FRAMES, label="positions"
+        )
+
     def _parse_amount(self, raw_str: str) -> float:
         """
         포지션 수량 문자열에서 숫자만 뽑아 float 변환.
@@ -178,24 +213,21 @@ class PositionTracker:
         """
         자산 카드에서 '총 자산' 항목(예: '175.1783 USDT')을 파싱하여 float 변환.
         """
+        from selenium.webdriver.common.by import By
+
         try:
-            # 1) 자산 카드 자체를 찾아 화면에 보이도록 스크롤
-            asset_card = self.driver.find_element(By.CSS_SELECTOR, 'div._symbol__gridLayoutAssetsCard__wLdUx')
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", asset_card)
-            time.sleep(0.5)  # 필요 시 조정
-
-            # 2) "총 자산"이 들어간 라벨(div) 바로 옆의 값(div)을 찾음
-            #    - XPATH에서 현재 asset_card 아래(.)에서만 검색하도록 '.' prefix 사용
-            row_elem = asset_card.find_element(
-                By.XPATH,
-                './/div[contains(@class,"assets_walletRow__")]'
-                '   //div[@class="ant-col assets_walletLabel__w3vaw" and span[text()="총 자산"]]'
-                '/following-sibling::div[@class="ant-col assets_walletVal__7l0C2"]'
-            )
-            
-            # 3) 텍스트 추출 => 예) "175.1783 USDT"
-            raw_text = row_elem.get_attribute("innerText").strip()
-            # 혹은 row_elem.text.strip() 으로도 가능
+            # 1) 자산 카드 자체를 찾음
+            asset_card = self.driver.find_element(By.CSS_SELECTOR, ASSET_CARD_CSS)
+
+            # 2) 카드를 화면에 보이도록 스크롤한 뒤, "총 자산" 라벨 옆 값(div)의 텍스트가
+            #    2프레임 연속 같아질 때까지 대기 (고정 0.5초 sleep 대체, 왕복 1회)
+            #    - asset_card 아래(.)에서만 검색
+            raw_text = self._read_asset_value(asset_card, TOTAL_BALANCE_XPATH, 0.5, "total_balance")
+            if not raw_text:
+                logger.warning("[PositionTracker] 총 자산 값이 비어 있음")
+                return 0.0
+
+            # 3) 텍스트 => 예) "175.1783 USDT"
 
             # 4) "USDT" 등 문자 제거 후 숫자+소수점만 남김
             balance_str = re.sub(r'[^0-9.]+', '', raw_text)
@@ -216,21 +248,16 @@ class PositionTracker:
         """
         자산 카드에서 '미실현 손익' 값(예: "0.0000 USDT") 파싱
         """
+        from selenium.webdriver.common.by import By
+
         try:
-            asset_card = self.driver.find_element(By.CSS_SELECTOR, 'div._symbol__gridLayoutAssetsCard__wLdUx')
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", asset_card)
-            time.sleep(0.1)
+            asset_card = self.driver.find_element(By.CSS_SELECTOR, ASSET_CARD_CSS)
 
-            pnl_parent = self.driver.find_element(
-                By.XPATH,
-                '//div[contains(@class,"assets_pnlItem__")]'
-                '//span[text()="미실현 손익"]/ancestor::span'
-            )
-            pnl_value_elem = pnl_parent.find_element(
-                By.XPATH,
-                './/span[contains(@class,"assets_pnl__")]'
-            )
-            raw_text = pnl_value_elem.get_attribute("innerText")
+            # 카드 스크롤 + 값 텍스트 안정화 대기 (고정 0.1초 sleep 대체)
+            raw_text = self._read_asset_value(asset_card, UNREALIZED_PNL_XPATH, 0.3, "unrealized_pnl")
+            if not raw_text:
+                logger.warning("[PositionTracker] 미실현 손익 값이 비어 있음")
+                return 0.0
             # 예: "0.0000 USDT\n≈ 0.00 USD"
 
             lines = raw_text.splitlines()
@@ -246,6 +273,20 @@ class PositionTracker:
             logger.warning(f"[PositionTracker] 미실현 손익 파싱 실패: {e}")
             return 0.0
 
+    def _read_asset_value(self, asset_card, xpath, timeout, label) -> str:
+        """
+        자산 카드 값 텍스트. 2프레임 연속 같은 값이 나올 때까지 대기해 읽고,
+        타임아웃(페이지가 느리거나 값이 계속 바뀜)이면 현재 표시값을 한 번 직접 읽음
+        => 대기 실패를 잔고/손익 0으로 취급하지 않음 (기존 sleep 후 읽기와 같은 결과).
+        """
+        from selenium.webdriver.common.by import By
+
+        raw_text = self.waiter.stable_text(xpath, root=asset_card, scroll=True, timeout=timeout, label=label)
+        if raw_text:
+            return raw_text
+        logger.debug(f"[PositionTracker] {label} 안정화 대기 타임아웃({timeout}s) => 현재 값 직접 읽기")
+        return asset_card.find_element(By.XPATH, xpath).text
+
     # --------------------------------------------
     # 3) 초기 자산(시작 자산) 세팅
     # --------------------------------------------
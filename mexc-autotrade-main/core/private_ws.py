@@ -0,0 +1,337 @@
+# core/private_ws.py
+
+import json
+import random
+import threading
+import time
+from collections import deque
+import websocket
+from loguru import logger
+from core.api_position_tracker import ApiPosition, ApiAsset, POSITION_TYPES
+from utils.signer import sign_ws_login
+
+WS_URL = "wss://contract.mexc.com/edge"
+
+# push.personal.position 의 state: 1 보유, 2 시스템 보유, 3 청산됨
+POSITION_CLOSED = 3
+# push.personal.order 의 state: 3 체결 완료, 4 취소, 5 무효
+ORDER_DONE_STATES = (3, 4, 5)
+
+
+class AccountState:
+    """
+    private WebSocket 푸시(주문/체결/포지션/자산)를 반영하는 메모리 내 계좌 상태.
+
+    - 재연결 시 REST 스냅샷(apply_snapshot)으로 끊긴 동안 놓친 변경을 한 번에 덮어씀
+    - snapshot_ts: 스냅샷 기준 서버 시각(ms). 이보다 오래된 푸시는 반영하지 않음 (is_stale)
+    - live: 로그인 + 스냅샷까지 끝나 푸시를 신뢰할 수 있는 상태인지 (끊기면 False)
+    - version: 변경마다 1씩 증가, wait_change()로 다음 변경을 기다릴 수 있음
+    """
+
+    def __init__(self, symbol: str, contract_size: float, max_fills=500):
+        self.symbol = symbol
+        self.contract_size = contract_size
+        self.positions = {}            # side -> ApiPosition
+        self.asset = None              # ApiAsset
+        self.open_orders = {}          # orderId -> 주문 dict (미체결/부분체결)
+        self.fills = deque(maxlen=max_fills)
+        self.live = False
+        self.snapshot_ts = None
+        self.version = 0
+        self.updated_at = 0.0
+        self._cond = threading.Condition()
+        self._listeners = []
+
+    def add_listener(self, func):
+        """func(kind, data) : kind = "order" / "deal" / "position" / "asset" / "snapshot" (WS 스레드에서 호출)"""
+        self._listeners.append(func)
+
+    # ------------------------------------------------------------
+    # 반영
+    # ------------------------------------------------------------
+    def apply_snapshot(self, positions, asset, server_ts=None):
+        """server_ts: 스냅샷 요청 직전의 서버 시각(ms, pong 값). None이면 푸시 시각 검사 안 함."""
+        with self._cond:
+            self.positions = {p.side: p for p in positions if p.symbol == self.symbol}
+            if asset is not None:
+                self.asset = asset
+            self.snapshot_ts = server_ts
+            self.live = True
+            self._changed()
+        self._notify("snapshot", None)
+
+    def on_position(self, data: dict):
+        if data.get("symbol") != self.symbol:
+            return
+        side = POSITION_TYPES.get(data.get("positionType"))
+        if side is None:
+            return
+        contracts = float(data.get("holdVol") or 0)
+        with self._cond:
+            if data.get("state") == POSITION_CLOSED or contracts <= 0:
+                self.positions.pop(side, None)
+            else:
+                self.positions[side] = ApiPosition(
+                    symbol=self.symbol,
+                    side=side,
+                    size=round(contracts * self.contract_size, 10),
+                    contracts=contracts,
+                    entry_price=float(data.get("holdAvgPrice") or data.get("openAvgPrice") or 0),
+                    liquidate_price=float(data.get("liquidatePrice") or 0),
+                    leverage=int(data.get("leverage") or 0),
+                )
+            self._changed()
+        self._notify("position", data)
+
+    def on_asset(self, data: dict):
+        if data.get("currency", "USDT") != "USDT":
+            return
+        with self._cond:
+            self.asset = ApiAsset(
+                currency="USDT",
+                equity=float(data.get("equity") or 0),
+                available=float(data.get("availableBalance") or 0),
+                position_margin=float(data.get("positionMargin") or 0),
+                unrealized=float(data.get("unrealized") or 0),
+            )
+            self._changed()
+        self._notify("asset", data)
+
+    def on_order(self, data: dict):
+        if data.get("symbol") != self.symbol:
+            return
+        with self._cond:
+            if data.get("state") in ORDER_DONE_STATES:
+                self.open_orders.pop(data.get("orderId"), None)
+            else:
+                self.open_orders[data.get("orderId")] = data
+            self._changed()
+        self._notify("order", data)
+
+    def on_deal(self, data: dict):
+        if data.get("symbol") != self.symbol:
+            return
+        with self._cond:
+            self.fills.append(data)
+            self._changed()
+        self._notify("deal", data)
+
+    def is_stale(self, msg: dict) -> bool:
+        """스냅샷 기준 시각보다 먼저 만들어진 푸시인지 (스냅샷을 옛 값으로 덮어쓰지 않도록)."""
+        ts = msg.get("ts")
+        return self.snapshot_ts is not None and ts is not None and ts < self.snapshot_ts
+
+    def mark_stale(self):
+        with self._cond:
+            self.live = False
+
+    def _changed(self):
+        self.version += 1
+        self.updated_at = time.time()
+        self._cond.notify_all()
+
+    def _notify(self, kind, data):
+        for func in self._listeners:
+            try:
+                func(kind, data)
+            except Exception as e:
+                logger.warning(f"[AccountState] listener 오류(무시): {e}")
+
+    # ------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------
+    def get_open_positions(self):
+        """PositionTracker.get_open_positions()와 같은 형식."""
+        with self._cond:
+            return [
+                {"symbol": p.symbol, "positionSide": p.side, "size": p.size}
+                for p in self.positions.values()
+            ]
+
+    def wait_change(self, version: int, timeout: float) -> bool:
+        """version 이후 변경이 생기면 True (timeout초 안에 없으면 False)."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self.version > version, timeout)
+
+
+class PrivateWsClient:
+    """
+    MEXC 선물 private WebSocket 클라이언트 (websocket-client, 별도 스레드).
+
+    연결 1회 흐름:
+      1) 접속 => login (HMAC 서명) => rs.login 확인
+      2) personal.filter로 심볼 구독 범위 지정
+      3) ping => pong까지 받은 푸시는 버림 (스냅샷에 반영될 변경),
+         REST 스냅샷(snapshot_provider)으로 AccountState 덮어씀 => live
+      4) push.personal.* 수신 반영, ping_sec마다 ping
+    끊기거나 로그인이 거부되면 AccountState를 stale로 표시하고 지수 백오프 후 1)부터 다시.
+
+    사용 예)
+        state = AccountState("BTC_USDT", contract_size=0.0001)
+        client = PrivateWsClient(api_key, api_secret, state, snapshot_provider=tracker.snapshot_provider())
+        client.start()
+    """
+
+    def __init__(self, api_key, api_secret, state: AccountState, snapshot_provider=None, url=WS_URL,
+                 ping_sec=15, timeout=5, min_backoff=1.0, max_backoff=30):
+        """
+        snapshot_provider: () -> (positions 목록, ApiAsset) (None이면 스냅샷 없이 푸시만 반영)
+            WS 스레드에서 호출되므로 거래 스레드와 requests.Session을 공유하지 않는 함수여야 함
+            (ApiPositionTracker.snapshot_provider() 사용)
+        url: 테스트 시 로컬 대역 서버 주소로 교체 가능
+        """
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.state = state
+        self.snapshot_provider = snapshot_provider
+        self.url = url
+        self.ping_sec = ping_sec
+        self.timeout = timeout
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+
+        self.ws = None
+        self.connects = 0
+        # 스냅샷보다 오래돼 버린 푸시 수
+        self.dropped_pushes = 0
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._handlers = {
+            "push.personal.order": state.on_order,
+            "push.personal.order.deal": state.on_deal,
+            "push.personal.position": state.on_position,
+            "push.personal.asset": state.on_asset,
+        }
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            logger.warning("[PrivateWsClient] 이미 실행 중.")
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="private-ws")
+        self._thread.start()
+        logger.info("[PrivateWsClient] 스레드 시작.")
+
+    def stop(self):
+        self._stop_event.set()
+        if self.ws:
+            try:
+                self.ws.close()
+            except Exception:
+                pass
+        if self._thread:
+            self._thread.join(timeout=self.timeout)
+        logger.info("[PrivateWsClient] 종료.")
+
+    # ------------------------------------------------------------
+    # 연결 루프
+    # ------------------------------------------------------------
+    def _run(self):
+        backoff = self.min_backoff
+        while not self._stop_event.is_set():
+            try:
+                self._session()
+                backoff = self.min_backoff
+            except Exception as e:
+                if self._stop_event.is_set():
+                    break
+                logger.warning(f"[PrivateWsClient] 연결 끊김/실패: {e!r}")
+            finally:
+                self.state.mark_stale()
+                if self.ws:
+                    try:
+                        self.ws.close()
+                    except Exception:
+                        pass
+                    self.ws = None
+
+            if self._stop_event.is_set():
+                break
+            delay = backoff + random.uniform(0, backoff / 2)
+            logger.info(f"[PrivateWsClient] {delay:.1f}s 후 재연결")
+            self._stop_event.wait(delay)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def _session(self):
+        self.ws = websocket.create_connection(self.url, timeout=self.timeout)
+        self.connects += 1
+        self._login()
+        self._send({"method": "personal.filter", "param": {"filters": [
+            {"filter": "order", "rules": [self.state.symbol]},
+            {"filter": "order.deal", "rules": [self.state.symbol]},
+            {"filter": "position", "rules": [self.state.symbol]},
+            {"filter": "asset"},
+        ]}})
+        self._resync()
+
+        last_ping = time.time()
+        self.ws.settimeout(1.0)
+        while not self._stop_event.is_set():
+            if time.time() - last_ping >= self.ping_sec:
+                self._send({"method": "ping"})
+                last_ping = time.time()
+            try:
+                raw = self.ws.recv()
+            except websocket.WebSocketTimeoutException:
+                continue
+            if not raw:
+                raise ConnectionError("서버가 연결을 닫음")
+            self._dispatch(json.loads(raw))
+
+    def _login(self):
+        self._send({"method": "login", "param": sign_ws_login(self.api_key, self.api_secret)})
+        deadline = time.time() + self.timeout
+        while time.time() < deadline:
+            msg = json.loads(self.ws.recv())
+            if msg.get("channel") == "rs.login":
+                if msg.get("data") != "success":
+                    raise PermissionError(f"로그인 거부: {msg.get('data')}")
+                logger.info(f"[PrivateWsClient] 로그인 성공 (접속 {self.connects}회차)")
+                return
+            if msg.get("channel") == "rs.error":
+                raise PermissionError(f"로그인 오류: {msg.get('data')}")
+        raise TimeoutError("로그인 응답 없음")
+
+    def _resync(self):
+        """
+        끊긴 동안 놓친 변경 복구: REST 스냅샷으로 상태를 덮어씀 (이후 푸시는 스냅샷 위에 반영).
+        스냅샷 요청 전에 pong까지 쌓인 푸시를 비우고, pong의 서버 시각보다 오래된 푸시는 이후에도 버림
+        => 스냅샷보다 먼저 만들어진 푸시가 나중에 반영돼 스냅샷을 옛 값으로 덮어쓰지 않음.
+        """
+        if self.snapshot_provider is None:
+            self.state.apply_snapshot(list(self.state.positions.values()), None)
+            return
+        server_ts = self._drain_until_pong()
+        positions, asset = self.snapshot_provider()
+        if positions is None:
+            raise ConnectionError("REST 스냅샷 실패")
+        self.state.apply_snapshot(positions, asset, server_ts)
+        logger.info(f"[PrivateWsClient] 스냅샷 반영: {self.state.get_open_positions()}")
+
+    def _drain_until_pong(self):
+        """ping을 보내고 pong까지 받은 푸시는 버림. 반환: pong의 서버 시각(ms, 없으면 None)."""
+        self._send({"method": "ping"})
+        deadline = time.time() + self.timeout
+        while time.time() < deadline:
+            msg = json.loads(self.ws.recv())
+            channel = msg.get("channel")
+            if channel == "pong":
+                return msg["data"] if isinstance(msg.get("data"), int) else None
+            if channel in self._handlers:
+                self.dropped_pushes += 1
+        raise TimeoutError("스냅샷 전 pong 응답 없음")
+
+    def _dispatch(self, msg: dict):
+        channel = msg.get("channel")
+        handler = self._handlers.get(channel)
+        if handler:
+            if self.state.is_stale(msg):
+                self.dropped_pushes += 1
+                logger.debug(f"[PrivateWsClient] 스냅샷 이전 푸시 무시: {channel} ts={msg.get('ts')}")
+                return
+            handler(msg.get("data") or {})
+        elif channel == "rs.error":
+            logger.warning(f"[PrivateWsClient] 서버 오류: {msg.get('data')}")
+
+    def _send(self, msg: dict):
+        self.ws.send(json.dumps(msg))
@@ -1,9 +1,13 @@
-import time
 import random
+from collections import deque
 from datetime import datetime, timedelta
 from loguru import logger
-from selenium.webdriver.common.by import By
-from web_selenium.browser_stealth import BrowserStealth, set_cross_and_leverage_50
+from core.clock import SYSTEM_CLOCK
+
+# Selenium/undetected-chromedriver는 브라우저가 실제로 필요한 메서드 안에서만 import
+# (백테스트/시뮬레이션은 브라우저 스택 없이 RiskManager를 그대로 사용)
+
+TRADE_HISTORY_MAX = 1000
 
 class RiskManager:
     """
@@ -17,14 +21,29 @@ class RiskManager:
     - 세션 만료 체크 & 재로그인
     """
 
-    def __init__(self, driver=None, position_tracker=None, user_seed=0.0):
+    def __init__(self, driver=None, position_tracker=None, user_seed=0.0, clock=SYSTEM_CLOCK, rng=None):
+        """
+        clock: 시각/대기 제공자 (시뮬레이션에서는 VirtualClock)
+        rng: 휴식 시간 난수 생성기 (재현 가능한 시뮬레이션용 random.Random(seed))
+        """
         self.driver = driver
+        self.clock = clock
+        self.rng = rng or random
         self.position_tracker = position_tracker
-        self.trade_history = []
-        self.browser_stealth = BrowserStealth()
+        # 최근 매매 기록만 보관 (장기 백테스트/상시 운용에서 메모리가 계속 늘지 않도록)
+        self.trade_history = deque(maxlen=TRADE_HISTORY_MAX)
+        self._browser_stealth = None
 
         self.pause_end_time = None
-        self.last_rest_time = datetime.now()
+        self.last_rest_time = self.clock.now()
+
+        # 휴식 종료를 예약할 스케줄러 (없으면 is_paused()에서 시각 비교)
+        self.scheduler = None
+        self._pause_job = None
+
+        # 재로그인/페이지 이동 시 호출할 콜백 (예: OrderExecutor 요소 캐시 무효화)
+        self._page_change_listeners = []
+        self._last_url = None
 
         self.user_seed = user_seed
         self._daily_base_volume = self._get_base_target_by_seed(user_seed)
@@ -44,11 +63,21 @@ class RiskManager:
     # ----------------------------------------------------
     def _get_base_target_by_seed(self, seed: float) -> float:
         return seed * 1_000
+
+    @property
+    def browser_stealth(self):
+        """재로그인 때 처음 쓰일 때 생성 (undetected-chromedriver import 지연)."""
+        if self._browser_stealth is None:
+            from web_selenium.browser_stealth import BrowserStealth
+            self._browser_stealth = BrowserStealth()
+        return self._browser_stealth
     
     # ----------------------------------------------------
     # 팝업 닫기
     # ----------------------------------------------------
     def close_popups(self):
+        from selenium.webdriver.common.by import By
+
         popup_selectors = [
             "span.ant-modal-close-x",
             "button.ant-modal-close",
@@ -131,19 +160,18 @@ class RiskManager:
         logger.info(f"[RiskManager] 누적 거래량: {current_volume:.2f} / {self.daily_volume_target:.2f}")
 
     # ----------------------------------------------------
-    # 포지션 여러 번 재조회하여 최종 상태 파악
+    # 포지션 표시가 안정될 때까지 기다린 뒤 최종 상태 파악
     # ----------------------------------------------------
     def _get_stable_positions(self, tries=3, delay=0.1):
-        final_positions = []
+        """
+        예전에는 delay초 간격으로 tries번 재조회했으나, 이제는 포지션 표시가 멈출 때까지
+        최대 delay*(tries-1)초 조건 대기 후 1번만 조회.
+        """
         if not self.position_tracker:
-            return final_positions
+            return []
 
-        for i in range(tries):
-            pos = self.position_tracker.get_open_positions()
-            final_positions = pos
-            if i < tries - 1:
-                time.sleep(delay)
-        return final_positions
+        self.position_tracker.wait_positions_stable(timeout=delay * (tries - 1))
+        return self.position_tracker.get_open_positions()
 
     def _force_close_leftovers(self):
         """
@@ -154,7 +182,7 @@ class RiskManager:
             return
         logger.info("[RiskManager] leftover 전량 청산 시도.")
         self.position_tracker.close_all_positions()
-        time.sleep(0.1)
+        # 청산 반영 대기는 이어지는 _get_stable_positions()가 조건 대기로 처리
 
     # ----------------------------------------------------
     # 매매 기록 + 휴식 조건 체크
@@ -229,7 +257,7 @@ class RiskManager:
                     return
 
         # (3) 90분 무휴식 => 무포 시 휴식
-        now = datetime.now()
+        now = self.clock.now()
         if (now - self.last_rest_time) >= timedelta(minutes=90):
             if long_size == 0 and short_size == 0:
                 logger.info("=== 90분 무휴식 & 무포 => 10~15분 휴식 ===")
@@ -248,7 +276,7 @@ class RiskManager:
         if not self.position_tracker:
             return
 
-        now = datetime.now()
+        now = self.clock.now()
         if now.hour >= 15:
             return
 
@@ -264,10 +292,16 @@ class RiskManager:
     # ----------------------------------------------------
     # 휴식/재개 로직
     # ----------------------------------------------------
+    def set_scheduler(self, scheduler):
+        self.scheduler = scheduler
+
     def is_paused(self) -> bool:
         if self.pause_end_time is None:
             return False
-        now = datetime.now()
+        if self.scheduler:
+            # 종료 시각에 스케줄러가 _end_pause()로 해제
+            return True
+        now = self.clock.now()
         if now >= self.pause_end_time:
             self.pause_end_time = None
             return False
@@ -295,9 +329,8 @@ class RiskManager:
                 logger.info("[RiskManager] 휴식 돌입 전 leftover 포지션 발견 => 전량 청산 시도.")
                 self.position_tracker.close_all_positions()
 
-        sleep_seconds = random.randint(600, 900)  # 10~15분
-        self.pause_end_time = datetime.now() + timedelta(seconds=sleep_seconds)
-        self.last_rest_time = datetime.now()
+        sleep_seconds = self.rng.randint(600, 900)  # 10~15분
+        self._start_pause(self.clock.now() + timedelta(seconds=sleep_seconds))
         logger.info(
             f"=== 휴식 시작: {sleep_seconds // 60}분 후({self.pause_end_time.strftime('%H:%M:%S')}) 매매 재개 예정 ==="
         )
@@ -314,9 +347,9 @@ class RiskManager:
                 logger.info("[RiskManager] 휴식 돌입 전 leftover 포지션 발견 => 전량 청산 시도.")
                 self.position_tracker.close_all_positions()
 
-        now = datetime.now()
-        random_minute = random.randint(0, 59)
-        random_second = random.randint(0, 59)
+        now = self.clock.now()
+        random_minute = self.rng.randint(0, 59)
+        random_second = self.rng.randint(0, 59)
         target_time = datetime(now.year, now.month, now.day, 15, random_minute, random_second)
 
         if target_time < now:
@@ -327,22 +360,56 @@ class RiskManager:
         if target_time.hour > 16:
             target_time = datetime(now.year, now.month, now.day, 16, 0, 0)
 
-        self.pause_end_time = target_time
-        self.last_rest_time = datetime.now()
+        self._start_pause(target_time)
         wait_min = int((target_time - now).total_seconds() // 60)
         logger.info(
             f"=== 목표 거래량 120% 달성 => {target_time.strftime('%H:%M:%S')}까지 휴식 (약 {wait_min}분) ==="
         )
 
+    def _start_pause(self, end_time: datetime):
+        self.pause_end_time = end_time
+        self.last_rest_time = self.clock.now()
+        if not self.scheduler:
+            return
+        if self._pause_job is None:
+            self._pause_job = self.scheduler.at(end_time.timestamp(), self._end_pause, name="pause_expiry")
+        else:
+            self.scheduler.reschedule(self._pause_job, end_time.timestamp())
+
+    def _end_pause(self):
+        self.pause_end_time = None
+        logger.info("=== 휴식 종료: 매매 재개 ===")
+
     # ----------------------------------------------------
     # 세션 만료 -> 재로그인
     # ----------------------------------------------------
+    def add_page_change_listener(self, callback):
+        self._page_change_listeners.append(callback)
+
+    def _notify_page_change(self, reason: str):
+        logger.info(f"[RiskManager] 페이지 변경 감지({reason}) => 캐시된 요소 무효화")
+        for callback in self._page_change_listeners:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"[RiskManager] 페이지 변경 콜백 실패(무시): {e}")
+
     def check_session_and_relogin(self):
         if not self.driver:
             return
         current_url = self.driver.current_url
         if "login" in current_url.lower():
+            from web_selenium.browser_stealth import set_cross_and_leverage_50
+
             logger.warning("[RiskManager] 세션 만료 감지 => 재로그인 시도")
             self.browser_stealth.login_mexc(self.driver)
-            time.sleep(1)
+            self.clock.sleep(1)
             set_cross_and_leverage_50(self.driver)
+            self._last_url = None
+            self._notify_page_change("재로그인")
+            return
+
+        # 세션 체크에서 이미 읽은 URL로 페이지 이동 감지 (추가 WebDriver 호출 없음)
+        if self._last_url is not None and current_url != self._last_url:
+            self._notify_page_change("페이지 이동")
+        self._last_url = current_url
@@ -0,0 +1,138 @@
+# core/sampling_profiler.py
+
+import math
+import os
+import signal
+import sys
+import threading
+import time
+from datetime import datetime
+from loguru import logger
+from core.metrics import BadRequest
+
+# HTTP로 요청할 수 있는 최대 샘플링 길이(초), 넘으면 이 값으로 줄임
+MAX_HTTP_SECONDS = 600.0
+
+
+def _frame_label(code) -> str:
+    return f"{os.path.basename(code.co_filename)}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+class SamplingProfiler:
+    """
+    실행 중인 봇의 모든 스레드 스택을 주기적으로 샘플링해 flamegraph용 collapsed-stack 파일로 저장.
+
+    - start(seconds)로 켜면 샘플러 스레드 1개가 hz 간격으로 sys._current_frames()를 읽음
+      (피드 스레드, 스케줄러 메인 루프, Selenium 스레드 등 전부 포함)
+    - seconds가 지나면 자동 종료 후 profiles/stacks_YYYYmmdd_HHMMSS.txt 기록
+      형식: "스레드명;파일:함수;파일:함수 ... 샘플수" (flamegraph.pl, speedscope에서 바로 열림)
+    - 꺼져 있을 때는 스레드/훅이 없으므로 오버헤드 0
+
+    켜는 방법:
+      - 시그널: install_signal() 후 kill -USR1 <pid> (Windows는 Ctrl+Break)
+      - 로컬 HTTP: MetricsServer에 /profile 경로 등록 후 GET /profile?seconds=30
+    """
+
+    def __init__(self, hz=200, output_dir="profiles"):
+        self.interval = 1.0 / hz
+        self.output_dir = output_dir
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._signal_event = threading.Event()
+        self.last_output = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, seconds=30.0) -> bool:
+        if self.running:
+            logger.warning("[SamplingProfiler] 이미 샘플링 중.")
+            return False
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, args=(seconds,), daemon=True, name="sampling-profiler")
+        self._thread.start()
+        logger.info(f"[SamplingProfiler] {seconds:g}초 샘플링 시작 ({1 / self.interval:.0f}Hz)")
+        return True
+
+    def stop(self):
+        """진행 중인 샘플링을 일찍 끝내고 지금까지의 결과를 기록."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def _run(self, seconds):
+        own_id = threading.get_ident()
+        stacks = {}
+        samples = 0
+        deadline = time.perf_counter() + seconds
+        while not self._stop_event.is_set() and time.perf_counter() < deadline:
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                labels = []
+                while frame is not None:
+                    labels.append(_frame_label(frame.f_code))
+                    frame = frame.f_back
+                labels.append(names.get(thread_id, str(thread_id)))
+                key = ";".join(reversed(labels))
+                stacks[key] = stacks.get(key, 0) + 1
+            samples += 1
+            self._stop_event.wait(self.interval)
+        self._write(stacks, samples)
+
+    def _write(self, stacks, samples):
+        os.makedirs(self.output_dir, exist_ok=True)
+        stem = os.path.join(self.output_dir, f"stacks_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        path, n = f"{stem}.txt", 1
+        while os.path.exists(path):
+            path, n = f"{stem}_{n}.txt", n + 1
+        with open(path, "w", encoding="utf-8") as f:
+            for key, count in sorted(stacks.items(), key=lambda item: -item[1]):
+                f.write(f"{key.replace(' ', '_')} {count}\n")
+        self.last_output = path
+        logger.info(f"[SamplingProfiler] 샘플 {samples}회, 스택 {len(stacks)}종 => {path}")
+
+    # ------------------------------------------------------------
+    # 켜는 방법
+    # ------------------------------------------------------------
+    def install_signal(self, seconds=30.0):
+        """
+        SIGUSR1(Windows: SIGBREAK = Ctrl+Break) 수신 시 seconds초 샘플링. 메인 스레드에서 호출.
+        핸들러는 메인 스레드의 임의 지점(로그 출력 도중 포함)에서 끼어들어 실행되므로 Event만 세우고,
+        start()와 로그 출력은 대기 스레드가 처리 (loguru 락 재진입으로 인한 교착 방지).
+        """
+        signum = getattr(signal, "SIGUSR1", None) or getattr(signal, "SIGBREAK", None)
+        if signum is None:
+            logger.warning("[SamplingProfiler] 사용할 수 있는 시그널 없음 => HTTP 제어만 사용")
+            return
+        threading.Thread(target=self._wait_signal, args=(seconds,), daemon=True,
+                         name="sampling-profiler-signal").start()
+        signal.signal(signum, lambda *_: self._signal_event.set())
+        logger.info(f"[SamplingProfiler] 시그널 {signal.Signals(signum).name} 수신 시 {seconds:g}초 샘플링")
+
+    def _wait_signal(self, seconds):
+        while True:
+            self._signal_event.wait()
+            self._signal_event.clear()
+            self.start(seconds)
+
+    def http_handler(self, default_seconds=30.0):
+        """
+        MetricsServer.add_route("/profile", ...)용 핸들러. ?seconds=N 으로 길이 지정.
+        숫자가 아니거나 0 이하/nan/inf면 400, MAX_HTTP_SECONDS를 넘으면 MAX_HTTP_SECONDS로 줄임.
+        """
+        def handle(query):
+            raw = query.get("seconds", [default_seconds])[0]
+            try:
+                seconds = float(raw)
+            except ValueError:
+                raise BadRequest(f"seconds must be a number: {raw!r}")
+            if not math.isfinite(seconds) or seconds <= 0:
+                raise BadRequest(f"seconds must be a positive finite number: {raw!r}")
+            seconds = min(seconds, MAX_HTTP_SECONDS)
+            if self.start(seconds):
+                return f"started {seconds:g}s, previous output: {self.last_output}\n"
+            return f"already running, previous output: {self.last_output}\n"
+        return handle
@@ -0,0 +1,247 @@
+# core/scheduler.py
+
+import heapq
+import itertools
+import os
+import threading
+from datetime import datetime, timedelta
+from loguru import logger
+from core.clock import SYSTEM_CLOCK
+
+# 예정 시각보다 이만큼(초) 이상 늦게 실행되면 경고
+LATE_WARNING_SEC = 1.0
+
+
+class Job:
+    """스케줄러에 등록된 작업 1개 + 실행 통계."""
+
+    def __init__(self, name, func, interval_sec=None, daily_at=None):
+        self.name = name
+        self.func = func
+        self.interval_sec = interval_sec   # 주기 작업
+        self.daily_at = daily_at           # (hour, minute) 매일 작업
+        self.deadline = None
+        self.cancelled = False
+
+        # 통계
+        self.runs = 0
+        self.failures = 0
+        self.total_duration = 0.0
+        self.max_duration = 0.0
+        self.max_lateness = 0.0
+        self.last_lateness = 0.0
+
+    def record(self, duration, lateness):
+        self.runs += 1
+        self.total_duration += duration
+        self.max_duration = max(self.max_duration, duration)
+        self.max_lateness = max(self.max_lateness, lateness)
+        self.last_lateness = lateness
+
+
+class Scheduler:
+    """
+    힙(min-heap) 기반 작업 스케줄러.
+
+    - 작업마다 정확한 실행 시각(deadline)을 등록하고, 가장 이른 deadline까지만 대기
+      => 할 일이 없을 때는 깨어나지 않음 (고정 5초 루프 대체)
+    - 다른 스레드에서 작업을 추가/취소하면 대기 중인 루프를 즉시 깨움
+    - 작업별 실행 시간/지연(lateness) 통계를 report()로 출력
+
+    사용 예)
+        scheduler = Scheduler()
+        scheduler.every(60, write_log, name="minute_log")
+        scheduler.daily_at(15, 0, reset, name="daily_reset")
+        scheduler.run_forever()
+    """
+
+    def __init__(self, clock=SYSTEM_CLOCK):
+        """clock: SystemClock 또는 VirtualClock (시뮬레이션에서는 run_until()로 진행)"""
+        self.clock = clock
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self.jobs = []
+        # Windows에서는 타임아웃 대기 중 Ctrl+C가 전달되지 않으므로 최대 1초 단위로 끊어서 대기
+        self.max_wait = 1.0 if os.name == "nt" else None
+
+    # ------------------------------------------------------------
+    # 작업 등록
+    # ------------------------------------------------------------
+    def every(self, interval_sec: float, func, name=None, first_delay=None) -> Job:
+        """interval_sec마다 실행 (첫 실행은 first_delay 후, 기본 interval_sec 후)."""
+        job = Job(name or func.__name__, func, interval_sec=interval_sec)
+        delay = interval_sec if first_delay is None else first_delay
+        return self._add(job, self.clock.time() + delay)
+
+    def daily_at(self, hour: int, minute: int, func, name=None) -> Job:
+        """매일 hour:minute(로컬 시각)에 실행."""
+        job = Job(name or func.__name__, func, daily_at=(hour, minute))
+        return self._add(job, self._next_daily(job.daily_at, self.clock.time()))
+
+    def at(self, ts: float, func, name=None) -> Job:
+        """ts(epoch초)에 1회 실행."""
+        return self._add(Job(name or func.__name__, func), ts)
+
+    def reschedule(self, job: Job, ts: float) -> Job:
+        """이미 등록된 작업의 다음 실행 시각을 ts로 변경 (취소된 작업도 다시 활성화)."""
+        job.cancelled = False
+        return self._add(job, ts)
+
+    def cancel(self, job: Job):
+        if job is None:
+            return
+        with self._cond:
+            job.cancelled = True
+            self._cond.notify()
+
+    def _add(self, job, deadline):
+        with self._cond:
+            job.deadline = deadline
+            heapq.heappush(self._heap, (deadline, next(self._seq), job))
+            if job not in self.jobs:
+                self.jobs.append(job)
+            self._cond.notify()
+        return job
+
+    @staticmethod
+    def _next_daily(at, now_ts):
+        now = datetime.fromtimestamp(now_ts)
+        target = now.replace(hour=at[0], minute=at[1], second=0, microsecond=0)
+        if target <= now:
+            target += timedelta(days=1)
+        return target.timestamp()
+
+    # ------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------
+    def next_deadline(self):
+        with self._cond:
+            self._drop_cancelled()
+            return self._heap[0][0] if self._heap else None
+
+    def pending(self) -> int:
+        """힙에 남은 항목 수 (취소/재예약으로 버려질 항목 포함)."""
+        return len(self._heap)
+
+    def run_pending(self) -> int:
+        """deadline이 지난 작업을 모두 실행하고 실행 개수 반환."""
+        ran = 0
+        while True:
+            with self._cond:
+                self._drop_cancelled()
+                if not self._heap or self._heap[0][0] > self.clock.time():
+                    return ran
+                _, _, job = heapq.heappop(self._heap)
+            self._run_job(job)
+            ran += 1
+
+    def run_until(self, ts: float) -> int:
+        """
+        (VirtualClock 전용) ts까지의 작업을 deadline 순서대로, 각 deadline으로 시계를 옮겨 가며 실행.
+        """
+        ran = 0
+        while True:
+            deadline = self.next_deadline()
+            if deadline is None or deadline > ts:
+                break
+            self.clock.set(deadline)
+            ran += self.run_pending()
+        self.clock.set(ts)
+        return ran
+
+    def run_forever(self):
+        """stop()이 호출될 때까지 다음 deadline까지 대기 => 실행 반복."""
+        logger.info(f"[Scheduler] 시작 (작업: {[job.name for job in self.jobs]})")
+        while not self._stopped:
+            self.run_pending()
+            with self._cond:
+                if self._stopped:
+                    break
+                self._drop_cancelled()
+                timeout = None
+                if self._heap:
+                    timeout = max(0.0, self._heap[0][0] - self.clock.time())
+                if self.max_wait is not None:
+                    timeout = self.max_wait if timeout is None else min(timeout, self.max_wait)
+                self._cond.wait(timeout)
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+
+    def _drop_cancelled(self):
+        # 취소됐거나 reschedule()로 시각이 바뀐 이전 항목은 꺼낼 때 버림 (lazy deletion)
+        while self._heap and (self._heap[0][2].cancelled or self._heap[0][0] != self._heap[0][2].deadline):
+            heapq.heappop(self._heap)
+
+    def _run_job(self, job):
+        started = self.clock.time()
+        lateness = max(0.0, started - job.deadline)
+        try:
+            job.func()
+        except Exception as e:
+            job.failures += 1
+            logger.warning(f"[Scheduler] 작업 {job.name} 실패(무시): {e}")
+        duration = self.clock.time() - started
+        job.record(duration, lateness)
+
+        if lateness >= LATE_WARNING_SEC:
+            logger.warning(f"[Scheduler] 작업 {job.name} 지연 실행: {lateness:.2f}s 늦음")
+        logger.debug(f"[Scheduler] 작업 {job.name} 완료 ({duration:.3f}s, 지연 {lateness:.3f}s)")
+
+        # 다음 실행 예약
+        if job.cancelled:
+            return
+        if job.interval_sec is not None:
+            next_deadline = job.deadline + job.interval_sec
+            now = self.clock.time()
+            if next_deadline <= now:
+                # 주기보다 오래 밀렸으면 밀린 회차는 건너뜀
+                next_deadline = now + job.interval_sec
+            self._add(job, next_deadline)
+        elif job.daily_at is not None:
+            self._add(job, self._next_daily(job.daily_at, self.clock.time()))
+
+    # ------------------------------------------------------------
+    # 스냅샷 (백테스트 상태 저장/이어 돌리기용 pickle)
+    # ------------------------------------------------------------
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # 락은 저장하지 않고 복원 시 새로 생성, 순번 카운터는 다음 값만 보관
+        del state["_cond"]
+        state["_seq"] = next(self._seq)
+        return state
+
+    def __setstate__(self, state):
+        state["_seq"] = itertools.count(state["_seq"])
+        self.__dict__.update(state)
+        self._cond = threading.Condition()
+
+    # ------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------
+    def report(self) -> list:
+        rows = []
+        for job in self.jobs:
+            rows.append({
+                "name": job.name,
+                "runs": job.runs,
+                "failures": job.failures,
+                "avg_duration": job.total_duration / job.runs if job.runs else 0.0,
+                "max_duration": job.max_duration,
+                "max_lateness": job.max_lateness,
+            })
+        return rows
+
+    def log_report(self):
+        for row in self.report():
+            if row["runs"] == 0:
+                continue
+            logger.info(
+                f"[Scheduler] {row['name']}: {row['runs']}회 (실패 {row['failures']}), "
+                f"평균 {row['avg_duration'] * 1000:.1f}ms, 최대 {row['max_duration'] * 1000:.1f}ms, "
+                f"최대 지연 {row['max_lateness'] * 1000:.1f}ms"
+            )
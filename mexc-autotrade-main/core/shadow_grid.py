@@ -0,0 +1,147 @@
+# core/shadow_grid.py
+
+import itertools
+import time
+import numpy as np
+from loguru import logger
+
+
+class ShadowGrid:
+    """
+    EMA span / 변동성 기준(threshold) 파라미터 격자 전체를 실시간으로 '그림자' 평가하는 클래스.
+    주문은 절대 내지 않으며(executor 참조 없음), 가상 포지션과 손익만 추적.
+
+    - 격자 점마다 EMA(fast, mid, slow) 상태를 NumPy 배열로 보관 => 틱당 벡터 연산 1회
+    - 진입: 무포 + (mid>slow & fast↑mid 골든) => 롱, (mid<slow & fast↓mid 데드) => 숏
+    - 청산: 반대 크로스 시 수익률 >= threshold면 청산,
+            미만이면 실전 전략의 헷지(반대 포지션 50 진입)와 같은 효과로 보고
+            손익 확정 후 반대 방향 포지션으로 전환
+    - 손익은 진입가 대비 수익률(비율) 단위로 누적
+    """
+
+    def __init__(self, fast_spans=(1,), mid_spans=(3,), slow_spans=(7,), thresholds=(0.0005,),
+                 leaderboard_sec=300, top_n=10):
+        grid = [
+            (f, m, s, th)
+            for f, m, s, th in itertools.product(fast_spans, mid_spans, slow_spans, thresholds)
+            if f < m < s
+        ]
+        if not grid:
+            raise ValueError("유효한 격자 점이 없습니다. (fast < mid < slow 조건 확인)")
+
+        self.params = grid
+        params = np.array(grid, dtype=np.float64)
+        self.alpha_fast = 2.0 / (params[:, 0] + 1.0)
+        self.alpha_mid = 2.0 / (params[:, 1] + 1.0)
+        self.alpha_slow = 2.0 / (params[:, 2] + 1.0)
+        self.threshold = params[:, 3]
+
+        n = len(grid)
+        self.ema_fast = np.zeros(n)
+        self.ema_mid = np.zeros(n)
+        self.ema_slow = np.zeros(n)
+        self.prev_diff = np.zeros(n)      # 직전 틱 (fast - mid)
+
+        self.position = np.zeros(n)       # +1 롱, -1 숏, 0 무포
+        self.entry_price = np.zeros(n)
+        self.realized = np.zeros(n)       # 누적 실현 수익률
+        self.trades = np.zeros(n, dtype=np.int64)
+
+        self.ticks = 0
+        self.last_price = None
+        self.leaderboard_sec = leaderboard_sec
+        self.top_n = top_n
+        self._last_report = time.time()
+
+    # ------------------------------------------------------------
+    # 틱 처리 (벡터 연산)
+    # ------------------------------------------------------------
+    def on_tick(self, price: float):
+        self.last_price = price
+        if self.ticks == 0:
+            self.ema_fast[:] = price
+            self.ema_mid[:] = price
+            self.ema_slow[:] = price
+            self.ticks = 1
+            return
+
+        self.ticks += 1
+        self.ema_fast += (price - self.ema_fast) * self.alpha_fast
+        self.ema_mid += (price - self.ema_mid) * self.alpha_mid
+        self.ema_slow += (price - self.ema_slow) * self.alpha_slow
+
+        diff = self.ema_fast - self.ema_mid
+        golden = (self.prev_diff < 0) & (diff > 0)
+        dead = (self.prev_diff > 0) & (diff < 0)
+        self.prev_diff = diff
+
+        flat = self.position == 0
+        is_long = self.position > 0
+        is_short = self.position < 0
+
+        # 보유 포지션의 현재 수익률
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ret = np.where(flat, 0.0, (price - self.entry_price) / self.entry_price * self.position)
+
+        # (1) 무포 진입
+        open_long = flat & golden & (self.ema_mid > self.ema_slow)
+        open_short = flat & dead & (self.ema_mid < self.ema_slow)
+
+        # (2) 반대 크로스 시 청산(수익 >= threshold) 또는 전환(헷지 근사)
+        exit_mask = (is_long & dead) | (is_short & golden)
+        take_profit = exit_mask & (ret >= self.threshold)
+        flip = exit_mask & ~take_profit
+
+        self.realized += np.where(exit_mask, ret, 0.0)
+        self.trades += exit_mask.astype(np.int64) + flip + open_long + open_short
+
+        self.position[take_profit] = 0.0
+        self.position[flip] = -self.position[flip]
+        self.position[open_long] = 1.0
+        self.position[open_short] = -1.0
+        self.entry_price[flip | open_long | open_short] = price
+
+        if self.leaderboard_sec and time.time() - self._last_report >= self.leaderboard_sec:
+            self.log_leaderboard()
+
+    # ------------------------------------------------------------
+    # 결과 조회
+    # ------------------------------------------------------------
+    def total_returns(self) -> np.ndarray:
+        """실현 + 미실현 수익률."""
+        if self.last_price is None:
+            return self.realized.copy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            unrealized = np.where(
+                self.position == 0, 0.0,
+                (self.last_price - self.entry_price) / self.entry_price * self.position
+            )
+        return self.realized + unrealized
+
+    def leaderboard(self, top_n=None) -> list:
+        top_n = top_n or self.top_n
+        totals = self.total_returns()
+        order = np.argsort(-totals)[:top_n]
+        return [
+            {
+                "fast": self.params[i][0],
+                "mid": self.params[i][1],
+                "slow": self.params[i][2],
+                "threshold": self.params[i][3],
+                "return": float(totals[i]),
+                "trades": int(self.trades[i]),
+                "position": int(self.position[i]),
+            }
+            for i in order
+        ]
+
+    def log_leaderboard(self):
+        self._last_report = time.time()
+        rows = self.leaderboard()
+        logger.info(f"[ShadowGrid] 리더보드 (격자 {len(self.params)}개, 틱 {self.ticks}개)")
+        for rank, row in enumerate(rows, start=1):
+            logger.info(
+                f"[ShadowGrid] #{rank} EMA({row['fast']},{row['mid']},{row['slow']}) "
+                f"th={row['threshold']:.4%} => 수익률={row['return']:.4%}, "
+                f"거래={row['trades']}, 포지션={row['position']}"
+            )
@@ -0,0 +1,181 @@
+# core/shadow_runner.py
+
+import csv
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from loguru import logger
+
+
+class RecordingExecutor:
+    """
+    주문을 실제로 내지 않고 '의도한 주문'만 기록하는 no-op executor.
+    OrderExecutor와 같은 인터페이스(place_market_order / close_position)를 제공하며 항상 성공(True)으로 응답.
+    """
+
+    def __init__(self):
+        self.orders = []
+        self.current_seq = 0
+        self.current_price = 0.0
+
+    def place_market_order(self, side: str, quantity: float) -> bool:
+        self._record("OPEN", side, quantity)
+        return True
+
+    def close_position(self, side: str, quantity: float) -> bool:
+        self._record("CLOSE", side, quantity)
+        return True
+
+    def _record(self, action, side, quantity):
+        self.orders.append({
+            "seq": self.current_seq,
+            "price": self.current_price,
+            "action": action,
+            "side": side.upper(),
+            "qty": quantity,
+        })
+
+    def drain(self) -> list:
+        orders, self.orders = self.orders, []
+        return orders
+
+
+class DecisionTap:
+    """
+    실전 OrderExecutor를 감싸 그대로 주문을 전달하면서,
+    실전 전략이 실제로 내린 결정(주문 시도/성공 여부)을 기록.
+    """
+
+    def __init__(self, executor):
+        self.executor = executor
+        self.decisions = []
+
+    def place_market_order(self, side: str, quantity: float) -> bool:
+        success = self.executor.place_market_order(side, quantity)
+        self.decisions.append({"action": "OPEN", "side": side.upper(), "qty": quantity, "success": success})
+        return success
+
+    def close_position(self, side: str, quantity: float) -> bool:
+        success = self.executor.close_position(side, quantity)
+        self.decisions.append({"action": "CLOSE", "side": side.upper(), "qty": quantity, "success": success})
+        return success
+
+    def __getattr__(self, name):
+        # 그 밖의 속성/메서드는 실제 executor로 위임
+        return getattr(self.executor, name)
+
+    def drain(self) -> list:
+        decisions, self.decisions = self.decisions, []
+        return decisions
+
+
+class ShadowRunner:
+    """
+    후보 전략(예: strategyupdate.TradingStrategy)을 실전 전략과 같은 시세 이벤트에 붙여
+    '신호만' 평가하는 그림자 실행기.
+
+    - 실전 경로에서는 submit()으로 큐에 넣기만 함 (가득 차면 버림) => 실전 지연 없음
+    - 별도 워커 스레드에서 후보 전략 실행 + 실전 결정과 비교
+    - 결정이 다른 틱은 CSV(divergence report)에 기록
+    """
+
+    def __init__(self, candidates: dict, report_file="shadow_divergence.csv", max_queue=10_000):
+        """
+        candidates: {이름: 전략 인스턴스}. 각 전략에는 RecordingExecutor가 연결됨.
+        report_file: 불일치 기록 CSV 경로
+        max_queue: 이벤트 큐 최대 길이
+        """
+        self.candidates = {}
+        for name, strategy in candidates.items():
+            executor = RecordingExecutor()
+            strategy.set_order_executor(executor)
+            self.candidates[name] = (strategy, executor)
+
+        self.report_file = report_file
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = None
+        self._seq = 0
+
+        # 통계
+        self.dropped = 0
+        self.processed = 0
+        self.divergences = {name: 0 for name in self.candidates}
+        self.order_counts = {name: 0 for name in self.candidates}
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        if not os.path.exists(self.report_file):
+            with open(self.report_file, "w", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerow(
+                    ["Timestamp", "Seq", "Price", "Candidate", "Production", "Candidate Orders"]
+                )
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        logger.info(f"[ShadowRunner] 그림자 워커 시작 (후보 {list(self.candidates)})")
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    def stop(self):
+        if self._thread:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+        logger.info(
+            f"[ShadowRunner] 종료: 처리 {self.processed}틱, 버림 {self.dropped}틱, "
+            f"후보별 주문 {self.order_counts}, 불일치 {self.divergences}"
+        )
+
+    def submit(self, price: float, production_decisions: list):
+        """
+        실전 경로에서 호출 (논블로킹).
+        production_decisions: DecisionTap.drain() 결과 (이번 틱의 실전 결정)
+        """
+        self._seq += 1
+        try:
+            self._queue.put_nowait((self._seq, time.time(), price, production_decisions))
+        except queue.Full:
+            self.dropped += 1
+
+    # ------------------------------------------------------------
+    # 워커
+    # ------------------------------------------------------------
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            try:
+                self._evaluate(*item)
+            except Exception as e:
+                logger.warning(f"[ShadowRunner] 후보 평가 실패(무시): {e}")
+
+    def _evaluate(self, seq, ts, price, production_decisions):
+        self.processed += 1
+        prod_key = [(d["action"], d["side"]) for d in production_decisions]
+
+        rows = []
+        for name, (strategy, executor) in self.candidates.items():
+            executor.current_seq = seq
+            executor.current_price = price
+            strategy.on_new_price(price)
+            orders = executor.drain()
+            self.order_counts[name] += len(orders)
+
+            cand_key = [(o["action"], o["side"]) for o in orders]
+            if cand_key != prod_key:
+                self.divergences[name] += 1
+                rows.append([
+                    datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+                    seq,
+                    f"{price:.4f}",
+                    name,
+                    " ".join(f"{a}_{s}" for a, s in prod_key) or "-",
+                    " ".join(f"{a}_{s}" for a, s in cand_key) or "-",
+                ])
+
+        if rows:
+            with open(self.report_file, "a", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerows(rows)
@@ -0,0 +1,119 @@
+# core/shm_ring.py
+
+import struct
+from multiprocessing import shared_memory
+
+# 헤더: head(생산자 쓰기 위치), tail(소비자 읽기 위치)를 서로 다른 캐시라인(64B)에 배치
+_COUNTER = struct.Struct("<Q")
+_HEAD_OFFSET = 0
+_CAPACITY_OFFSET = 8
+_TAIL_OFFSET = 64
+_DATA_OFFSET = 128
+
+# ----------------------------------------------------------------
+# 고정 레이아웃 레코드
+# ----------------------------------------------------------------
+# 틱: seq, 수신시각(epoch초), 현재가, 마감봉 종가(없으면 NaN)
+TICK_RECORD = struct.Struct("<Qddd")
+
+# 명령(전략 -> 실행기): seq, 생성시각, kind, code, a, b
+#   kind 0: OPEN   code=side(0 LONG/1 SHORT) a=수량 b=가격
+#   kind 1: CLOSE  code=side                a=수량 b=가격
+#   kind 2: RECORD_TRADE code=TRADE_TYPES 인덱스 a=last_entry_price b=close_price
+#   kind 3: ADD_VOLUME a=거래금액
+#   kind 4: ADD_PNL    a=실현손익
+COMMAND_RECORD = struct.Struct("<QdBBdd")
+
+# 결과(실행기 -> 전략): 명령 seq, 완료시각, 성공여부, 소요시간(초)
+RESULT_RECORD = struct.Struct("<QdBd")
+
+
+class ShmRing:
+    """
+    multiprocessing.shared_memory 위의 단일 생산자/단일 소비자(SPSC) 링 버퍼.
+
+    - 락 없음: head는 생산자만, tail은 소비자만 갱신
+    - 생산자는 레코드를 먼저 쓰고 head를 올리며, 소비자는 레코드를 읽은 뒤 tail을 올림
+      (8바이트 정렬 카운터 쓰기는 x86/ARM64에서 원자적)
+    - 가득 차면 push()가 False 반환 (생산자는 버리거나 재시도)
+    """
+
+    def __init__(self, name: str, record: struct.Struct, capacity: int = 4096, create=False):
+        """
+        name: 공유 메모리 이름
+        record: 레코드 레이아웃 (TICK_RECORD 등)
+        capacity: 슬롯 수 (생성 시에만 사용, 연결 시에는 헤더에서 읽음)
+        create: True면 새로 만들고, False면 기존 블록에 연결
+        """
+        self.record = record
+        if create:
+            size = _DATA_OFFSET + record.size * capacity
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self.shm.buf[:_DATA_OFFSET] = bytes(_DATA_OFFSET)
+            _COUNTER.pack_into(self.shm.buf, _CAPACITY_OFFSET, capacity)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+        self.buf = self.shm.buf
+        self.capacity = _COUNTER.unpack_from(self.buf, _CAPACITY_OFFSET)[0]
+
+    def _load(self, offset) -> int:
+        return _COUNTER.unpack_from(self.buf, offset)[0]
+
+    def push(self, *values) -> bool:
+        head = self._load(_HEAD_OFFSET)
+        if head - self._load(_TAIL_OFFSET) >= self.capacity:
+            return False
+        slot = _DATA_OFFSET + (head % self.capacity) * self.record.size
+        self.record.pack_into(self.buf, slot, *values)
+        _COUNTER.pack_into(self.buf, _HEAD_OFFSET, head + 1)
+        return True
+
+    def pop(self):
+        tail = self._load(_TAIL_OFFSET)
+        if tail >= self._load(_HEAD_OFFSET):
+            return None
+        slot = _DATA_OFFSET + (tail % self.capacity) * self.record.size
+        values = self.record.unpack_from(self.buf, slot)
+        _COUNTER.pack_into(self.buf, _TAIL_OFFSET, tail + 1)
+        return values
+
+    def __len__(self):
+        return self._load(_HEAD_OFFSET) - self._load(_TAIL_OFFSET)
+
+    def close(self):
+        self.buf = None
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.unlink()
+
+
+class ShmState:
+    """
+    프로세스 간 공유하는 소수의 double 값(예: 휴식 종료 시각).
+    단일 작성자 전제, 값 하나는 8바이트 단위로 원자적으로 쓰임.
+    """
+
+    FIELDS = ("pause_until", "accumulated_volume", "realized_pnl", "executor_busy", "executor_ready")
+
+    def __init__(self, name: str, create=False):
+        size = 8 * len(self.FIELDS)
+        if create:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            self.shm.buf[:size] = bytes(size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+
+    def get(self, field: str) -> float:
+        return struct.unpack_from("<d", self.shm.buf, 8 * self.FIELDS.index(field))[0]
+
+    def set(self, field: str, value: float):
+        struct.pack_into("<d", self.shm.buf, 8 * self.FIELDS.index(field), value)
+
+    def close(self):
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.unlink()
@@ -5,6 +5,7 @@ from config.config import (
     EMA_SHORT, EMA_MID, EMA_LONG, PRICE_THRESHOLD,
     MIN_TRADE_AMOUNT
 )
+from core.clock import SYSTEM_CLOCK
 import math
 
 class TradingStrategy:
@@ -13,7 +14,16 @@ class TradingStrategy:
     'order_executor'로 실제 주문을 보내는 구조.
     """
 
-    def __init__(self, symbol="BTC_USDT", position_tracker=None, risk_manager=None):
+    # 매 틱 접근하는 상태를 고정 슬롯에 보관 (인스턴스 __dict__ 없음 => 속성 조회가 빠르고 메모리 작음)
+    __slots__ = (
+        "ema1", "ema2", "ema3", "prev_ema1", "prev_ema2", "prev_ema3", "prev_price",
+        "alpha_1", "alpha_3", "alpha_7",
+        "long_size", "short_size", "long_entry_price", "short_entry_price", "price_threshold",
+        "order_executor", "user_seed", "symbol", "position_tracker", "risk_manager", "clock",
+        "base_unit", "contract_specs", "current_price", "last_bar", "timeframes",
+    )
+
+    def __init__(self, symbol="BTC_USDT", position_tracker=None, risk_manager=None, clock=None):
         # EMA
         self.ema1 = None  # EMA(1) 
         self.ema2 = None  # EMA(3)
@@ -49,19 +59,39 @@ class TradingStrategy:
         self.symbol = symbol
         self.position_tracker = position_tracker
         self.risk_manager = risk_manager
+        # 시각 제공자 (지정하지 않으면 RiskManager와 같은 시계 사용)
+        self.clock = clock or getattr(risk_manager, "clock", SYSTEM_CLOCK)
 
         # 매매 단위 (base_unit)
         self.base_unit = 1
+        # 계약 사양 캐시 (ContractSpecCache, 없으면 MIN_TRADE_AMOUNT 표 사용)
+        self.contract_specs = None
 
         # 최근 시세
         self.current_price = 0.0
 
+        # 최근 마감된 봉 (BarBuilder가 만든 로컬 봉)
+        self.last_bar = None
+
+        # 다중 주기 EMA 엔진 (MultiTimeframeEMA, 선택)
+        self.timeframes = None
+
     def set_order_executor(self, executor):
         self.order_executor = executor
 
     def set_user_seed(self, seed: float):
         self.user_seed = seed
 
+    def set_contract_specs(self, specs):
+        self.contract_specs = specs
+
+    def set_timeframe_engine(self, engine):
+        """
+        MultiTimeframeEMA 연결. 연결 시 매 틱마다 함께 갱신되며,
+        전략에서 self.timeframes.is_above("5m", 3, 7) 처럼 조회 가능.
+        """
+        self.timeframes = engine
+
     # ------------------------------------------------------
     # 매매비중1 계산 + 최소거래단위 반영 (floor)
     # ------------------------------------------------------
@@ -69,22 +99,25 @@ class TradingStrategy:
         """
         무포지션 상태에서 현재가로부터 base_unit을 재계산.
         매매비중1 = (user_seed * 0.2) / current_price
-        이후, 심볼별 MIN_TRADE_AMOUNT 반영해 '내림(floor)' 처리.
+        이후, 심볼별 수량 단위(ContractSpecCache, 없으면 MIN_TRADE_AMOUNT) 반영해 '내림(floor)' 처리.
         """
         if self.user_seed <= 0 or current_price <= 0:
             return
 
         raw_base = (self.user_seed * 0.2) / current_price
-        min_step = MIN_TRADE_AMOUNT.get(self.symbol, 0.0001)
-
-        floored_value = math.floor(raw_base / min_step) * min_step
+        if self.contract_specs:
+            min_step = self.contract_specs.qty_step(self.symbol)
+            floored_value = self.contract_specs.quantize_qty(self.symbol, raw_base)
+        else:
+            min_step = MIN_TRADE_AMOUNT.get(self.symbol, 0.0001)
+            floored_value = math.floor(raw_base / min_step) * min_step
 
         if floored_value <= 0:
             logger.warning("[Strategy] base_unit 계산값이 0 이하입니다. (seed가 너무 작거나 price가 너무 높을 수 있음)")
             return
 
         self.base_unit = floored_value
-        logger.trace(f"[Strategy] base_unit 갱신 => {self.base_unit} (min_step={min_step})")
+        logger.trace("[Strategy] base_unit 갱신 => {} (min_step={})", self.base_unit, min_step)
 
     # ------------------------------------------------------
     # 매 틱마다 호출되는 함수
@@ -99,6 +132,8 @@ class TradingStrategy:
 
         # (1) EMA 업데이트 (실시간)
         self._update_ema(price)
+        if self.timeframes:
+            self.timeframes.on_tick(price, ts_ms=int(self.clock.time() * 1000))
 
 
         # (2) 휴식 여부 체크
@@ -113,6 +148,14 @@ class TradingStrategy:
         # (4) 전략 실행
         self._check_strategy(current_price=price)
 
+    def on_new_bar(self, bar):
+        """
+        BarBuilder에서 봉이 마감될 때마다 호출.
+        EMA는 틱 단위로 갱신하므로, 여기서는 마감 봉만 기록해 둠.
+        """
+        self.last_bar = bar
+        logger.trace("[Strategy] 봉 마감 수신: {}", bar)
+
 
     def price_in_range(self, current_price, previous_price, threshold=0.0005):
         """
@@ -254,7 +297,7 @@ class TradingStrategy:
 
         # (4) 헷징 상태(롱>0 & 숏>0)
         elif self.long_size > 0 or self.short_size > 0:
-            logger.trace(f"[Strategy] 헷지 상태: long_size={self.long_size}, short_size={self.short_size}")
+            logger.trace("[Strategy] 헷지 상태: long_size={}, short_size={}", self.long_size, self.short_size)
 
             # 골든 신호 => 숏 부분청산 
             if self._is_golden_cross():
@@ -0,0 +1,215 @@
+# core/strategy_host.py
+
+import time
+from loguru import logger
+from core.indicators import EMA, RSI, MACD
+from core.events import EventPool, TradeEvent
+
+
+class StrategyPlugin:
+    """
+    하나의 피드에 여러 전략을 붙이기 위한 공통 전략 인터페이스.
+
+    라이프사이클 훅 (필요한 것만 오버라이드):
+    - on_start(host): 호스트에 등록될 때 1회
+    - on_tick(price, data): 폴링마다 (data = 피드의 data_dict)
+    - on_bar(bar): 로컬 봉(BarBuilder)이 마감될 때
+    - on_fill(fill): 주문 체결(성공) 시 TradeEvent (fill.side 또는 fill["side"], 콜백 안에서만 유효)
+    - on_timer(now): 호스트의 timer_sec 주기마다
+    - on_stop(): 호스트 종료 시
+    """
+
+    name = "plugin"
+
+    def on_start(self, host):
+        pass
+
+    def on_tick(self, price: float, data: dict):
+        pass
+
+    def on_bar(self, bar):
+        pass
+
+    def on_fill(self, fill):
+        pass
+
+    def on_timer(self, now: float):
+        pass
+
+    def on_stop(self):
+        pass
+
+
+class _TaggedExecutor:
+    """
+    전략별 executor 래퍼. 주문 성공 시 호스트에 fill 이벤트를 알림.
+    """
+
+    def __init__(self, host, plugin_name, executor):
+        self.host = host
+        self.plugin_name = plugin_name
+        self.executor = executor
+
+    def place_market_order(self, side: str, quantity: float) -> bool:
+        success = self.executor.place_market_order(side, quantity)
+        if success:
+            self.host.dispatch_fill(self.plugin_name, "OPEN", side, quantity)
+        return success
+
+    def close_position(self, side: str, quantity: float) -> bool:
+        success = self.executor.close_position(side, quantity)
+        if success:
+            self.host.dispatch_fill(self.plugin_name, "CLOSE", side, quantity)
+        return success
+
+    def __getattr__(self, name):
+        return getattr(self.executor, name)
+
+
+class StrategyHost:
+    """
+    피드(MexcRestPollingFeed 등) 1개의 콜백을 받아 여러 전략 플러그인에 분배.
+    => 전략이 N개여도 HTTP 요청은 피드 1개분만 발생.
+
+    사용 예)
+        host = StrategyHost()
+        host.add(EmaScalpPlugin(strategy))
+        feed = MexcRestPollingFeed(symbol, on_data_callback=host.on_data, ...)
+    """
+
+    def __init__(self, plugins=(), timer_sec=1.0):
+        self.plugins = []
+        self.timer_sec = timer_sec
+        self._last_timer = time.time()
+        self.last_price = None
+        self._fills = EventPool(TradeEvent)
+        for plugin in plugins:
+            self.add(plugin)
+
+    def add(self, plugin: StrategyPlugin):
+        self.plugins.append(plugin)
+        plugin.on_start(self)
+        logger.info(f"[StrategyHost] 전략 등록: {plugin.name}")
+        return plugin
+
+    def wrap_executor(self, plugin_name: str, executor):
+        """플러그인 전략의 executor를 감싸 체결 시 on_fill이 호출되도록 함."""
+        if executor is None:
+            return None
+        return _TaggedExecutor(self, plugin_name, executor)
+
+    # ------------------------------------------------------------
+    # 이벤트 분배
+    # ------------------------------------------------------------
+    def on_data(self, data: dict):
+        """피드 콜백. 마감 봉 => on_bar, 현재가 => on_tick, 주기 도래 시 => on_timer."""
+        for bar in data.get("bars", ()):
+            self._dispatch("on_bar", bar)
+
+        price = data.get("lastPrice")
+        if price is not None:
+            self.last_price = float(price)
+            self._dispatch("on_tick", self.last_price, data)
+
+        now = time.time()
+        if now - self._last_timer >= self.timer_sec:
+            self._last_timer = now
+            self._dispatch("on_timer", now)
+
+    def dispatch_fill(self, plugin_name, action, side, quantity):
+        fill = self._fills.acquire()
+        fill.strategy = plugin_name
+        fill.action = action
+        fill.side = side.upper()
+        fill.qty = quantity
+        fill.price = self.last_price
+        try:
+            self._dispatch("on_fill", fill)
+        finally:
+            self._fills.release(fill)
+
+    def stop(self):
+        self._dispatch("on_stop")
+
+    def _dispatch(self, hook, *args):
+        # 한 전략의 예외가 다른 전략 실행을 막지 않도록 개별 처리
+        for plugin in self.plugins:
+            try:
+                getattr(plugin, hook)(*args)
+            except Exception as e:
+                logger.warning(f"[StrategyHost] {plugin.name}.{hook}() 실패(무시): {e}")
+
+
+# ----------------------------------------------------------------
+# 기존 전략 클래스 어댑터
+# ----------------------------------------------------------------
+class EmaScalpPlugin(StrategyPlugin):
+    """
+    core/strategy.py, strategyupdate.py 의 TradingStrategy (on_new_price(price)) 어댑터.
+    """
+
+    def __init__(self, strategy, name="ema_scalp"):
+        self.strategy = strategy
+        self.name = name
+        self._bar_closed = False
+
+    def on_start(self, host):
+        self.strategy.set_order_executor(host.wrap_executor(self.name, self.strategy.order_executor))
+
+    def on_bar(self, bar):
+        self._bar_closed = True
+        if hasattr(self.strategy, "on_new_bar"):
+            self.strategy.on_new_bar(bar)
+
+    def on_tick(self, price, data):
+        self.strategy.on_new_price(price, candle_closed=self._bar_closed)
+        self._bar_closed = False
+
+
+class EmaTripletPlugin(StrategyPlugin):
+    """
+    루트 strategy.py 의 TradingStrategy (on_new_price(ema1, ema2, ema3)) 어댑터.
+    DOM 파싱 대신 틱 가격으로 EMA(1,3,7)을 직접 계산해 전달.
+    """
+
+    def __init__(self, strategy, spans=(1, 3, 7), name="ema_triplet"):
+        self.strategy = strategy
+        self.name = name
+        self.emas = [EMA(span) for span in spans]
+
+    def on_start(self, host):
+        self.strategy.set_order_executor(host.wrap_executor(self.name, self.strategy.order_executor))
+
+    def on_tick(self, price, data):
+        values = [ema.update(price) for ema in self.emas]
+        self.strategy.on_new_price(*values)
+
+
+class SignalPlugin(StrategyPlugin):
+    """
+    루트 TradingStrategy.py 의 RSI/MACD check_signal(data) 어댑터.
+    마감 봉 종가로 RSI(14), MACD(12,26,9)를 점진 계산해 check_signal에 넘기고,
+    신호가 바뀌면 on_signal(signal) 콜백 호출 ("LONG"/"SHORT"/None).
+    """
+
+    def __init__(self, strategy, on_signal=None, name="rsi_macd"):
+        self.strategy = strategy
+        self.on_signal = on_signal
+        self.name = name
+        self.rsi = RSI(14)
+        self.macd = MACD(12, 26, 9)
+        self.last_signal = None
+
+    def on_bar(self, bar):
+        rsi = self.rsi.update(bar.close)
+        macd, signal_line = self.macd.update(bar.close)
+        if rsi is None:
+            return
+
+        data = {"RSI": {"rsi": rsi}, "MACD": {"macd": macd, "signal": signal_line}}
+        signal = self.strategy.check_signal(data)
+        if signal != self.last_signal:
+            logger.info(f"[StrategyHost] {self.name} 신호 변경: {self.last_signal} -> {signal}")
+            self.last_signal = signal
+            if self.on_signal:
+                self.on_signal(signal)
@@ -0,0 +1,122 @@
+# core/ui_wait.py
+
+import time
+from loguru import logger
+
+# 조건 검사 루프 (execute_async_script 1회 안에서 반복)
+# - check(args, root): 값을 반환하면 충족, null/undefined/false면 계속 대기
+# - stableFrames: 같은 값이 연속으로 이 프레임 수만큼 나와야 충족 (텍스트 안정화용)
+# - 백그라운드 탭에서는 requestAnimationFrame이 멈추므로 50ms setTimeout으로 대체
+_WAIT_TEMPLATE = r"""
+const [args, rootEl, scroll, timeoutMs, stableFrames] = arguments;
+const done = arguments[arguments.length - 1];
+const root = rootEl || document;
+const find = (xp) => document.evaluate(
+    xp, root, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const check = (args) => { %s };
+const frame = () => new Promise((resolve) => {
+    let fired = false;
+    requestAnimationFrame(() => { fired = true; resolve(); });
+    setTimeout(() => { if (!fired) resolve(); }, 50);
+});
+(async () => {
+    if (scroll && rootEl) rootEl.scrollIntoView(true);
+    const start = performance.now();
+    let last, same = 0;
+    while (true) {
+        let value = null;
+        try { value = check(args); } catch (e) { value = null; }
+        if (value !== null && value !== undefined && value !== false) {
+            same = (value === last) ? same + 1 : 1;
+            last = value;
+            if (same >= stableFrames) return done({ok: true, value, ms: performance.now() - start});
+        } else {
+            same = 0;
+            last = undefined;
+        }
+        if (performance.now() - start >= timeoutMs) {
+            return done({ok: false, value: null, ms: performance.now() - start});
+        }
+        await frame();
+    }
+})();
+"""
+
+# 자주 쓰는 조건
+PRESENT = "return find(args[0]);"
+TEXT = "const el = find(args[0]); return el ? (el.innerText.trim() || null) : null;"
+TEXT_CONTENT = "const el = find(args[0]); return el ? el.textContent : '';"
+
+
+class UiWaiter:
+    """
+    고정 sleep 대신 JS 조건(요소 존재, 텍스트 안정화 등)을 브라우저 안에서 프레임 단위로 검사하는 대기 도구.
+    대기 1회 = WebDriver 왕복 1회. 라벨별로 실제 대기 시간/타임아웃 횟수를 집계.
+
+    사용 예)
+        waiter = UiWaiter(driver, name="PositionTracker")
+        text = waiter.stable_text('.//div[...]', root=asset_card, scroll=True, label="total_balance")
+    """
+
+    def __init__(self, driver, name="UiWaiter"):
+        self.driver = driver
+        self.name = name
+        self._scripts = {}
+        # label -> [횟수, 총 ms, 최대 ms, 타임아웃 횟수]
+        self.stats = {}
+
+    def until(self, check_js: str, *args, root=None, scroll=False, timeout=0.5, stable_frames=1, label="wait"):
+        """
+        check_js: 함수 본문 (args, find 사용 가능). 충족 시 값을 반환.
+        반환: 충족한 값 (타임아웃이면 None)
+        """
+        script = self._scripts.get(check_js)
+        if script is None:
+            script = self._scripts[check_js] = _WAIT_TEMPLATE % check_js
+
+        started = time.perf_counter()
+        try:
+            result = self.driver.execute_async_script(
+                script, list(args), root, scroll, int(timeout * 1000), stable_frames
+            ) or {}
+        except Exception as e:
+            logger.warning(f"[{self.name}] {label} 대기 스크립트 실패: {e}")
+            result = {}
+        round_trip_ms = (time.perf_counter() - started) * 1000
+
+        self._record(label, result.get("ms", round_trip_ms), not result.get("ok"))
+        logger.trace(
+            f"[{self.name}] {label}: {'충족' if result.get('ok') else '타임아웃'} "
+            f"(대기 {result.get('ms', 0):.0f}ms, 왕복 {round_trip_ms:.0f}ms)"
+        )
+        return result.get("value") if result.get("ok") else None
+
+    def present(self, xpath, root=None, timeout=0.5, label="present"):
+        """xpath 요소가 나타날 때까지 대기 => WebElement (없으면 None)."""
+        return self.until(PRESENT, xpath, root=root, timeout=timeout, label=label)
+
+    def stable_text(self, xpath, root=None, scroll=False, timeout=0.5, stable_frames=2, label="stable_text"):
+        """xpath 요소의 innerText가 비어 있지 않고 stable_frames 프레임 연속 같을 때 그 텍스트 반환."""
+        return self.until(TEXT, xpath, root=root, scroll=scroll, timeout=timeout,
+                          stable_frames=stable_frames, label=label)
+
+    def settled(self, xpath, timeout=1.0, stable_frames=6, label="settled"):
+        """
+        xpath 요소의 textContent가 stable_frames 프레임 동안 바뀌지 않을 때까지 대기 (요소가 없으면 빈 문자열로 비교).
+        체결 직후 포지션/잔고 표시가 갱신되기를 기다릴 때 사용.
+        """
+        return self.until(TEXT_CONTENT, xpath, timeout=timeout, stable_frames=stable_frames, label=label)
+
+    def _record(self, label, ms, timed_out):
+        stat = self.stats.setdefault(label, [0, 0.0, 0.0, 0])
+        stat[0] += 1
+        stat[1] += ms
+        stat[2] = max(stat[2], ms)
+        stat[3] += int(timed_out)
+
+    def log_stats(self):
+        for label, (count, total, mx, timeouts) in self.stats.items():
+            logger.info(
+                f"[{self.name}] 대기 {label}: {count}회, 평균 {total / count:.0f}ms, "
+                f"최대 {mx:.0f}ms, 타임아웃 {timeouts}회"
+            )
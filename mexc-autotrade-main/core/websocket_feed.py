@@ -5,6 +5,8 @@ import time
 import random
 import requests
 from loguru import logger
+from core.events import EventPool, TickEvent
+from core.metrics import FEED_LATENCY, FEED_ERRORS, endpoint_name
 
 class MexcRestPollingFeed:
     """
@@ -22,7 +24,10 @@ class MexcRestPollingFeed:
         poll_interval=1,
         kline_interval="Min1",
         max_retries=3,
-        session=None
+        session=None,
+        bar_builder=None,
+        kline_verify_sec=60,
+        kline_cache=None
     ):
         """
         symbol: "BTC_USDT", "ETH_USDT" 등
@@ -31,6 +36,10 @@ class MexcRestPollingFeed:
         kline_interval: K라인 주기("Min1","Min5"등)
         max_retries: API 호출 실패 시 재시도 횟수
         session: requests.Session() (없으면 새로 만듦)
+        bar_builder: BarBuilder 지정 시 체결(deals)로 봉을 직접 만들고,
+                     kline은 kline_verify_sec마다 한 번만 호출해 대조용으로 사용
+        kline_verify_sec: 로컬 봉 <-> REST kline 대조 주기(초)
+        kline_cache: KlineCache 지정 시 새 캔들만 증분 요청하고 이력은 메모리에서 제공
         """
         self.symbol = symbol
         self.on_data_callback = on_data_callback
@@ -45,6 +54,19 @@ class MexcRestPollingFeed:
                           "(KHTML, like Gecko) Chrome/110.0.0.0 Safari/537.36"
         })
 
+        # 로컬 봉 생성기 (없으면 기존처럼 매 폴링마다 kline 호출)
+        self.bar_builder = bar_builder
+        self.kline_verify_sec = kline_verify_sec
+        self._last_kline_check = 0.0
+
+        # K라인 증분 캐시 (없으면 매번 limit개 전체 재요청)
+        self.kline_cache = kline_cache
+        if self.kline_cache and self.kline_cache.fetch_json is None:
+            self.kline_cache.fetch_json = self._safe_get
+
+        # 폴링마다 data_dict를 새로 만들지 않고 TickEvent를 재사용 (콜백이 끝나면 반납)
+        self.pool = EventPool(TickEvent)
+
         self._stop_event = threading.Event()
         self._thread = None
 
@@ -70,18 +92,41 @@ class MexcRestPollingFeed:
         REST API를 반복 호출 => 콜백 전달.
         """
         while not self._stop_event.is_set():
-            data_dict = {}
+            data_dict = self.pool.acquire()
             data_dict["lastPrice"] = self._get_last_price()
-            data_dict["deals"] = self._get_recent_deals(limit=5)
-            data_dict["kline"] = self._get_kline_data(limit=5)
+            if self.bar_builder:
+                self._poll_with_bar_builder(data_dict)
+            else:
+                data_dict["deals"] = self._get_recent_deals(limit=5)
+                data_dict["kline"] = self._get_kline_data(limit=5)
 
-            if self.on_data_callback:
-                self.on_data_callback(data_dict)
+            try:
+                if self.on_data_callback:
+                    self.on_data_callback(data_dict)
+            finally:
+                self.pool.release(data_dict)
 
             # 기본 주기 + 무작위 0~0.5초
             sleep_time = self.poll_interval + random.uniform(0, 0.5)
             time.sleep(sleep_time)
 
+    def _poll_with_bar_builder(self, data_dict):
+        """
+        체결 전체(최대 100건)를 BarBuilder에 반영해 마감된 봉을 data_dict["bars"]로 전달.
+        kline은 kline_verify_sec마다 한 번만 호출해 로컬 봉과 대조.
+        """
+        deals = self._get_recent_deals(limit=100)
+        data_dict["deals"] = deals
+
+        closed_bars = self.bar_builder.add_deals(deals)
+        closed_bars.extend(self.bar_builder.close_expired(int(time.time() * 1000)))
+        data_dict["bars"] = closed_bars
+
+        if time.time() - self._last_kline_check >= self.kline_verify_sec:
+            data_dict["kline"] = self._get_kline_data(limit=5)
+            self.bar_builder.verify(data_dict["kline"])
+            self._last_kline_check = time.time()
+
     # ------------------------------------------------------------
     # GET helpers (with retry/backoff)
     # ------------------------------------------------------------
@@ -93,11 +138,16 @@ class MexcRestPollingFeed:
         """
         attempt = 0
         backoff_sec = 2  # 첫 백오프 2초 (단순 예시)
+        endpoint = endpoint_name(url)
 
         while attempt < self.max_retries:
             attempt += 1
             try:
+                started = time.perf_counter()
                 resp = self.session.get(url, params=params, timeout=5)
+                FEED_LATENCY.labels(endpoint).observe(time.perf_counter() - started)
+                if not resp.ok:
+                    FEED_ERRORS.labels(endpoint).inc()
 
                 if resp.status_code == 429:
                     # 레이트 리밋 초과 => 백오프 후 재시도
@@ -123,6 +173,7 @@ class MexcRestPollingFeed:
                 return resp.json()
 
             except requests.exceptions.RequestException as e:
+                FEED_ERRORS.labels(endpoint).inc()
                 logger.warning(f"[MexcRestPollingFeed] 연결 에러({e}). 백오프 {backoff_sec}s 후 재시도.")
                 time.sleep(backoff_sec)
                 backoff_sec *= 2
@@ -150,6 +201,10 @@ class MexcRestPollingFeed:
         return ticker_data.get("lastPrice")
 
     def _get_kline_data(self, limit=1):
+        if self.kline_cache:
+            self.kline_cache.sync(initial_limit=limit)
+            return self.kline_cache.to_kline_dict(limit)
+
         base = "https://futures.mexc.com/api/v1/contract/kline"
         url = f"{base}/{self.symbol}?interval={self.kline_interval}&limit={limit}"
         js = self._safe_get(url)
@@ -1,17 +1,38 @@
+import asyncio
 import csv
+import multiprocessing
 import time
 from datetime import datetime
 from loguru import logger
-from config.config import DEFAULT_SYMBOL
-from config.secrets import UIDS_PER_SYMBOL
+from config.config import (
+    DEFAULT_SYMBOL, LOCAL_BAR_INTERVAL, KLINE_VERIFY_SEC,
+    KLINE_CACHE_DIR, KLINE_BACKFILL_BARS,
+    MTF_TIMEFRAMES, EMA_SHORT, EMA_MID, EMA_LONG,
+    SHADOW_GRID_ENABLED, SHADOW_GRID_FAST_SPANS, SHADOW_GRID_MID_SPANS,
+    SHADOW_GRID_SLOW_SPANS, SHADOW_GRID_THRESHOLDS, SHADOW_GRID_LEADERBOARD_SEC,
+    SHADOW_STRATEGIES_ENABLED, SHADOW_REPORT_FILE, PIPELINE_MODE,
+    RUNTIME_MODE, ORDER_ROUTE, POSITION_SOURCE, PRIVATE_WS_ENABLED, CONTRACT_SPEC_TTL_SEC,
+    DRIVER_PROFILER_ENABLED, DRIVER_PROFILER_TOP_N,
+    LOG_LEVEL, LOG_FILE, LOG_ENQUEUE, TICK_LOG_MODE, TICK_LOG_INTERVAL_SEC, TICK_BINLOG_FILE,
+    METRICS_ENABLED, METRICS_HOST, METRICS_PORT,
+    SAMPLING_PROFILER_ENABLED, SAMPLING_PROFILER_HZ, SAMPLING_PROFILER_SEC, SAMPLING_PROFILER_DIR
+)
+from config.secrets import UIDS_PER_SYMBOL, MEXC_API_KEY, MEXC_API_SECRET
 from utils.license_manager import check_program_expiry, check_uid_valid
+from utils.logger import setup_logging, shutdown_logging, log_throttled
 from core.uid_auth import prompt_uid_and_auth
-from web_selenium.browser_stealth import BrowserStealth, set_cross_and_leverage_50
-from core.order_executor import OrderExecutor
 from core.position_tracker import PositionTracker
 from core.risk_manager import RiskManager
 from core.strategy import TradingStrategy
 from core.websocket_feed import MexcRestPollingFeed
+from core.bar_builder import BarBuilder
+from core.kline_cache import KlineCache
+from core.multi_timeframe import MultiTimeframeEMA
+from core.shadow_runner import ShadowRunner, DecisionTap
+from core.strategy_host import StrategyHost, EmaScalpPlugin
+from core.scheduler import Scheduler
+from core.contract_spec import ContractSpecCache
+from core.metrics import REGISTRY, MetricsServer, TICKS, LAST_TICK_TS, UNREALIZED_PNL, REALIZED_PNL, CURRENT_PROFIT
 
 
 def get_symbol_by_uid(uid: str) -> str:
@@ -20,36 +41,108 @@ def get_symbol_by_uid(uid: str) -> str:
             return symbol
     return DEFAULT_SYMBOL
 
-def on_data_received(data_dict, strategy: TradingStrategy, risk_manager: RiskManager):
+def on_data_received(data_dict, host: StrategyHost, strategy: TradingStrategy, risk_manager: RiskManager,
+                     shadow_grid=None, shadow_runner=None, tick_log=None):
     """
-    MexcRestPollingFeed로부터 받은 시세 데이터 처리:
+    MexcRestPollingFeed로부터 받은 시세 데이터 처리 (core/events.TickEvent, dict처럼 조회, 콜백 안에서만 유효):
     data_dict = {
       "lastPrice": float or None,
       "deals": [...],
-      "kline": [...]
+      "kline": [...],
+      "bars": [...]   # (로컬 봉 사용 시) 이번 폴링에서 마감된 봉
     }
     - 여기서는 'lastPrice'만 이용해 전략 실행 (체결/캔들은 참조용)
+    - 전략 실행은 StrategyHost가 등록된 모든 전략에 분배 (마감 봉 => on_bar, 현재가 => on_tick)
     """
     last_price = data_dict.get("lastPrice")
     if last_price is None:
         return
+    TICKS.inc()
+    LAST_TICK_TS.set(time.time())
 
     # 팝업 닫기 
     risk_manager.close_popups()
 
-    # 전략에 "현재가" 전달 -> on_new_price()
-    # 1분봉 마감 여부(candle_closed)는 알 수 없으므로 False로 넣음
-    strategy.on_new_price(float(last_price), candle_closed=False)
+    # 등록된 전략들에 마감 봉/현재가 전달
+    host.on_data(data_dict)
+
+    # 파라미터 격자 그림자 평가 (주문 없음)
+    if shadow_grid:
+        shadow_grid.on_tick(float(last_price))
+
+    # 후보 전략 그림자 실행: 큐에 넣기만 하고 평가는 별도 워커에서
+    if shadow_runner:
+        shadow_runner.submit(float(last_price), strategy.order_executor.drain())
 
     # 시세와 EMA 값을 로그로 출력
-    logger.info(
-        f"[시세] lastPrice={float(last_price):.4f}, "
-        f"EMA1={strategy.ema1:.4f}, EMA2={strategy.ema2:.4f}, EMA3={strategy.ema3:.4f}"
-    )
+    # - binary: 바이너리 틱 로그에 전부 기록 (python -m utils.binlog 로 CSV 변환)
+    # - text: TICK_LOG_INTERVAL_SEC마다 1줄 (포맷은 실제로 출력할 때만 수행)
+    if tick_log:
+        tick_log.write(time.time(), float(last_price), strategy.ema1, strategy.ema2, strategy.ema3)
+    elif TICK_LOG_MODE == "text":
+        log_throttled(
+            "INFO", TICK_LOG_INTERVAL_SEC,
+            "[시세] lastPrice={:.4f}, EMA1={:.4f}, EMA2={:.4f}, EMA3={:.4f}",
+            float(last_price), strategy.ema1, strategy.ema2, strategy.ema3
+        )
 
     # 목표 거래량 달성 체크
     risk_manager.check_volume_goal_and_sleep()
 
+def reset_daily_stats(position_tracker: PositionTracker):
+    """매일 15:00 거래량/손익 초기화."""
+    position_tracker._accumulated_volume = 0.0
+    position_tracker._realized_pnl = 0.0
+    logger.info("[main] 15:00 거래량/손익 초기화.")
+
+def log_minute_snapshot(position_tracker: PositionTracker, csv_filename: str):
+    """누적 거래량/실현손익을 CSV에 1줄 기록."""
+    acc_vol = position_tracker.get_accumulated_volume()
+    # a) 현재 순 PnL (=미실현+실현 모두 포함)
+    current_pnl = position_tracker.get_current_profit()
+    # b) 현재 미실현 PnL
+    ur_pnl = position_tracker.get_unrealized_pnl()
+    # c) 새 방식으로 뽑은 '현재 실현 PnL' = (current_pnl - ur_pnl)
+    realized_pnl_new = position_tracker.get_realized_pnl_by_balance()
+    UNREALIZED_PNL.set(ur_pnl)
+    REALIZED_PNL.set(realized_pnl_new)
+    CURRENT_PROFIT.set(current_pnl)
+
+    logger.info(
+        f"[main] current_pnl={current_pnl:.4f}, "
+        f"unrealized_pnl={ur_pnl:.4f}, "
+        f"realized_pnl={realized_pnl_new:.4f}"
+    )
+
+    with open(csv_filename, "a", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            f"{acc_vol:.4f}",
+            f"{realized_pnl_new:.4f}"
+        ])
+
+    logger.info(f"[main] 1분 로그 => 거래량={acc_vol:.4f}, 실현손익={current_pnl:.4f}")
+
+def register_live_metrics(position_tracker, strategy, risk_manager, driver, queues: dict):
+    """
+    스크레이프 때 읽어 가는 지표 등록 (틱 경로에는 비용 없음).
+    queues: {이름: 길이 반환 함수} - 런타임/스케줄러가 만들어지면 main에서 추가
+    Selenium 호출이 필요한 값(미실현 손익 등)은 1분 스냅샷에서 게이지로 갱신.
+    """
+    REGISTRY.callback("mexc_accumulated_volume_usdt", "오늘 누적 거래금액", position_tracker.get_accumulated_volume)
+    REGISTRY.callback("mexc_position_units", "현재 포지션 크기 (base_unit 배수)",
+                      lambda: {("LONG",): strategy.long_size, ("SHORT",): strategy.short_size}, ("side",))
+    REGISTRY.callback("mexc_paused", "휴식 중이면 1", lambda: 1 if risk_manager.pause_end_time else 0)
+    REGISTRY.callback("mexc_queue_depth", "내부 큐 대기 길이",
+                      lambda: {(name,): size() for name, size in queues.items()}, ("queue",))
+    profiler = getattr(driver, "profiler", None)
+    if profiler is not None:
+        REGISTRY.callback("mexc_webdriver_calls_total", "WebDriver 호출 수",
+                          lambda: {(op,): c for op, (c, _) in list(profiler.totals.items())}, ("op",), kind="counter")
+        REGISTRY.callback("mexc_webdriver_seconds_total", "WebDriver 호출 누적 시간",
+                          lambda: {(op,): s for op, (_, s) in list(profiler.totals.items())}, ("op",), kind="counter")
+
 def prompt_user_seed() -> float:
     """사용자로부터 운용시드(USDT) 입력받기"""
     while True:
@@ -64,6 +157,7 @@ def prompt_user_seed() -> float:
             logger.warning("잘못된 입력입니다. 숫자를 입력하세요.")
 
 def main():
+    setup_logging(level=LOG_LEVEL, log_file=LOG_FILE, enqueue=LOG_ENQUEUE)
     logger.info("=== MEXC 무손실 거래량 쌓기 (REST 폴링 버전) 시작 ===")
 
     # 1) 프로그램 만료일 확인
@@ -80,9 +174,22 @@ def main():
     # 3) 사용자 운용시드 입력
     user_seed = prompt_user_seed()
 
+    # (선택) 멀티 프로세스 모드: 피드/전략/실행기를 별도 프로세스로 실행
+    if PIPELINE_MODE == "multiprocess":
+        from core.pipeline import run_pipeline
+        run_pipeline(user_symbol, user_seed)
+        return
+
     # 4) 브라우저 초기화 + MEXC 로그인
+    #    (Selenium/undetected-chromedriver는 여기서 처음 import => UID/시드 입력까지 대기 없음)
+    from web_selenium.browser_stealth import BrowserStealth, set_cross_and_leverage_50
+    from core.order_executor import OrderExecutor
+
     stealth = BrowserStealth()
     driver = stealth.init_driver()
+    if DRIVER_PROFILER_ENABLED:
+        from core.driver_profiler import ProfiledDriver
+        driver = ProfiledDriver(driver, report_sec=60, top_n=DRIVER_PROFILER_TOP_N)
     stealth.login_mexc(driver)
     stealth.go_to_usdt_m_futures(driver)
 
@@ -97,12 +204,36 @@ def main():
 
     risk_manager.close_popups()
 
-    position_tracker = PositionTracker(symbol=user_symbol, driver=driver)
+    # 계약 사양 (계약 크기/수량 단위/호가 단위) - 디스크 캐시가 만료됐으면 API 1회로 전 심볼 갱신
+    contract_specs = ContractSpecCache(cache_dir=KLINE_CACHE_DIR, ttl_sec=CONTRACT_SPEC_TTL_SEC)
+    contract_specs.ensure()
+    contract_size = contract_specs.contract_size(user_symbol)
+
+    dom_tracker = PositionTracker(symbol=user_symbol, driver=driver)
+    position_tracker = dom_tracker
+    if POSITION_SOURCE == "api":
+        # private API로 포지션/자산 조회, 실패 시 DOM 파싱으로 대체
+        from core.api_position_tracker import ApiPositionTracker
+        position_tracker = ApiPositionTracker(
+            user_symbol, MEXC_API_KEY, MEXC_API_SECRET,
+            contract_size=contract_size, fallback=dom_tracker
+        )
+    private_ws = None
+    if POSITION_SOURCE == "api" and PRIVATE_WS_ENABLED:
+        # 푸시로 계좌 상태 유지 (재연결 시 REST 스냅샷으로 복구)
+        from core.private_ws import AccountState, PrivateWsClient
+        position_tracker.account_state = AccountState(user_symbol, contract_size=contract_size)
+        private_ws = PrivateWsClient(
+            MEXC_API_KEY, MEXC_API_SECRET, position_tracker.account_state,
+            snapshot_provider=position_tracker.snapshot_provider()
+        )
+        private_ws.start()
     # 초기 자산 세팅
     position_tracker.set_initial_balance()
 
     risk_manager.position_tracker = position_tracker
-    order_executor = OrderExecutor(driver, symbol=user_symbol, risk_manager=risk_manager)
+    order_executor = OrderExecutor(driver, symbol=user_symbol, risk_manager=risk_manager,
+                                   contract_specs=contract_specs)
 
     # position_tracker에 임시 executor 연결 -> 포지션 정리용
     position_tracker.temp_order_executor = order_executor
@@ -114,17 +245,110 @@ def main():
     strategy = TradingStrategy(symbol=user_symbol, position_tracker=position_tracker, risk_manager=risk_manager)
     strategy.set_order_executor(order_executor)
     strategy.set_user_seed(user_seed)
+    strategy.set_contract_specs(contract_specs)
+
+    # (선택) asyncio 런타임에서 private API로 주문 (포지션 정리는 계속 Selenium executor 사용)
+    use_async = RUNTIME_MODE == "asyncio"
+    order_client = None
+    if use_async:
+        from core.async_runtime import AsyncMexcFeed, AsyncRuntime, AsyncOrderClient, ApiOrderExecutor
+        if ORDER_ROUTE == "api":
+            order_client = AsyncOrderClient(MEXC_API_KEY, MEXC_API_SECRET)
+            strategy.set_order_executor(
+                ApiOrderExecutor(order_client, user_symbol, contract_size=contract_size,
+                                 contract_specs=contract_specs)
+            )
+    elif ORDER_ROUTE == "api":
+        logger.warning("[main] ORDER_ROUTE='api'는 RUNTIME_MODE='asyncio'에서만 지원 => Selenium 주문 사용")
+
+    # 전략 호스트: 피드 1개로 여러 전략 실행 (실전 전략은 EmaScalpPlugin으로 등록)
+    host = StrategyHost()
+    host.add(EmaScalpPlugin(strategy))
+
+    # (선택) 파라미터 격자 그림자 평가기 - numpy가 필요하므로 사용할 때만 import
+    shadow_grid = None
+    if SHADOW_GRID_ENABLED:
+        from core.shadow_grid import ShadowGrid
+        shadow_grid = ShadowGrid(
+            fast_spans=SHADOW_GRID_FAST_SPANS,
+            mid_spans=SHADOW_GRID_MID_SPANS,
+            slow_spans=SHADOW_GRID_SLOW_SPANS,
+            thresholds=SHADOW_GRID_THRESHOLDS,
+            leaderboard_sec=SHADOW_GRID_LEADERBOARD_SEC
+        )
+
+    # (선택) 후보 전략 그림자 실행 - 실전 executor를 DecisionTap으로 감싸 실제 결정을 기록
+    shadow_runner = None
+    if SHADOW_STRATEGIES_ENABLED:
+        from strategyupdate import TradingStrategy as CandidateStrategy
+        candidate = CandidateStrategy(symbol=user_symbol)
+        candidate.set_user_seed(user_seed)
+        strategy.set_order_executor(DecisionTap(strategy.order_executor))
+        shadow_runner = ShadowRunner({"strategyupdate": candidate}, report_file=SHADOW_REPORT_FILE)
+        shadow_runner.start()
 
     # 6) REST 폴링 피드 시작
-    feed = MexcRestPollingFeed(
-        symbol=user_symbol,
-        on_data_callback=lambda d: on_data_received(d, strategy, risk_manager),
-        poll_interval=0.5,       # 0.5초마다 호출
-        kline_interval="Min1"
-    )
-    feed.start()
-
-    last_reset_date = None
+    #    (LOCAL_BAR_INTERVAL 지정 시 체결로 봉을 만들고 kline은 대조용으로만 호출)
+    bar_builder = BarBuilder(interval=LOCAL_BAR_INTERVAL) if LOCAL_BAR_INTERVAL else None
+    #    K라인은 캐시에서 증분 동기화 (지난 실행분은 디스크에서 로드)
+    kline_cache = KlineCache(user_symbol, interval="Min1", cache_dir=KLINE_CACHE_DIR)
+    kline_cache.load()
+
+    # 다중 주기 EMA 엔진: 캐시된 1분봉으로 미리 채운 뒤 틱마다 갱신
+    def warm_up_timeframes():
+        if MTF_TIMEFRAMES:
+            mtf = MultiTimeframeEMA(MTF_TIMEFRAMES, spans=(EMA_SHORT, EMA_MID, EMA_LONG))
+            mtf.warm_up(kline_cache.history())
+            strategy.set_timeframe_engine(mtf)
+
+    # (선택) 로컬 메트릭 엔드포인트 (Prometheus pull)
+    metrics_server = None
+    metric_queues = {}
+    if METRICS_ENABLED:
+        if shadow_runner:
+            metric_queues["shadow"] = shadow_runner.qsize
+        register_live_metrics(position_tracker, strategy, risk_manager, driver, metric_queues)
+        metrics_server = MetricsServer(REGISTRY, host=METRICS_HOST, port=METRICS_PORT)
+        metrics_server.start()
+
+    # (선택) 실행 중 켜는 샘플링 프로파일러 (시그널 / GET /profile)
+    sampling_profiler = None
+    if SAMPLING_PROFILER_ENABLED:
+        from core.sampling_profiler import SamplingProfiler
+        sampling_profiler = SamplingProfiler(hz=SAMPLING_PROFILER_HZ, output_dir=SAMPLING_PROFILER_DIR)
+        sampling_profiler.install_signal(SAMPLING_PROFILER_SEC)
+        if metrics_server:
+            metrics_server.add_route("/profile", sampling_profiler.http_handler(SAMPLING_PROFILER_SEC))
+
+    tick_log = None
+    if TICK_LOG_MODE == "binary":
+        from utils.binlog import BinaryTickLog
+        tick_log = BinaryTickLog(TICK_BINLOG_FILE)
+
+    on_data = lambda d: on_data_received(d, host, strategy, risk_manager, shadow_grid, shadow_runner, tick_log)
+    if use_async:
+        # backfill/warm-up은 AsyncRuntime.run() 시작 시 수행
+        feed = AsyncMexcFeed(
+            symbol=user_symbol,
+            poll_interval=0.5,
+            kline_interval="Min1",
+            bar_builder=bar_builder,
+            kline_verify_sec=KLINE_VERIFY_SEC,
+            kline_cache=kline_cache,
+            backfill_bars=KLINE_BACKFILL_BARS
+        )
+    else:
+        feed = MexcRestPollingFeed(
+            symbol=user_symbol,
+            on_data_callback=on_data,
+            poll_interval=0.5,       # 0.5초마다 호출
+            kline_interval="Min1",
+            bar_builder=bar_builder,
+            kline_verify_sec=KLINE_VERIFY_SEC,
+            kline_cache=kline_cache
+        )
+        kline_cache.backfill(bars=KLINE_BACKFILL_BARS)
+        warm_up_timeframes()
 
     # 주기적으로 CSV에 기록
     csv_filename = "trading_log.csv"
@@ -132,48 +356,34 @@ def main():
         writer = csv.writer(f)
         writer.writerow(["Timestamp", "AccumulatedVolume", "RealizedPnL"])
 
-    last_log_time = time.time()
-
+    scheduler = None
     try:
-        while True:
+        if use_async:
+            # 피드·주기 작업·API 주문은 이벤트 루프에서, Selenium 호출은 전용 스레드에서
+            runtime = AsyncRuntime(feed, on_data, order_client=order_client, on_ready=warm_up_timeframes)
+            metric_queues["async_latest"] = runtime.queue_depth
+            runtime.daily_at(15, 0, lambda: reset_daily_stats(position_tracker), name="daily_reset")
+            runtime.every(60, lambda: log_minute_snapshot(position_tracker, csv_filename), name="minute_log")
+            runtime.every(5, risk_manager.check_session_and_relogin, name="session_check")
+            asyncio.run(runtime.run())
+        else:
+            # 주기 작업은 스케줄러가 정확한 시각에만 깨어나 실행 (휴식 종료도 RiskManager가 예약)
+            scheduler = Scheduler(clock=risk_manager.clock)
+            metric_queues["scheduler"] = scheduler.pending
+            risk_manager.set_scheduler(scheduler)
             # (1) 매일 15:00에 거래량=0으로 리셋
-            now = datetime.now()
-            if now.hour == 15 and last_reset_date != now.date():
-                position_tracker._accumulated_volume = 0.0
-                position_tracker._realized_pnl = 0.0
-                last_reset_date = now.date()
-                logger.info("[main] 15:00 거래량/손익 초기화.")
-
-            # 1시간 간격으로 CSV 로그 기록
-            if time.time() - last_log_time >= 60:
-                acc_vol = position_tracker.get_accumulated_volume()
-                # a) 현재 순 PnL (=미실현+실현 모두 포함)
-                current_pnl = position_tracker.get_current_profit()
-                # b) 현재 미실현 PnL
-                ur_pnl = position_tracker.get_unrealized_pnl()
-                # c) 새 방식으로 뽑은 '현재 실현 PnL' = (current_pnl - ur_pnl)
-                realized_pnl_new = position_tracker.get_realized_pnl_by_balance()
-
-                logger.info(
-                    f"[main] current_pnl={current_pnl:.4f}, "
-                    f"unrealized_pnl={ur_pnl:.4f}, "
-                    f"realized_pnl={realized_pnl_new:.4f}"
-                )
-
-                with open(csv_filename, "a", newline="") as f:
-                    writer = csv.writer(f)
-                    writer.writerow([
-                        now.strftime("%Y-%m-%d %H:%M:%S"),
-                        f"{acc_vol:.4f}",
-                        f"{realized_pnl_new:.4f}"
-                    ])
-
-                logger.info(f"[main] 1분 로그 => 거래량={acc_vol:.4f}, 실현손익={current_pnl:.4f}")
-                last_log_time = time.time()
-
+            scheduler.daily_at(15, 0, lambda: reset_daily_stats(position_tracker), name="daily_reset")
+            # 1분 간격으로 CSV 로그 기록
+            scheduler.every(60, lambda: log_minute_snapshot(position_tracker, csv_filename), name="minute_log")
             # (2) 세션 만료 체크 -> 재로그인
-            risk_manager.check_session_and_relogin()
-            time.sleep(5)
+            scheduler.every(5, risk_manager.check_session_and_relogin, name="session_check")
+            scheduler.every(600, scheduler.log_report, name="scheduler_report")
+            scheduler.every(600, order_executor.elements.log_stats, name="element_cache_report")
+            scheduler.every(600, order_executor.log_latency, name="order_latency_report")
+            scheduler.every(600, dom_tracker.waiter.log_stats, name="ui_wait_report")
+
+            feed.start()
+            scheduler.run_forever()
 
     except KeyboardInterrupt:
         logger.info("사용자 Ctrl+C 종료.")
@@ -181,11 +391,35 @@ def main():
         logger.info("[main] 프로그램 종료 전, 모든 포지션 강제 청산 시도.")
         position_tracker.close_all_positions()
         feed.stop()
+        host.stop()
+        if scheduler:
+            scheduler.stop()
+            scheduler.log_report()
+        kline_cache.save()
+        if private_ws:
+            private_ws.stop()
+        if shadow_grid:
+            shadow_grid.log_leaderboard()
+        if shadow_runner:
+            shadow_runner.stop()
+        order_executor.elements.log_stats()
+        order_executor.log_latency()
+        dom_tracker.waiter.log_stats()
+        if DRIVER_PROFILER_ENABLED:
+            driver.profiler.report()
         driver.quit()
+        if tick_log:
+            tick_log.close()
+        if metrics_server:
+            metrics_server.stop()
+        if sampling_profiler and sampling_profiler.running:
+            sampling_profiler.stop()
         logger.info("=== 프로그램 종료 ===")
+        shutdown_logging()
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # PyInstaller 빌드에서 하위 프로세스 실행용
     main()
 
 
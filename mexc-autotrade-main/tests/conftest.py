@@ -0,0 +1,9 @@
+import pytest
+from loguru import logger
+
+
+@pytest.fixture(autouse=True)
+def quiet_logger():
+    # 매 주문 INFO 로그는 테스트 출력에서 제외
+    logger.remove()
+    yield
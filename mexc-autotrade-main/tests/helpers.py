@@ -0,0 +1,40 @@
+import csv
+import random
+from datetime import datetime, timedelta
+
+
+def random_walk(n, seed=3, start=3000.0, sigma=0.001):
+    rng = random.Random(seed)
+    price = start
+    prices = []
+    for _ in range(n):
+        price *= 1 + rng.gauss(0, sigma)
+        prices.append(price)
+    return prices
+
+
+def bar_lines(prices, start=datetime(2025, 3, 3)):
+    """BacktestSimulator 형식(datetime, open, high, low, close, volume) CSV 행 (줄바꿈 포함)."""
+    return [
+        f"{(start + timedelta(minutes=i)).isoformat()},{p!r},{p!r},{p!r},{p!r},1\n"
+        for i, p in enumerate(prices)
+    ]
+
+
+BAR_HEADER = "datetime,open,high,low,close,volume\n"
+
+
+def write_bars(path, prices):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(BAR_HEADER + "".join(bar_lines(prices)))
+    return str(path)
+
+
+def write_deals(path, deals):
+    """MEXC deals 필드 그대로 (p=가격, v=수량, T=방향 1/2, t=epoch ms)."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["p", "v", "T", "t"])
+        for price, volume, side, ts_ms in deals:
+            writer.writerow([price, volume, side, ts_ms])
+    return str(path)
@@ -0,0 +1,164 @@
+import hashlib
+import hmac
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+
+from core.api_position_tracker import ApiPosition, ApiPositionTracker
+
+SYMBOL = "BTC_USDT"
+API_KEY, API_SECRET = "key", "secret"
+
+POSITIONS = [
+    {"symbol": SYMBOL, "positionType": 1, "holdVol": 25, "holdAvgPrice": 60000.5, "liquidatePrice": 40000,
+     "leverage": 50},
+    {"symbol": SYMBOL, "positionType": 2, "holdVol": 0, "holdAvgPrice": 61000},     # 빈 포지션 => 제외
+    {"symbol": "ETH_USDT", "positionType": 2, "holdVol": 3, "holdAvgPrice": 3000},  # 다른 심볼 => 제외
+]
+ASSET = {"currency": "USDT", "equity": 150.25, "availableBalance": 100.0, "positionMargin": 50.0,
+         "unrealized": -1.5}
+
+
+class StandInApi:
+    """
+    MEXC private REST 대역. 요청마다 서명을 검증해 기록하고,
+    responses[path] = (HTTP 상태, 본문 객체)로 응답 (본문이 None이면 JSON이 아닌 텍스트).
+    목록이면 요청마다 앞에서 하나씩 꺼내고 마지막 응답은 계속 사용.
+    """
+
+    def __init__(self):
+        self.reset()
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlsplit(self.path)
+                expected = hmac.new(
+                    API_SECRET.encode(),
+                    f"{self.headers['ApiKey']}{self.headers['Request-Time']}{url.query}".encode(),
+                    hashlib.sha256,
+                ).hexdigest()
+                api.requests.append((url.path, url.query, self.headers["Signature"] == expected))
+                entry = api.responses[url.path]
+                if isinstance(entry, list):
+                    entry = entry.pop(0) if len(entry) > 1 else entry[0]
+                status, body = entry
+                payload = b"<html>gateway error</html>" if body is None else json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def reset(self):
+        self.requests = []
+        self.responses = {
+            "/api/v1/private/position/open_positions": (200, {"success": True, "code": 0, "data": POSITIONS}),
+            "/api/v1/private/account/asset/USDT": (200, {"success": True, "code": 0, "data": ASSET}),
+        }
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class FakeDomTracker:
+    def __init__(self):
+        self.stable_waits = []
+
+    def get_open_positions(self):
+        return [{"symbol": SYMBOL, "positionSide": "SHORT", "size": 0.7}]
+
+    def get_total_balance(self):
+        return 99.0
+
+    def wait_positions_stable(self, timeout=1.0):
+        self.stable_waits.append(timeout)
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = StandInApi()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def api(server):
+    server.reset()
+    return server
+
+
+@pytest.fixture
+def tracker(api):
+    return ApiPositionTracker(SYMBOL, API_KEY, API_SECRET, contract_size=0.0001, fallback=FakeDomTracker(),
+                              base_url=api.base_url)
+
+
+def test_signed_requests_and_field_mapping(api, tracker):
+    assert tracker.fetch_positions() == [ApiPosition(SYMBOL, "LONG", 0.0025, 25.0, 60000.5, 40000.0, 50)]
+    assert tracker.get_open_positions() == [{"symbol": SYMBOL, "positionSide": "LONG", "size": 0.0025}]
+    assert tracker.get_total_balance() == 150.25
+    assert tracker.get_unrealized_pnl() == -1.5
+
+    assert api.requests[0] == ("/api/v1/private/position/open_positions", f"symbol={SYMBOL}", True)
+    assert api.requests[-1] == ("/api/v1/private/account/asset/USDT", "", True)
+    assert all(signed for _, _, signed in api.requests)
+    assert tracker.fallback_count == 0
+
+
+@pytest.mark.parametrize("status, body", [
+    (500, {"success": False, "code": 500}),
+    (502, None),
+    (200, None),
+    (200, ["not", "a", "dict"]),
+    (200, {"success": False, "code": 602, "message": "Signature verification failed"}),
+    (200, {"success": True, "code": 0, "data": {"unexpected": "shape"}}),
+])
+def test_bad_responses_fall_back_to_dom_tracker(api, tracker, status, body):
+    api.responses["/api/v1/private/position/open_positions"] = (status, body)
+    api.responses["/api/v1/private/account/asset/USDT"] = (status, body)
+
+    assert tracker.get_open_positions() == [{"symbol": SYMBOL, "positionSide": "SHORT", "size": 0.7}]
+    assert tracker.get_total_balance() == 99.0
+    assert tracker.fallback_count == 2
+
+
+def test_wait_positions_stable_polls_until_two_reads_match(api, tracker):
+    tracker.wait_positions_stable(timeout=1.0)
+
+    # 첫 조회 + 같은 값 재조회 1회 => 반환
+    assert [path for path, _, _ in api.requests].count("/api/v1/private/position/open_positions") == 2
+    assert tracker.fallback.stable_waits == []
+
+
+def test_wait_positions_stable_waits_for_fill_to_settle(api, tracker):
+    filled = [dict(POSITIONS[0], holdVol=40)]
+    api.responses["/api/v1/private/position/open_positions"] = [
+        (200, {"success": True, "code": 0, "data": POSITIONS}),
+        (200, {"success": True, "code": 0, "data": filled}),
+        (200, {"success": True, "code": 0, "data": filled}),
+    ]
+
+    tracker.wait_positions_stable(timeout=1.0)
+
+    assert len(api.requests) == 3
+    assert tracker.fetch_positions()[0].contracts == 40
+
+
+def test_wait_positions_stable_uses_dom_wait_when_api_fails(api, tracker):
+    api.responses["/api/v1/private/position/open_positions"] = (503, None)
+
+    tracker.wait_positions_stable(timeout=1.0)
+
+    assert len(tracker.fallback.stable_waits) == 1
+    assert 0.5 < tracker.fallback.stable_waits[0] <= 1.0
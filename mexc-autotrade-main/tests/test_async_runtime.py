@@ -0,0 +1,160 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.async_runtime import ApiOrderExecutor, AsyncOrderClient, AsyncRuntime
+from core.events import EventPool, TickEvent
+
+SYMBOL = "BTC_USDT"
+API_KEY, API_SECRET = "key", "secret"
+
+
+class FakeFeed:
+    """
+    AsyncMexcFeed 대역: 시작하자마자 시세 events개를 연달아 publish (그 사이 await 없음 => 소비 전에 병합됨),
+    이후 on_data 처리가 끝날 때까지 기다렸다가 반환 => 런타임 종료.
+    """
+
+    def __init__(self, events, done):
+        self.events = events
+        self.done = done
+        self.session = None
+        self.kline_cache = None
+        self.backfill_bars = 0
+        self.pool = EventPool(TickEvent)
+        self.stopped = False
+
+    def stop(self):
+        self.stopped = True
+
+    async def run(self, publish):
+        for price, bars in self.events:
+            event = self.pool.acquire()
+            event["lastPrice"] = price
+            event["bars"] = bars
+            publish(event)
+        deadline = time.time() + 5
+        while not self.done() and time.time() < deadline:
+            await asyncio.sleep(0.01)
+
+
+class StandInOrderApi:
+    """주문 submit 대역: 서명을 검증해 본문을 기록하고, 성공 응답(주문 ID)을 돌려줌."""
+
+    def __init__(self):
+        self.orders = []
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"])).decode()
+                expected = hmac.new(
+                    API_SECRET.encode(),
+                    f"{self.headers['ApiKey']}{self.headers['Request-Time']}{body}".encode(),
+                    hashlib.sha256,
+                ).hexdigest()
+                api.orders.append((json.loads(body), self.headers["Signature"] == expected))
+                payload = json.dumps({"success": True, "code": 0, "data": f"order-{len(api.orders)}"}).encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}/api/v1/private/order/submit"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def order_api():
+    api = StandInOrderApi()
+    yield api
+    api.close()
+
+
+def test_pending_ticks_coalesce_and_keep_closed_bars():
+    seen = []
+
+    def on_data(data):
+        # 이벤트는 처리 후 풀에 반납되므로 값만 복사
+        seen.append((data.get("lastPrice"), list(data.get("bars", []))))
+
+    feed = FakeFeed([(100.0, ["b1"]), (101.0, []), (102.0, ["b2"])], done=lambda: len(seen) == 1)
+    runtime = AsyncRuntime(feed, on_data)
+    asyncio.run(runtime.run())
+
+    # 최신 시세 하나만 전달, 건너뛴 시세의 마감 봉은 순서대로 이어 붙임
+    assert seen == [(102.0, ["b1", "b2"])]
+    assert runtime.coalesced == 2
+    assert feed.stopped
+    # 병합으로 버린 이벤트는 바로 반납되어 다음 시세에 재사용 => 3틱에 객체 2개
+    assert feed.pool.created == 2
+    assert len(feed.pool._free) == 2
+    assert all(event.last_price is None and event.bars == () for event in feed.pool._free)
+
+
+def test_on_data_and_jobs_run_on_one_blocking_thread():
+    threads = []
+    ticks = []
+
+    def on_data(data):
+        threads.append(threading.current_thread().name)
+        ticks.append(data["lastPrice"])
+
+    feed = FakeFeed([(100.0, [])], done=lambda: ticks and len(threads) >= 4)
+    runtime = AsyncRuntime(feed, on_data)
+    runtime.every(0.02, lambda: threads.append(threading.current_thread().name), name="job")
+    runtime.every(0.02, lambda: 1 / 0, name="broken")  # 예외는 무시하고 계속 실행
+    asyncio.run(runtime.run())
+
+    assert ticks == [100.0]
+    assert len(set(threads)) == 1 and threads[0].startswith("selenium")
+
+
+def test_api_order_executor_submits_signed_market_orders(order_api):
+    client = AsyncOrderClient(API_KEY, API_SECRET, leverage=50)
+    client.SUBMIT_URL = order_api.url
+    executor = ApiOrderExecutor(client, SYMBOL, contract_size=0.0001)
+    results = []
+
+    def on_data(data):
+        results.append(executor.place_market_order("LONG", 0.0025))
+        results.append(executor.close_position("SHORT", 0.001))
+        results.append(executor.place_market_order("SHORT", 0.00001))  # 계약 1개 미만 => 전송 안 함
+
+    feed = FakeFeed([(60000.0, [])], done=lambda: len(results) == 3)
+    asyncio.run(AsyncRuntime(feed, on_data, order_client=client).run())
+
+    assert results == [True, True, False]
+    assert [signed for _, signed in order_api.orders] == [True, True]
+    first, second = (body for body, _ in order_api.orders)
+    assert first == {"symbol": SYMBOL, "price": 0, "vol": 25, "side": 1, "type": 5, "openType": 2, "leverage": 50}
+    assert (second["vol"], second["side"]) == (10, 2)
+
+
+def test_api_order_executor_refuses_calls_from_loop_thread():
+    client = AsyncOrderClient(API_KEY, API_SECRET)
+    executor = ApiOrderExecutor(client, SYMBOL, contract_size=0.0001)
+
+    # 루프 시작 전 => 실패
+    assert executor.place_market_order("LONG", 0.001) is False
+
+    async def call_from_loop():
+        client.attach(session=None)
+        with pytest.raises(RuntimeError):
+            executor.place_market_order("LONG", 0.001)
+
+    asyncio.run(call_from_loop())
@@ -0,0 +1,50 @@
+import pytest
+
+from core.bar_builder import BarBuilder, parse_interval_sec
+
+T0 = 1_740_960_000_000  # 1분 경계 (ms)
+
+
+def _deal(price, volume, ts, side=1):
+    return {"p": price, "v": volume, "T": side, "t": ts}
+
+
+@pytest.mark.parametrize("interval, seconds", [("1s", 1), ("5m", 300), ("Min15", 900), ("Hour4", 14400), (60, 60)])
+def test_parse_interval_sec(interval, seconds):
+    assert parse_interval_sec(interval) == seconds
+
+
+def test_deals_build_ohlcv_and_skip_already_seen():
+    closed = []
+    builder = BarBuilder("1m", on_bar_closed=closed.append)
+    first_poll = [_deal(100.0, 1, T0 + 30_000), _deal(102.0, 2, T0 + 10_000), _deal(99.0, 1, T0 + 20_000)]
+
+    assert builder.add_deals(first_poll) == []
+    # 다음 폴링은 이전 체결 일부를 다시 포함 (최신순 응답)
+    bars = builder.add_deals([_deal(101.0, 3, T0 + 61_000)] + first_poll)
+
+    assert len(bars) == 1 and closed == bars
+    bar = bars[0]
+    assert (bar.start_ts, bar.open, bar.high, bar.low, bar.close) == (T0, 102.0, 102.0, 99.0, 100.0)
+    assert (bar.volume, bar.trade_count) == (4.0, 3)
+    assert builder.current_bar.start_ts == T0 + 60_000
+
+
+def test_late_deal_after_close_expired_does_not_reopen_bucket():
+    closed = []
+    builder = BarBuilder("1m", close_grace_ms=1500, on_bar_closed=closed.append)
+    builder.update(100.0, 1, T0 + 5_000)
+
+    assert builder.close_expired(T0 + 60_000 + 1_000) == []   # 유예 시간 전
+    assert len(builder.close_expired(T0 + 60_000 + 1_500)) == 1
+    assert builder.current_bar is None
+
+    # 방금 마감한 주기의 지연 체결 => 버림 (같은 주기 봉이 두 번 나가지 않음)
+    assert builder.update(101.0, 1, T0 + 59_000) == []
+    assert builder.current_bar is None
+    assert builder.late_deals == 1
+
+    # 다음 주기 체결은 새 봉
+    builder.update(102.0, 1, T0 + 61_000)
+    assert [bar.start_ts for bar in builder.close_expired(T0 + 121_500)] == [T0 + 60_000]
+    assert [bar.start_ts for bar in closed] == [T0, T0 + 60_000]
@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from core.contract_spec import ContractSpecCache
+
+DETAIL = {"success": True, "code": 0, "data": [
+    {"symbol": "BTC_USDT", "contractSize": 0.0001, "minVol": 1, "volUnit": 1, "maxVol": 1000000,
+     "priceUnit": 0.1, "maxLeverage": 200},
+    {"symbol": "PEPE_USDT", "contractSize": 10000000, "minVol": 1, "volUnit": 1, "maxVol": 500000,
+     "priceUnit": 0.00000001, "maxLeverage": 50},
+    {"symbol": "SOL_USDT", "contractSize": 0.1, "minVol": 5, "volUnit": 5, "maxVol": 100000,
+     "maxLeverage": 100},  # priceUnit 없음
+]}
+
+
+@pytest.fixture
+def specs(tmp_path):
+    calls = []
+
+    def fetch_json(url, params):
+        calls.append(url)
+        return DETAIL
+
+    specs = ContractSpecCache(cache_dir=str(tmp_path), fetch_json=fetch_json)
+    specs.calls = calls
+    assert specs.ensure() == 3
+    return specs
+
+
+def test_ensure_reuses_fresh_disk_cache(specs, tmp_path):
+    reloaded = ContractSpecCache(cache_dir=str(tmp_path), fetch_json=lambda url, params: pytest.fail("API 호출"))
+
+    assert reloaded.ensure() == 3
+    assert reloaded.get("PEPE_USDT") == specs.get("PEPE_USDT")
+    assert len(specs.calls) == 1
+    assert json.loads((tmp_path / "contract_specs.json").read_text())["rows"] == DETAIL["data"]
+
+
+def test_quantize_qty_floors_to_qty_step(specs):
+    assert specs.quantize_qty("BTC_USDT", 0.012345) == 0.0123
+    assert specs.quantize_qty("BTC_USDT", 0.1 + 0.2) == 0.3
+    assert specs.quantize_qty("SOL_USDT", 1.37) == 1.0
+    assert specs.to_contracts("SOL_USDT", 1.5) == 15
+
+
+def test_quantize_price_uses_known_tick_only(specs):
+    assert specs.quantize_price("BTC_USDT", 60000.04) == 60000.0
+    assert specs.quantize_price("PEPE_USDT", 0.0000123456) == 0.00001235
+    # 응답에 호가 단위가 없거나 사양 자체가 없는 심볼 => 0.1로 가정하지 않고 그대로
+    assert specs.quantize_price("SOL_USDT", 142.137) == 142.137
+    assert specs.quantize_price("NEW_USDT", 0.0123) == 0.0123
+    assert specs.get("NEW_USDT").price_unit is None
+
+
+@pytest.mark.parametrize("symbol, qty, ok", [
+    ("BTC_USDT", 0.0001, True),
+    ("BTC_USDT", 0.00005, False),     # 최소 미만
+    ("BTC_USDT", 100.0001, False),    # 최대 초과
+    ("SOL_USDT", 1.0, True),
+    ("SOL_USDT", 0.4, False),         # 최소 5계약 미만
+    ("SOL_USDT", 0.7, False),         # 5계약 단위가 아님
+])
+def test_validate_qty(specs, symbol, qty, ok):
+    valid, reason = specs.validate_qty(symbol, qty)
+    assert valid is ok
+    assert (reason == "") is ok
+
+
+def test_failed_refresh_keeps_expired_disk_cache(specs, tmp_path):
+    stale = ContractSpecCache(cache_dir=str(tmp_path), ttl_sec=0,
+                              fetch_json=lambda url, params: {"success": False, "code": 510})
+
+    assert stale.ensure() == 3
+    assert stale.qty_step("SOL_USDT") == 0.5
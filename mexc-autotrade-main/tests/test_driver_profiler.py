@@ -0,0 +1,56 @@
+from core.driver_profiler import ProfiledDriver
+
+
+class FakeDriver:
+    def __init__(self):
+        self.calls = []
+        self.current_url = "https://futures.mexc.com/exchange/BTC_USDT"
+
+    def execute_script(self, script, *args):
+        self.calls.append(("execute_script", args))
+        return "sync"
+
+    def execute_async_script(self, script, *args):
+        self.calls.append(("execute_async_script", args))
+        return {"ok": True}
+
+    def find_elements(self, by, value):
+        self.calls.append(("find_elements", (by, value)))
+        return []
+
+    def get(self, url):
+        self.calls.append(("get", (url,)))
+
+
+def submit_order(driver):
+    return driver.execute_async_script("done(...)", "0.3")
+
+
+def test_async_script_and_driver_calls_are_timed_per_caller():
+    fake = FakeDriver()
+    driver = ProfiledDriver(fake, report_sec=3600)
+
+    assert submit_order(driver) == {"ok": True}
+    assert submit_order(driver) == {"ok": True}
+    assert driver.execute_script("return 1") == "sync"
+    assert driver.find_elements("xpath", "//div") == []
+    driver.get("about:blank")
+    assert driver.current_url.endswith("BTC_USDT")
+
+    totals = {op: count for op, (count, _) in driver.profiler.totals.items()}
+    assert totals == {"execute_async_script": 2, "execute_script": 1, "find_elements": 1, "get": 1, "current_url": 1}
+    assert [c[0] for c in fake.calls] == [
+        "execute_async_script", "execute_async_script", "execute_script", "find_elements", "get"]
+
+    rows = {(tag, op): count for tag, op, count, _, _ in driver.profiler.snapshot()}
+    assert rows[("submit_order", "execute_async_script")] == 2
+
+
+def test_report_resets_window_but_keeps_totals():
+    driver = ProfiledDriver(FakeDriver(), report_sec=3600)
+    submit_order(driver)
+
+    driver.profiler.report()
+
+    assert driver.profiler.snapshot() == []
+    assert driver.profiler.totals["execute_async_script"][0] == 1
@@ -0,0 +1,114 @@
+import pytest
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+
+from core.element_cache import ElementCache
+from core.risk_manager import RiskManager
+
+
+class FakeElement:
+    """화면의 요소 1개. 리렌더링되면(stale=True) 모든 동작에서 StaleElementReferenceException."""
+
+    def __init__(self, page, xpath):
+        self.page = page
+        self.xpath = xpath
+        self.stale = False
+
+    def _check(self):
+        if self.stale:
+            raise StaleElementReferenceException(self.xpath)
+
+    def click(self):
+        self._check()
+        self.page.actions.append(("click", self.xpath))
+
+    def clear(self):
+        self._check()
+
+    def send_keys(self, text):
+        self._check()
+        self.page.actions.append(("type", self.xpath, text))
+
+
+class FakePage:
+    def __init__(self, xpaths):
+        self.present = set(xpaths)
+        self.rendered = {}
+        self.lookups = []
+        self.actions = []
+        self.current_url = "https://futures.mexc.com/ko-KR/exchange/BTC_USDT"
+
+    def find_element(self, by, value):
+        self.lookups.append(value)
+        if value not in self.present:
+            raise NoSuchElementException(value)
+        self.rendered[value] = FakeElement(self, value)
+        return self.rendered[value]
+
+    def rerender(self, xpath):
+        self.rendered[xpath].stale = True
+
+
+@pytest.fixture
+def page():
+    return FakePage(["//button[@id='long']", "//input[@id='qty']"])
+
+
+@pytest.fixture
+def cache(page):
+    cache = ElementCache(page, name="Test")
+    cache.register("long", "//button[@id='long']")
+    cache.register("qty", "//input[@id='qty']")
+    cache.register("missing", "//button[@id='gone']")
+    return cache
+
+
+def test_lookup_once_then_hits(cache, page):
+    for _ in range(3):
+        assert cache.click("long")
+        assert cache.fill("qty", "0.01")
+
+    assert page.lookups == ["//button[@id='long']", "//input[@id='qty']"]
+    assert cache.stats() == {"hits": 4, "misses": 2, "re_resolves": 0, "invalidations": 0}
+    assert page.actions[-2:] == [("click", "//button[@id='long']"), ("type", "//input[@id='qty']", "0.01")]
+
+
+def test_stale_element_is_re_resolved_once(cache, page):
+    cache.click("long")
+    page.rerender("//button[@id='long']")
+
+    assert cache.click("long")
+    assert cache.re_resolves == 1
+    assert page.lookups.count("//button[@id='long']") == 2
+    assert page.actions.count(("click", "//button[@id='long']")) == 2
+
+
+def test_stale_element_that_disappeared_raises(cache, page):
+    cache.click("long")
+    page.rerender("//button[@id='long']")
+    page.present.discard("//button[@id='long']")
+
+    with pytest.raises(NoSuchElementException):
+        cache.click("long")
+
+
+def test_missing_element_returns_false_and_is_not_cached(cache, page):
+    assert cache.click("missing") is False
+    assert cache.click("missing") is False
+    assert page.lookups.count("//button[@id='gone']") == 2
+
+
+def test_page_change_invalidates_through_risk_manager(cache, page):
+    risk_manager = RiskManager(driver=page)
+    risk_manager.add_page_change_listener(cache.invalidate)
+    cache.click("long")
+
+    risk_manager.check_session_and_relogin()       # 첫 확인: URL 기록만
+    risk_manager.check_session_and_relogin()       # 같은 URL => 유지
+    assert cache.invalidations == 0
+
+    page.current_url = "https://futures.mexc.com/ko-KR/exchange/ETH_USDT"
+    risk_manager.check_session_and_relogin()
+    assert cache.invalidations == 1
+
+    cache.click("long")
+    assert page.lookups.count("//button[@id='long']") == 2
@@ -0,0 +1,104 @@
+import pytest
+
+from core.events import EventPool, TickEvent
+from core.strategy_host import StrategyHost, StrategyPlugin
+
+
+class RecordingPlugin(StrategyPlugin):
+    name = "recorder"
+
+    def __init__(self):
+        self.ticks = []
+        self.fills = []
+
+    def on_tick(self, price, data):
+        self.ticks.append((price, data.get("bars", [])))
+
+    def on_fill(self, fill):
+        # 이벤트는 콜백 뒤 반납되므로 필요한 값만 복사
+        self.fills.append((fill.strategy, fill["action"], fill.side, fill.qty, fill.price, id(fill)))
+
+
+class OkExecutor:
+    def place_market_order(self, side, quantity):
+        return True
+
+    def close_position(self, side, quantity):
+        return True
+
+
+def test_tick_event_behaves_like_the_old_dict():
+    event = TickEvent()
+    event["lastPrice"] = "3000.5"
+    event["bars"] = ["bar"]
+
+    assert event["lastPrice"] == "3000.5" and event.last_price == "3000.5"
+    assert event.get("bars", []) == ["bar"]
+    assert event.get("deals", []) == ()          # 비어 있으면 공유 빈 튜플
+    assert "lastPrice" in event and "kline" in event and "missing" not in event
+    with pytest.raises(KeyError):
+        event["missing"]
+    with pytest.raises(KeyError):
+        event["missing"] = 1
+    # __slots__ => 인스턴스 dict 없음, 오타 속성도 거부
+    assert not hasattr(event, "__dict__")
+    with pytest.raises(AttributeError):
+        event.lastprice = 1
+
+
+def test_unset_values_fall_back_to_default():
+    event = TickEvent()
+    assert event.get("lastPrice") is None
+    assert event.get("lastPrice", 0.0) == 0.0
+    assert "lastPrice" not in event
+
+
+def test_pool_reuses_reset_events_up_to_max_free():
+    pool = EventPool(TickEvent, max_free=2)
+    first = pool.acquire()
+    first["lastPrice"] = 1.0
+    first["bars"] = ["bar"]
+    pool.release(first)
+
+    again = pool.acquire()
+    assert again is first
+    assert again.last_price is None and again.bars == ()
+    assert pool.created == 1
+
+    events = [pool.acquire() for _ in range(4)] + [again]
+    for event in events:
+        pool.release(event)
+    assert len(pool._free) == 2                  # 넘치는 이벤트는 버림
+    assert pool.created == 5
+
+
+def test_host_fill_events_reuse_one_object():
+    host = StrategyHost(timer_sec=3600)
+    plugin = host.add(RecordingPlugin())
+    executor = host.wrap_executor("ema_scalp", OkExecutor())
+
+    host.on_data({"lastPrice": "3000.0", "bars": []})
+    executor.place_market_order("long", 0.01)
+    executor.close_position("LONG", 0.01)
+
+    assert plugin.fills[0][:5] == ("ema_scalp", "OPEN", "LONG", 0.01, 3000.0)
+    assert plugin.fills[1][:5] == ("ema_scalp", "CLOSE", "LONG", 0.01, 3000.0)
+    assert plugin.fills[0][5] == plugin.fills[1][5]
+    assert host._fills.created == 1
+
+
+def test_steady_tick_path_allocates_no_new_events():
+    host = StrategyHost(timer_sec=3600)
+    plugin = host.add(RecordingPlugin())
+    pool = EventPool(TickEvent)
+
+    for i in range(1000):
+        event = pool.acquire()
+        event["lastPrice"] = 3000.0 + i
+        try:
+            host.on_data(event)
+        finally:
+            pool.release(event)
+
+    assert pool.created == 1
+    assert plugin.ticks[-1] == (3999.0, ())
@@ -0,0 +1,130 @@
+import os
+import pickle
+import shutil
+
+import pytest
+
+from backtest import result_cache
+from backtest.incremental_backtest import SNAPSHOT_CODE_FILES, AppendReader, run_incremental
+from tests.helpers import BAR_HEADER, bar_lines, random_walk
+from utils.binlog import BinaryTickLog
+
+SIM_KWARGS = {"symbol": "ETH_USDT", "seed": 5, "record_fills": True}
+
+
+def _write(path, text, mode="w"):
+    with open(path, mode, encoding="utf-8", newline="") as f:
+        f.write(text)
+
+
+def _simulator(snapshot_path):
+    with open(snapshot_path, "rb") as f:
+        return pickle.load(f)["simulator"]
+
+
+@pytest.fixture
+def lines():
+    return bar_lines(random_walk(4000))
+
+
+def test_resumed_run_equals_full_run(tmp_path, lines):
+    full_path = tmp_path / "full.csv"
+    _write(full_path, BAR_HEADER + "".join(lines))
+    full = run_incremental(str(full_path), chunk_rows=700, **SIM_KWARGS)
+
+    inc_path = tmp_path / "inc.csv"
+    _write(inc_path, BAR_HEADER + "".join(lines[:2500]))
+    first = run_incremental(str(inc_path), chunk_rows=700, **SIM_KWARGS)
+    _write(inc_path, "".join(lines[2500:3300]), mode="a")
+    second = run_incremental(str(inc_path), chunk_rows=700, **SIM_KWARGS)
+    _write(inc_path, "".join(lines[3300:]), mode="a")
+    third = run_incremental(str(inc_path), chunk_rows=700, **SIM_KWARGS)
+
+    assert (first["resumed"], second["resumed"], third["resumed"]) == (False, True, True)
+    assert (first["new_rows"], second["new_rows"], third["new_rows"]) == (2500, 800, 700)
+    assert third["offset"] == full["offset"] == inc_path.stat().st_size
+    assert full["summary"]["orders"] > 0
+    assert third["summary"] == full["summary"]
+
+    resumed = _simulator(f"{inc_path}.snapshot")
+    reference = _simulator(f"{full_path}.snapshot")
+    assert resumed.order_executor.fills == reference.order_executor.fills
+    assert resumed.strategy.ema3 == reference.strategy.ema3
+    assert resumed.clock.time() == reference.clock.time()
+
+
+def test_partial_last_line_is_deferred(tmp_path, lines):
+    path = tmp_path / "bars.csv"
+    _write(path, BAR_HEADER + "".join(lines[:10]) + lines[10][:12])
+
+    reader = AppendReader(str(path))
+    rows = [row for chunk in reader.chunks(chunk_rows=4) for row in chunk]
+
+    assert len(rows) == 10
+    assert reader.offset == len((BAR_HEADER + "".join(lines[:10])).encode("utf-8"))
+
+    # 다음 실행: 나머지를 덧붙이면 잘린 행부터 이어서 읽고, digest는 file[:offset] 전체와 일치
+    _write(path, lines[10][12:] + lines[11], mode="a")
+    resumed = AppendReader(str(path), reader.offset)
+    assert resumed.verify(reader.digest.hexdigest())
+    rows = [row for chunk in resumed.chunks() for row in chunk]
+    assert len(rows) == 2
+    assert resumed.offset == path.stat().st_size
+
+
+def test_modified_history_restarts_from_scratch(tmp_path, lines):
+    path = tmp_path / "bars.csv"
+    _write(path, BAR_HEADER + "".join(lines[:1000]))
+    run_incremental(str(path), **SIM_KWARGS)
+
+    edited = lines[5].replace(",1\n", ",2\n")
+    _write(path, BAR_HEADER + "".join(lines[:5]) + edited + "".join(lines[6:1200]))
+    result = run_incremental(str(path), **SIM_KWARGS)
+
+    assert result["resumed"] is False
+    assert result["new_rows"] == 1200
+
+
+@pytest.mark.parametrize("edited", ["backtest/stream_backtest.py", "config/config.py"])
+def test_reader_or_config_change_invalidates_snapshot(tmp_path, lines, monkeypatch, edited):
+    root = tmp_path / "project"
+    for name in SNAPSHOT_CODE_FILES:
+        target = root / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(os.path.join(result_cache._PROJECT_ROOT, name), target)
+    monkeypatch.setattr(result_cache, "_PROJECT_ROOT", str(root))
+
+    path = tmp_path / "bars.csv"
+    _write(path, BAR_HEADER + "".join(lines[:1000]))
+    run_incremental(str(path), **SIM_KWARGS)
+    _write(path, "".join(lines[1000:1100]), mode="a")
+    assert run_incremental(str(path), **SIM_KWARGS)["resumed"] is True
+
+    with open(root / edited, "a", encoding="utf-8") as f:
+        f.write("\n# edited\n")
+    result = run_incremental(str(path), **SIM_KWARGS)
+
+    assert result["resumed"] is False
+    assert result["new_rows"] == 1100
+
+
+def test_binary_tick_log_resume(tmp_path):
+    prices = random_walk(6000, sigma=0.0003)
+    ticks = [(1740960000 + i * 0.5, p) for i, p in enumerate(prices)]
+
+    def write(path, part):
+        log = BinaryTickLog(str(path))
+        for ts, price in part:
+            log.write(ts, price, None, None, None)
+        log.close()
+
+    write(tmp_path / "full.bin", ticks)
+    full = run_incremental(str(tmp_path / "full.bin"), chunk_rows=1000, **SIM_KWARGS)
+    write(tmp_path / "inc.bin", ticks[:4321])
+    run_incremental(str(tmp_path / "inc.bin"), chunk_rows=1000, **SIM_KWARGS)
+    write(tmp_path / "inc.bin", ticks[4321:])
+    resumed = run_incremental(str(tmp_path / "inc.bin"), chunk_rows=1000, **SIM_KWARGS)
+
+    assert resumed["resumed"] and resumed["new_rows"] == 6000 - 4321
+    assert full["summary"]["orders"] > 0
+    assert resumed["summary"] == full["summary"]
@@ -0,0 +1,76 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 브라우저 스택이 설치되지 않은 환경 흉내: selenium / undetected_chromedriver import 자체를 막음
+BLOCK_BROWSER = textwrap.dedent("""
+    import sys
+
+    class BlockBrowser:
+        def find_spec(self, name, path=None, target=None):
+            if name.split(".", 1)[0] in ("selenium", "undetected_chromedriver"):
+                raise ImportError(f"blocked: {name}")
+            return None
+
+    sys.meta_path.insert(0, BlockBrowser())
+""")
+
+
+def _run(code):
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    return subprocess.run([sys.executable, "-c", BLOCK_BROWSER + textwrap.dedent(code)],
+                          cwd=ROOT, env=env, capture_output=True, text=True)
+
+
+@pytest.mark.parametrize("module", [
+    "core.indicators",
+    "core.strategy",
+    "core.strategy_host",
+    "core.position_tracker",
+    "core.risk_manager",
+    "core.scheduler",
+    "backtest.sim_doubles",
+    "backtest.backtest_simulator",
+    "backtest.stream_backtest",
+    "backtest.incremental_backtest",
+])
+def test_module_imports_without_browser_stack(module):
+    proc = _run(f"import {module}")
+    assert proc.returncode == 0, proc.stderr
+
+
+def test_simulation_runs_without_browser_stack():
+    proc = _run("""
+        from datetime import datetime
+        from loguru import logger
+        from backtest.backtest_simulator import BacktestSimulator
+
+        logger.remove()
+        start = datetime(2025, 3, 3).timestamp()
+        sim = BacktestSimulator(symbol="ETH_USDT", user_seed=1000.0, seed=1)
+        count = sim.run_prices((start + i, 3000.0 + (i % 40 - 20) * 0.5) for i in range(3000))
+        sim.risk_manager.check_session_and_relogin()   # driver 없음 => 브라우저 import 없이 반환
+        print(count, "selenium" in sys.modules)
+    """)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.split() == ["3000", "False"]
+
+
+def test_dom_methods_still_load_selenium_on_demand():
+    proc = _run("""
+        sys.meta_path.pop(0)   # 브라우저 스택 허용
+        from core.risk_manager import RiskManager
+        assert "selenium" not in sys.modules
+        try:
+            RiskManager(driver=object()).close_popups()
+        except Exception:
+            pass
+        print("selenium" in sys.modules)
+    """)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.split() == ["True"]
@@ -0,0 +1,144 @@
+import math
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import pytest
+from loguru import logger
+
+import utils.logger as log_utils
+from utils.binlog import MAGIC, TICK_RECORD, BinaryTickLog, read_ticks
+from utils.logger import log_throttled, setup_logging, shutdown_logging, suppressed_counts
+
+TICKS = [
+    (1740960000.25, 3000.5, None, None, None),        # EMA 계산 전 => NaN으로 기록
+    (1740960000.75, 3001.0, 3000.9, 3000.7, 3000.4),
+    (1740960001.25, 2999.75, 3000.1, 3000.3, 3000.2),
+]
+
+
+def _same(row, tick):
+    return all((math.isnan(a) if b is None else a == b) for a, b in zip(row, tick))
+
+
+def test_binary_tick_log_round_trip(tmp_path):
+    path = str(tmp_path / "logs" / "ticks.bin")
+    tick_log = BinaryTickLog(path, buffer_records=2, flush_sec=3600)
+    for tick in TICKS:
+        tick_log.write(*tick)
+
+    # 버퍼(2건)가 차면 한 번에 기록, 나머지는 버퍼에 남음
+    assert len(list(read_ticks(path))) == 2
+    tick_log.close()
+
+    rows = list(read_ticks(path))
+    assert len(rows) == 3 and all(_same(row, tick) for row, tick in zip(rows, TICKS))
+    with open(path, "rb") as f:
+        assert f.read(len(MAGIC)) == MAGIC
+    assert (tmp_path / "logs" / "ticks.bin").stat().st_size == len(MAGIC) + 3 * TICK_RECORD.size
+
+
+def test_reopened_log_appends_without_second_header(tmp_path):
+    path = str(tmp_path / "ticks.bin")
+    for tick in TICKS:
+        tick_log = BinaryTickLog(path)
+        tick_log.write(*tick)
+        tick_log.close()
+
+    rows = list(read_ticks(path))
+    assert len(rows) == 3 and _same(rows[-1], TICKS[-1])
+
+
+def test_truncated_last_record_is_ignored(tmp_path):
+    path = tmp_path / "ticks.bin"
+    tick_log = BinaryTickLog(str(path))
+    for tick in TICKS:
+        tick_log.write(*tick)
+    tick_log.close()
+    path.write_bytes(path.read_bytes()[:-7])        # 쓰기 도중 종료
+
+    assert len(list(read_ticks(str(path)))) == 2
+
+
+def test_read_rejects_other_files(tmp_path):
+    path = tmp_path / "ticks.csv"
+    path.write_text("ts,price\n")
+    with pytest.raises(ValueError):
+        list(read_ticks(str(path)))
+
+
+def test_binlog_cli_converts_to_csv(tmp_path):
+    path = str(tmp_path / "ticks.bin")
+    tick_log = BinaryTickLog(path)
+    tick_log.write(*TICKS[1])
+    tick_log.close()
+
+    out = subprocess.run([sys.executable, "-m", "utils.binlog", path], capture_output=True, text=True, check=True)
+    assert out.stdout.splitlines() == [
+        "ts,price,ema1,ema2,ema3",
+        "1740960000.750000,3001.000000,3000.900000,3000.700000,3000.400000",
+    ]
+
+
+@pytest.fixture
+def messages():
+    captured = []
+    logger.add(lambda m: captured.append(m.record["message"]), format="{message}", level="DEBUG")
+    return captured
+
+
+@pytest.fixture
+def now(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(log_utils, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    return clock
+
+
+class CountingFormat:
+    def __init__(self):
+        self.formatted = 0
+
+    def __format__(self, spec):
+        self.formatted += 1
+        return "3000.5000"
+
+
+def test_log_throttled_emits_once_per_interval_and_counts_skips(messages, now):
+    price = CountingFormat()
+
+    assert log_throttled("INFO", 5.0, "[시세] lastPrice={}", price, key="test_tick")
+    for _ in range(3):
+        now[0] += 1.0
+        assert log_throttled("INFO", 5.0, "[시세] lastPrice={}", price, key="test_tick") is False
+    assert suppressed_counts()["test_tick"] == 3
+
+    now[0] += 2.0
+    assert log_throttled("INFO", 5.0, "[시세] lastPrice={}", price, key="test_tick")
+
+    assert messages == ["[시세] lastPrice=3000.5000", "[시세] lastPrice=3000.5000 (+3건 생략)"]
+    # 생략된 호출은 포맷하지 않음
+    assert price.formatted == 2
+    assert "test_tick" not in suppressed_counts()
+
+
+def test_log_throttled_keys_are_independent(messages, now):
+    assert log_throttled("INFO", 5.0, "a={}", 1, key="test_a")
+    assert log_throttled("INFO", 5.0, "b={}", 2, key="test_b")
+    assert log_throttled("INFO", 0, "c={}", 3, key="test_c")
+    assert log_throttled("INFO", 0, "c={}", 4, key="test_c")       # interval 0 => 제한 없음
+
+    assert messages == ["a=1", "b=2", "c=3", "c=4"]
+
+
+def test_enqueued_file_sink_is_flushed_on_shutdown(tmp_path):
+    log_file = tmp_path / "bot.log"
+    setup_logging(level="INFO", log_file=str(log_file), enqueue=True)
+    try:
+        logger.debug("숨김")
+        logger.info("주문 완료 {}", 1)
+        shutdown_logging()
+    finally:
+        logger.remove()
+
+    assert log_file.read_text(encoding="utf-8").count("주문 완료 1") == 1
+    assert "숨김" not in log_file.read_text(encoding="utf-8")
@@ -0,0 +1,123 @@
+import http.client
+from urllib.parse import quote
+
+import pytest
+
+from core.metrics import MetricsRegistry, MetricsServer, endpoint_name
+from core.sampling_profiler import SamplingProfiler
+
+
+@pytest.fixture(scope="module")
+def server(tmp_path_factory):
+    registry = MetricsRegistry()
+    registry.counter("test_ticks_total", "테스트 틱 수").inc(3)
+    server = MetricsServer(registry, port=0)
+    server.add_route("/profile", SamplingProfiler(output_dir=str(tmp_path_factory.mktemp("profiles"))).http_handler())
+    server.add_route("/broken", lambda query: 1 / 0)
+    server.start()
+    yield server
+    server.stop()
+
+
+def _get(server, path):
+    conn = http.client.HTTPConnection(server.host, server.port, timeout=5)
+    try:
+        conn.request("GET", path)
+        resp = conn.getresponse()
+        return resp.status, resp.reason, resp.read().decode("utf-8")
+    finally:
+        conn.close()
+
+
+def test_metrics_endpoint_renders_registry(server):
+    status, _, body = _get(server, "/metrics")
+
+    assert status == 200
+    assert "# TYPE test_ticks_total counter" in body
+    assert "test_ticks_total 3.0" in body
+
+
+@pytest.mark.parametrize("raw", ["abc", "한", "nan", "-1", "0", "inf"])
+def test_profile_rejects_bad_seconds_with_400(server, raw):
+    status, reason, body = _get(server, f"/profile?seconds={quote(raw)}")
+
+    assert (status, reason) == (400, "bad request")
+    assert "seconds must be" in body
+
+
+def test_unknown_path_is_404_and_failing_route_is_500(server):
+    assert _get(server, "/nope")[0] == 404
+    assert _get(server, "/broken")[0] == 500
+    assert _get(server, "/metrics")[0] == 200
+
+
+def test_counter_gauge_and_labels_render_in_exposition_format():
+    registry = MetricsRegistry()
+    errors = registry.counter("feed_errors_total", "피드 오류", ("endpoint",))
+    errors.labels("deals").inc()
+    errors.labels("deals").inc(2)
+    errors.labels("ticker").inc()
+    registry.gauge("pnl_usdt", "손익").set(-1.5)
+
+    assert registry.render() == (
+        "# HELP feed_errors_total 피드 오류\n"
+        "# TYPE feed_errors_total counter\n"
+        'feed_errors_total{endpoint="deals"} 3.0\n'
+        'feed_errors_total{endpoint="ticker"} 1.0\n'
+        "# HELP pnl_usdt 손익\n"
+        "# TYPE pnl_usdt gauge\n"
+        "pnl_usdt -1.5\n"
+    )
+    assert errors.labels("deals") is errors.labels("deals")
+
+
+def test_histogram_buckets_are_cumulative_and_upper_inclusive():
+    registry = MetricsRegistry()
+    latency = registry.histogram("order_seconds", "주문 시간", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        latency.labels("script").observe(value)
+
+    lines = registry.render().splitlines()[2:]
+    assert lines == [
+        'order_seconds_bucket{route="script",le="0.1"} 2',
+        'order_seconds_bucket{route="script",le="1.0"} 3',
+        'order_seconds_bucket{route="script",le="+Inf"} 4',
+        'order_seconds_sum{route="script"} 3.65',
+        'order_seconds_count{route="script"} 4',
+    ]
+
+
+def test_callbacks_are_read_at_scrape_time():
+    registry = MetricsRegistry()
+    state = {"busy": 0}
+    registry.callback("executor_busy", "실행기 사용 중", lambda: state["busy"])
+    registry.callback("queue_depth", "대기 명령", lambda: {("command",): 4, ("result",): 0}, ("ring",))
+    registry.callback("no_value", "값 없음", lambda: None)
+    registry.callback("broken", "수집 실패", lambda: 1 / 0)
+
+    state["busy"] = 1
+    body = registry.render()
+
+    assert "executor_busy 1.0" in body
+    assert 'queue_depth{ring="command"} 4.0' in body and 'queue_depth{ring="result"} 0.0' in body
+    # 값이 없거나 수집이 실패한 지표는 헤더만 남고 나머지 지표는 그대로 출력
+    assert "# TYPE no_value gauge" in body and "\nno_value " not in body
+    assert "# TYPE broken gauge" in body and "\nbroken " not in body
+
+
+def test_re_registering_a_name_replaces_the_metric():
+    registry = MetricsRegistry()
+    registry.callback("uptime", "가동 시간", lambda: 1)
+    registry.callback("uptime", "가동 시간", lambda: 2)
+
+    assert registry.render().splitlines()[2:] == ["uptime 2.0"]
+
+
+@pytest.mark.parametrize("url, name", [
+    ("https://futures.mexc.com/api/v1/contract/deals/BTC_USDT", "deals"),
+    ("https://futures.mexc.com/api/v1/contract/ticker?symbol=BTC_USDT", "ticker"),
+    ("https://futures.mexc.com/api/v1/contract/kline/BTC_USDT", "kline"),
+    ("https://futures.mexc.com/api/v1/private/order/submit", "submit"),
+])
+def test_endpoint_name(url, name):
+    assert endpoint_name(url) == name
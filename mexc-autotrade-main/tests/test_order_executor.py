@@ -0,0 +1,130 @@
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from core.contract_spec import ContractSpecCache
+from core.order_executor import OrderExecutor
+
+
+class FakeDriver:
+    """요소는 하나도 없고, execute_async_script 결과만 스크립트로 지정하는 드라이버."""
+
+    def __init__(self):
+        self.script_calls = []
+        self.script_result = {"ok": True, "steps": {}, "error": None}
+
+    def find_element(self, by, value):
+        raise NoSuchElementException(value)
+
+    def execute_async_script(self, script, *args):
+        self.script_calls.append(args)
+        if isinstance(self.script_result, Exception):
+            raise self.script_result
+        return self.script_result
+
+
+class FakeTracker:
+    def __init__(self):
+        self.positions = []
+
+    def wait_positions_stable(self, timeout=1.0):
+        pass
+
+    def get_open_positions(self):
+        return list(self.positions)
+
+
+class FakeRiskManager:
+    def __init__(self):
+        self.position_tracker = FakeTracker()
+
+    def add_page_change_listener(self, func):
+        pass
+
+    def close_popups(self):
+        pass
+
+
+@pytest.fixture
+def driver():
+    return FakeDriver()
+
+
+@pytest.fixture
+def executor(driver):
+    executor = OrderExecutor(driver, symbol="ETH_USDT", risk_manager=FakeRiskManager())
+    executor.submit_mode = "script"
+    executor.compare_every = 0
+    return executor
+
+
+def _position(side, size):
+    return {"symbol": "ETH_USDT", "positionSide": side, "size": size}
+
+
+def test_script_receives_quantity_rounded_to_qty_step(executor, driver):
+    assert executor.place_market_order("LONG", 0.1 + 0.2)
+    assert executor.close_position("LONG", 3 * 0.1)
+
+    # ETH_USDT 수량 단위 0.01 => "0.3" (str(0.1 + 0.2) == "0.30000000000000004")
+    assert [args[3] for args in driver.script_calls] == ["0.3", "0.3"]
+    assert executor.expected_size == {"LONG": 0.0, "SHORT": 0.0}
+
+
+def test_unknown_open_is_resolved_from_positions(executor, driver):
+    driver.script_result = TimeoutException("script timeout")
+    tracker = executor.risk_manager.position_tracker
+    lookups = executor.elements.misses
+
+    tracker.positions = [_position("LONG", 0.5)]
+    assert executor.place_market_order("LONG", 0.5) is True
+    assert executor.expected_size["LONG"] == 0.5
+
+    tracker.positions = [_position("LONG", 0.5)]
+    assert executor.place_market_order("SHORT", 0.5) is False
+
+    # 재전송 없음: 스크립트 1회씩만, 클릭 경로(요소 탐색 후 클릭)로 다시 보내지 않음
+    assert len(driver.script_calls) == 2
+    assert executor.elements.misses == lookups
+
+
+def test_unknown_close_is_resolved_from_positions(executor, driver):
+    tracker = executor.risk_manager.position_tracker
+    assert executor.place_market_order("SHORT", 0.4)
+
+    driver.script_result = TimeoutException("script timeout")
+    tracker.positions = [_position("SHORT", 0.4)]
+    assert executor.close_position("SHORT", 0.4) is False
+
+    tracker.positions = []
+    assert executor.close_position("SHORT", 0.4) is True
+    assert executor.expected_size["SHORT"] == 0.0
+
+
+def test_compare_every_routes_nth_order_to_click_path(executor, driver):
+    executor.compare_every = 3
+
+    results = [executor.place_market_order("LONG", 0.1) for _ in range(3)]
+
+    # 3번째는 클릭 경로 => 이 드라이버에는 요소가 없어 실패, 스크립트 호출은 2회
+    assert results == [True, True, False]
+    assert len(driver.script_calls) == 2
+
+
+def test_invalid_quantity_is_not_sent(driver, tmp_path):
+    specs = ContractSpecCache(cache_dir=str(tmp_path), fetch_json=lambda url, params: {
+        "success": True, "code": 0,
+        "data": [{"symbol": "ETH_USDT", "contractSize": 0.01, "minVol": 1, "volUnit": 1, "priceUnit": 0.01}],
+    })
+    specs.ensure()
+    executor = OrderExecutor(driver, symbol="ETH_USDT", risk_manager=FakeRiskManager(), contract_specs=specs)
+    executor.submit_mode = "script"
+    executor.compare_every = 0
+    lookups = executor.elements.misses
+
+    assert executor.place_market_order("LONG", 0.005) is False     # 최소 0.01 미만
+    assert executor.close_position("LONG", 0.015) is False         # 수량 단위 0.01의 배수가 아님
+    assert driver.script_calls == []
+    assert executor.elements.misses == lookups
+
+    assert executor.place_market_order("LONG", 0.02)
+    assert [args[3] for args in driver.script_calls] == ["0.02"]
@@ -0,0 +1,68 @@
+import os
+import threading
+import time
+import uuid
+
+import pytest
+
+from core import pipeline
+from core.pipeline import (
+    KIND_PNL, KIND_RECORD, KIND_VOLUME, TRADE_TYPES, RemotePositionTracker, RemoteRiskManager, RingOrderExecutor,
+)
+from core.shm_ring import COMMAND_RECORD, ShmRing
+
+
+@pytest.fixture
+def commands():
+    ring = ShmRing(f"test_cmd_{os.getpid()}_{uuid.uuid4().hex[:8]}", COMMAND_RECORD, capacity=2, create=True)
+    yield ring
+    ring.close()
+    ring.unlink()
+
+
+def test_records_are_encoded_for_the_executor(commands):
+    RemotePositionTracker(commands).add_trade_volume(1500.0)
+    RemoteRiskManager(commands, state=None).record_trade("HEDGE_SHORT", last_entry_price=3001.5, close_price=3000.0)
+
+    assert commands.pop()[2:] == (KIND_VOLUME, 0, 1500.0, 0.0)
+    assert commands.pop()[2:] == (KIND_RECORD, TRADE_TYPES.index("HEDGE_SHORT"), 3001.5, 3000.0)
+
+
+def test_full_ring_record_is_retried_until_executor_drains(commands, monkeypatch):
+    monkeypatch.setattr(pipeline, "RECORD_PUSH_RETRY_SEC", 2.0)
+    tracker = RemotePositionTracker(commands)
+    tracker.add_trade_volume(1.0)
+    tracker.add_trade_volume(2.0)
+
+    drained = []
+    consumer = threading.Timer(0.05, lambda: drained.append(commands.pop()))
+    consumer.start()
+    tracker.add_realized_pnl(-3.5)
+    consumer.join()
+
+    assert tracker.dropped == 0
+    assert drained[0][4] == 1.0
+    assert [commands.pop()[2:5] for _ in range(2)] == [(KIND_VOLUME, 0, 2.0), (KIND_PNL, 0, -3.5)]
+
+
+def test_full_ring_record_is_counted_when_retry_expires(commands, monkeypatch):
+    monkeypatch.setattr(pipeline, "RECORD_PUSH_RETRY_SEC", 0.01)
+    risk = RemoteRiskManager(commands, state=None)
+    risk.record_trade("LONG50", 3000.0, 3000.0)
+    risk.record_trade("SHORT50", 3000.0, 3000.0)
+
+    started = time.monotonic()
+    risk.record_trade("LONG_ALL_CLOSED", 3000.0, 3010.0)
+
+    assert risk.dropped == 1
+    assert time.monotonic() - started >= 0.01
+    assert len(commands) == 2
+
+
+def test_order_on_full_ring_reports_failure(commands):
+    class Strategy:
+        current_price = 3000.0
+
+    executor = RingOrderExecutor(commands, Strategy())
+
+    assert [executor.place_market_order("LONG", 0.1) for _ in range(3)] == [True, True, False]
@@ -0,0 +1,59 @@
+from selenium.common.exceptions import NoSuchElementException
+
+from core.position_tracker import TOTAL_BALANCE_XPATH, UNREALIZED_PNL_XPATH, PositionTracker
+
+
+class FakeElement:
+    def __init__(self, text="", children=None):
+        self.text = text
+        self.children = children or {}
+        self.lookups = []
+
+    def find_element(self, by, value):
+        self.lookups.append(value)
+        if value not in self.children:
+            raise NoSuchElementException(value)
+        return self.children[value]
+
+
+class FakeDriver:
+    """자산 카드 1개. execute_async_script(UiWaiter)는 wait_result를 그대로 반환."""
+
+    def __init__(self, wait_result):
+        self.wait_result = wait_result
+        self.card = FakeElement(children={
+            TOTAL_BALANCE_XPATH: FakeElement("175.1783 USDT"),
+            UNREALIZED_PNL_XPATH: FakeElement("0.4210 USDT\n≈ 0.42 USD"),
+        })
+
+    def find_element(self, by, value):
+        return self.card
+
+    def execute_async_script(self, script, *args):
+        return self.wait_result
+
+
+def test_stable_text_is_used_without_extra_read():
+    driver = FakeDriver({"ok": True, "value": "180.5 USDT", "ms": 33})
+    tracker = PositionTracker(driver=driver)
+
+    assert tracker.get_total_balance() == 180.5
+    assert driver.card.lookups == []
+
+
+def test_wait_timeout_falls_back_to_one_direct_read():
+    driver = FakeDriver({"ok": False, "value": None, "ms": 500})
+    tracker = PositionTracker(driver=driver)
+
+    assert tracker.get_total_balance() == 175.1783
+    assert tracker.get_unrealized_pnl() == 0.421
+    assert driver.card.lookups == [TOTAL_BALANCE_XPATH, UNREALIZED_PNL_XPATH]
+    assert tracker.waiter.stats["total_balance"][3] == 1  # 타임아웃으로 집계
+
+
+def test_missing_value_still_reads_as_zero():
+    driver = FakeDriver({"ok": False, "value": None, "ms": 500})
+    driver.card.children.clear()
+    tracker = PositionTracker(driver=driver)
+
+    assert tracker.get_total_balance() == 0.0
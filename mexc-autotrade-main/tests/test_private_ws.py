@@ -0,0 +1,137 @@
+import hashlib
+import hmac
+import json
+import threading
+import time
+
+import pytest
+from websockets.sync.server import serve
+
+from core.api_position_tracker import ApiAsset, ApiPosition, ApiPositionTracker
+from core.private_ws import AccountState, PrivateWsClient
+
+SYMBOL = "BTC_USDT"
+CONTRACT_SIZE = 0.0001
+API_KEY, API_SECRET = "key", "secret"
+
+
+def _wait_for(cond, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if cond():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def _position(side, contracts, price=60000.0):
+    return ApiPosition(SYMBOL, side, round(contracts * CONTRACT_SIZE, 10), contracts, price, 0.0, 50)
+
+
+def _push(channel, ts, **data):
+    return json.dumps({"channel": channel, "data": {"symbol": SYMBOL, **data}, "ts": ts})
+
+
+class StandInServer:
+    """
+    MEXC private WS 대역. 접속마다 login 서명 확인 => personal.filter 기록 => ping에 pong(서버 시각) 응답.
+    첫 접속은 pong 전에 오래된 푸시를 하나 흘리고, pong 뒤 푸시를 보낸 다음 drop 이벤트에서 연결을 끊음.
+    """
+
+    def __init__(self):
+        self.logins = []
+        self.filters = []
+        self.drop = threading.Event()
+        self.closing = threading.Event()
+        self._server = serve(self._handle, "127.0.0.1", 0, close_timeout=0.2)
+        self.url = f"ws://127.0.0.1:{self._server.socket.getsockname()[1]}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def _handle(self, ws):
+        connect_no = len(self.logins) + 1
+        login = json.loads(ws.recv())["param"]
+        expected = hmac.new(API_SECRET.encode(), f"{login['apiKey']}{login['reqTime']}".encode(),
+                            hashlib.sha256).hexdigest()
+        self.logins.append(login)
+        ws.send(json.dumps({"channel": "rs.login", "data": "success" if login["signature"] == expected else "fail"}))
+        self.filters.append(json.loads(ws.recv()))
+
+        server_ts = 1000 * connect_no
+        if connect_no == 1:
+            # 스냅샷 요청 전에 이미 쌓여 있던 푸시 (스냅샷에 반영된 변경 => 버려야 함)
+            ws.send(_push("push.personal.position", server_ts - 10, positionType=1, holdVol=99, state=1))
+        assert json.loads(ws.recv())["method"] == "ping"
+        ws.send(json.dumps({"channel": "pong", "data": server_ts}))
+
+        if connect_no == 1:
+            ws.send(_push("push.personal.position", server_ts - 5, positionType=1, holdVol=77, state=1))
+            ws.send(_push("push.personal.position", server_ts + 1, positionType=1, holdVol=30,
+                          holdAvgPrice=61000.0, state=1))
+            ws.send(json.dumps({"channel": "push.personal.asset", "ts": server_ts + 2,
+                                "data": {"currency": "USDT", "equity": 150.0, "availableBalance": 100.0,
+                                         "positionMargin": 50.0, "unrealized": 1.5}}))
+            self.drop.wait(5)
+            return  # 연결 끊김
+        self.closing.wait(5)
+
+    def close(self):
+        self.closing.set()
+        self.drop.set()
+        self._server.shutdown()
+
+
+@pytest.fixture
+def server():
+    server = StandInServer()
+    yield server
+    server.close()
+
+
+def test_login_filter_pushes_and_resync_after_drop(server):
+    snapshots = [
+        ([_position("LONG", 20)], ApiAsset("USDT", 140.0, 90.0, 50.0, 0.5)),
+        ([_position("SHORT", 10, 59000.0)], ApiAsset("USDT", 145.0, 95.0, 50.0, -0.5)),
+    ]
+    calls = []
+
+    def provider():
+        calls.append(threading.current_thread().name)
+        return snapshots[len(calls) - 1]
+
+    state = AccountState(SYMBOL, CONTRACT_SIZE)
+    client = PrivateWsClient(API_KEY, API_SECRET, state, snapshot_provider=provider, url=server.url,
+                             timeout=2, min_backoff=0.05, max_backoff=0.1)
+    client.start()
+    try:
+        # 1) 로그인 + 구독 범위 + 스냅샷 + 이후 푸시
+        assert _wait_for(lambda: state.asset is not None and state.asset.equity == 150.0)
+        assert server.logins[0]["apiKey"] == API_KEY
+        assert server.filters[0]["method"] == "personal.filter"
+        rules = {f["filter"]: f.get("rules") for f in server.filters[0]["param"]["filters"]}
+        assert rules == {"order": [SYMBOL], "order.deal": [SYMBOL], "position": [SYMBOL], "asset": None}
+
+        assert state.live and state.snapshot_ts == 1000
+        assert state.get_open_positions() == [{"symbol": SYMBOL, "positionSide": "LONG", "size": 0.003}]
+        assert state.positions["LONG"].entry_price == 61000.0
+        assert state.asset.unrealized == 1.5
+        # pong 전 푸시(holdVol 99)와 스냅샷보다 오래된 푸시(holdVol 77)는 버림
+        assert client.dropped_pushes == 2
+
+        # 2) 연결 끊김 => stale => 백오프 후 재접속 + 스냅샷으로 덮어씀
+        server.drop.set()
+        assert _wait_for(lambda: client.connects == 2 and state.live and state.snapshot_ts == 2000)
+        assert len(server.logins) == 2
+        assert state.get_open_positions() == [{"symbol": SYMBOL, "positionSide": "SHORT", "size": 0.001}]
+        assert state.asset.equity == 145.0
+        assert calls == ["private-ws", "private-ws"]
+    finally:
+        client.stop()
+    assert not state.live
+
+
+def test_snapshot_provider_uses_its_own_session():
+    tracker = ApiPositionTracker(SYMBOL, API_KEY, API_SECRET, CONTRACT_SIZE, base_url="http://127.0.0.1:9")
+    provider = tracker.snapshot_provider()
+
+    assert provider.__self__.session is not tracker.session
+    assert provider.__self__.positions_url == tracker.positions_url
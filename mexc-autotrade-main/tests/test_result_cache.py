@@ -0,0 +1,103 @@
+import os
+import shutil
+import time
+
+import pytest
+
+from backtest import result_cache
+from backtest.result_cache import CODE_FILES, ResultCache, code_version, run_cached, sweep
+from tests.helpers import random_walk, write_bars
+
+
+@pytest.fixture
+def project_copy(tmp_path, monkeypatch):
+    """CODE_FILES를 임시 디렉터리에 복사하고 code_version()이 그쪽을 읽게 함."""
+    root = tmp_path / "project"
+    for name in CODE_FILES:
+        target = root / name
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(os.path.join(result_cache._PROJECT_ROOT, name), target)
+    monkeypatch.setattr(result_cache, "_PROJECT_ROOT", str(root))
+    return root
+
+
+@pytest.fixture
+def bars(tmp_path):
+    return write_bars(tmp_path / "bars.csv", random_walk(1500))
+
+
+def test_second_run_is_served_from_cache(tmp_path, bars):
+    cache = ResultCache(str(tmp_path / "cache"))
+
+    first = run_cached(bars, {"ema_long": 9}, cache)
+    second = run_cached(bars, {"ema_long": 9}, cache)
+
+    assert first["cached"] is False and second["cached"] is True
+    assert second["summary"] == first["summary"]
+    assert second["fills"] == first["fills"]
+    assert first["summary"]["orders"] > 0
+
+
+def test_sweep_skips_cached_grid_points(tmp_path, bars):
+    cache = ResultCache(str(tmp_path / "cache"))
+    grid = {"ema_short": (1, 2), "ema_long": (7, 12)}
+
+    first = sweep(bars, grid, cache)
+    second = sweep(bars, grid, cache)
+
+    assert [r["cached"] for r in first] == [False] * 4
+    assert [r["cached"] for r in second] == [True] * 4
+    assert [r["summary"] for r in second] == [r["summary"] for r in first]
+
+
+@pytest.mark.parametrize("edited", ["config/config.py", "core/strategy.py", "core/position_tracker.py"])
+def test_code_or_config_change_misses(tmp_path, bars, project_copy, edited):
+    cache = ResultCache(str(tmp_path / "cache"))
+    before = code_version()
+    assert run_cached(bars, None, cache)["cached"] is False
+    assert run_cached(bars, None, cache)["cached"] is True
+
+    with open(project_copy / edited, "a", encoding="utf-8") as f:
+        f.write("\n# edited\n")
+
+    assert code_version() != before
+    assert run_cached(bars, None, cache)["cached"] is False
+
+
+def test_data_change_misses(tmp_path, bars):
+    cache = ResultCache(str(tmp_path / "cache"))
+    run_cached(bars, None, cache)
+
+    with open(bars, "a", encoding="utf-8") as f:
+        f.write("2025-03-10T00:00:00,1,1,1,3000.0,1\n")
+
+    assert run_cached(bars, None, cache)["cached"] is False
+
+
+def test_csv_without_datetime_does_not_depend_on_wall_clock(tmp_path, monkeypatch):
+    path = tmp_path / "close_only.csv"
+    path.write_text("close\n" + "".join(f"{p!r}\n" for p in random_walk(1500)), encoding="utf-8")
+
+    monkeypatch.setattr(time, "time", lambda: 1_700_000_000.0)
+    morning = run_cached(str(path), None, ResultCache(str(tmp_path / "a")))
+    monkeypatch.setattr(time, "time", lambda: 1_700_040_000.0)
+    evening = run_cached(str(path), None, ResultCache(str(tmp_path / "b")))
+
+    assert morning["summary"]["orders"] > 0
+    assert morning["fills"] == evening["fills"]
+    assert morning["fills"][0][0] < 86400  # SYNTHETIC_START_TS(0) 기준 시각
+
+
+def test_lru_eviction_keeps_recently_read_entries(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"), max_bytes=10**9)
+    for i, key in enumerate(("a", "b", "c")):
+        cache.put(key, {"payload": "x" * 1000})
+        os.utime(cache._path(key), ns=(i * 10**9, i * 10**9))
+    cache.get("a")  # a를 가장 최근 사용으로
+
+    cache.max_bytes = 2100
+    removed = cache.evict()
+
+    assert removed == 1
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
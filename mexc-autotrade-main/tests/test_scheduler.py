@@ -0,0 +1,119 @@
+import pickle
+import threading
+import time
+from datetime import datetime
+
+from core.clock import VirtualClock
+from core.scheduler import Scheduler
+
+START = datetime(2025, 3, 3, 14, 58, 0)
+T0 = START.timestamp()
+
+
+def _scheduler():
+    clock = VirtualClock(START)
+    return Scheduler(clock=clock), clock
+
+
+def test_jobs_run_in_deadline_order_on_virtual_clock():
+    scheduler, clock = _scheduler()
+    ran = []
+
+    def job(name):
+        return lambda: ran.append((name, clock.time() - T0))
+
+    scheduler.every(30, job("fast"), name="fast")
+    scheduler.every(45, job("slow"), name="slow", first_delay=0)
+    scheduler.at(T0 + 50, job("once"), name="once")
+
+    assert scheduler.run_until(T0 + 90) == 7
+    # 같은 deadline(90)이면 먼저 예약된 작업부터
+    assert ran == [("slow", 0), ("fast", 30), ("slow", 45), ("once", 50), ("fast", 60), ("slow", 90), ("fast", 90)]
+    assert clock.time() == T0 + 90
+    assert scheduler.next_deadline() == T0 + 120
+
+
+def test_daily_job_fires_once_per_day_at_local_time():
+    scheduler, clock = _scheduler()
+    fired = []
+    scheduler.daily_at(15, 0, lambda: fired.append(clock.now()), name="daily_reset")
+
+    scheduler.run_until(T0 + 2 * 86400)
+
+    assert fired == [datetime(2025, 3, 3, 15, 0), datetime(2025, 3, 4, 15, 0)]
+
+
+def test_overrunning_job_skips_missed_runs_and_records_lateness():
+    scheduler, clock = _scheduler()
+    slow = scheduler.every(10, lambda: clock.advance(35), name="slow")
+
+    scheduler.run_until(T0 + 10)
+
+    # 10초에 시작해 45초에 끝남 => 20/30/40초 회차는 건너뛰고 다음은 끝난 시각 + 10초
+    assert slow.runs == 1
+    assert slow.max_duration == 35
+    assert scheduler.next_deadline() == T0 + 55
+
+    clock.set(T0 + 57)
+    scheduler.run_pending()
+    assert slow.runs == 2
+    assert slow.last_lateness == 2
+
+
+def test_cancel_and_reschedule_use_latest_deadline_only():
+    scheduler, clock = _scheduler()
+    ran = []
+    job = scheduler.at(T0 + 10, lambda: ran.append(clock.time() - T0), name="pause_expiry")
+
+    scheduler.reschedule(job, T0 + 20)
+    scheduler.reschedule(job, T0 + 15)
+    scheduler.run_until(T0 + 30)
+    assert ran == [15]  # 이전 예약(10, 20)은 버려짐
+
+    scheduler.reschedule(job, T0 + 40)
+    scheduler.cancel(job)
+    scheduler.run_until(T0 + 60)
+    assert ran == [15]
+    assert scheduler.next_deadline() is None
+    assert scheduler.pending() == 0
+
+
+def test_failing_job_is_counted_and_keeps_running():
+    scheduler, _ = _scheduler()
+    scheduler.every(5, lambda: 1 / 0, name="broken")
+
+    scheduler.run_until(T0 + 20)
+
+    [row] = scheduler.report()
+    assert (row["name"], row["runs"], row["failures"]) == ("broken", 4, 4)
+
+
+def test_pickled_scheduler_resumes_with_same_schedule():
+    scheduler, clock = _scheduler()
+    scheduler.every(30, clock.time, name="tick")
+    scheduler.run_until(T0 + 60)
+
+    restored = pickle.loads(pickle.dumps(scheduler))
+    restored.run_until(T0 + 120)
+
+    assert restored.jobs[0].runs == 4
+    assert scheduler.jobs[0].runs == 2
+    assert restored.next_deadline() == T0 + 150
+
+
+def test_run_forever_wakes_for_job_added_from_other_thread():
+    scheduler = Scheduler()
+    done = threading.Event()
+    thread = threading.Thread(target=scheduler.run_forever, daemon=True)
+    thread.start()
+    try:
+        # 빈 힙에서 무기한 대기 중 => 새 작업 등록 시 즉시 깨어나 deadline에 실행
+        time.sleep(0.05)
+        started = time.time()
+        scheduler.at(time.time() + 0.05, done.set, name="wake")
+        assert done.wait(1.0)
+        assert time.time() - started < 0.5
+    finally:
+        scheduler.stop()
+        thread.join(1.0)
+    assert not thread.is_alive()
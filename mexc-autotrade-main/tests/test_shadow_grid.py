@@ -0,0 +1,83 @@
+import pytest
+
+from core.shadow_grid import ShadowGrid
+from tests.helpers import random_walk
+
+
+def _reference(prices, fast, mid, slow, threshold):
+    """격자 점 1개를 ShadowGrid 규칙대로 스칼라로 재생 => (실현+미실현 수익률, 거래 수, 포지션)."""
+    a_fast, a_mid, a_slow = (2.0 / (span + 1.0) for span in (fast, mid, slow))
+    e_fast = e_mid = e_slow = prices[0]
+    prev_diff = 0.0
+    position, entry, realized, trades = 0, 0.0, 0.0, 0
+
+    for price in prices[1:]:
+        e_fast += (price - e_fast) * a_fast
+        e_mid += (price - e_mid) * a_mid
+        e_slow += (price - e_slow) * a_slow
+        diff = e_fast - e_mid
+        golden, dead = prev_diff < 0 < diff, diff < 0 < prev_diff
+        prev_diff = diff
+
+        if position == 0:
+            if golden and e_mid > e_slow:
+                position, entry, trades = 1, price, trades + 1
+            elif dead and e_mid < e_slow:
+                position, entry, trades = -1, price, trades + 1
+        elif (position > 0 and dead) or (position < 0 and golden):
+            ret = (price - entry) / entry * position
+            realized += ret
+            trades += 1
+            if ret >= threshold:
+                position = 0
+            else:
+                position, entry, trades = -position, price, trades + 1
+
+    unrealized = (prices[-1] - entry) / entry * position if position else 0.0
+    return realized + unrealized, trades, position
+
+
+def test_vectorized_grid_matches_per_point_reference():
+    prices = random_walk(3000, seed=9, sigma=0.0008)
+    grid = ShadowGrid(fast_spans=(1, 2), mid_spans=(3, 5), slow_spans=(7, 12), thresholds=(0.0, 0.0005, 0.002),
+                      leaderboard_sec=0)
+    for price in prices:
+        grid.on_tick(price)
+
+    totals = grid.total_returns()
+    assert len(grid.params) == 2 * 2 * 2 * 3
+    assert grid.trades.sum() > 0
+    for i, (fast, mid, slow, threshold) in enumerate(grid.params):
+        total, trades, position = _reference(prices, fast, mid, slow, threshold)
+        assert totals[i] == pytest.approx(total, abs=1e-12)
+        assert (int(grid.trades[i]), int(grid.position[i])) == (trades, position)
+
+
+def test_leaderboard_is_sorted_by_total_return():
+    grid = ShadowGrid(fast_spans=(1, 2), mid_spans=(3, 4), slow_spans=(7, 9), thresholds=(0.0, 0.001),
+                      leaderboard_sec=0, top_n=3)
+    for price in random_walk(2000, seed=4):
+        grid.on_tick(price)
+
+    rows = grid.leaderboard()
+    assert len(rows) == 3
+    assert [row["return"] for row in rows] == sorted(grid.total_returns(), reverse=True)[:3]
+    assert {"fast", "mid", "slow", "threshold", "trades", "position"} <= rows[0].keys()
+
+
+def test_invalid_spans_are_filtered_or_rejected():
+    grid = ShadowGrid(fast_spans=(1, 5), mid_spans=(3,), slow_spans=(7,))
+    assert grid.params == [(1, 3, 7, 0.0005)]       # fast(5) >= mid(3) 조합은 제외
+
+    with pytest.raises(ValueError):
+        ShadowGrid(fast_spans=(3,), mid_spans=(3,), slow_spans=(7,))
+
+
+def test_first_tick_only_seeds_emas():
+    grid = ShadowGrid(leaderboard_sec=0)
+    assert grid.total_returns().tolist() == [0.0]
+
+    grid.on_tick(3000.0)
+    assert grid.ticks == 1
+    assert grid.ema_fast.tolist() == grid.ema_slow.tolist() == [3000.0]
+    assert grid.position.tolist() == [0.0]
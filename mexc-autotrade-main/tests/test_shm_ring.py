@@ -0,0 +1,90 @@
+import math
+import os
+import uuid
+
+import pytest
+
+from core.shm_ring import COMMAND_RECORD, TICK_RECORD, ShmRing, ShmState
+
+
+def _name(prefix):
+    return f"{prefix}_{os.getpid()}_{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def ring():
+    ring = ShmRing(_name("test_ring"), TICK_RECORD, capacity=4, create=True)
+    yield ring
+    ring.close()
+    ring.unlink()
+
+
+def test_fifo_order_across_wrap_around(ring):
+    popped = []
+    seq = 0
+    # 3개 넣고 2개 빼기를 반복 => head/tail이 capacity(4)를 여러 번 넘어감
+    for _ in range(6):
+        for _ in range(3):
+            if ring.push(seq, 1740960000.0 + seq, 3000.0 + seq, math.nan):
+                seq += 1
+        for _ in range(2):
+            popped.append(ring.pop())
+    while len(ring):
+        popped.append(ring.pop())
+
+    assert seq > ring.capacity * 3
+    assert [record[0] for record in popped] == list(range(seq))
+    assert all(record[2] == 3000.0 + record[0] for record in popped)
+    assert all(math.isnan(record[3]) for record in popped)
+    assert ring.pop() is None
+
+
+def test_full_ring_rejects_push_without_overwriting(ring):
+    assert ring.pop() is None
+    for seq in range(4):
+        assert ring.push(seq, 0.0, float(seq), 0.0)
+
+    assert len(ring) == 4
+    assert ring.push(99, 0.0, 99.0, 0.0) is False
+    assert ring.pop()[0] == 0
+
+    # 한 칸 비면 다시 들어가고, 기존 레코드는 그대로
+    assert ring.push(4, 0.0, 4.0, 0.0)
+    assert ring.push(5, 0.0, 5.0, 0.0) is False
+    assert [ring.pop()[0] for _ in range(4)] == [1, 2, 3, 4]
+
+
+def test_attached_ring_shares_records_and_capacity():
+    producer = ShmRing(_name("test_cmd"), COMMAND_RECORD, capacity=8, create=True)
+    consumer = ShmRing(producer.name, COMMAND_RECORD)
+    try:
+        assert consumer.capacity == 8
+        producer.push(1, 1740960000.5, 0, 1, 0.01, 3000.0)
+        producer.push(2, 1740960001.0, 1, 1, 0.01, 3001.5)
+
+        assert len(consumer) == 2
+        assert consumer.pop() == (1, 1740960000.5, 0, 1, 0.01, 3000.0)
+        assert len(producer) == 1
+        assert consumer.pop()[5] == 3001.5
+        assert producer.pop() is None
+    finally:
+        consumer.close()
+        producer.close()
+        producer.unlink()
+
+
+def test_shared_state_round_trip():
+    owner = ShmState(_name("test_state"), create=True)
+    reader = ShmState(owner.name)
+    try:
+        assert reader.get("pause_until") == 0.0
+        owner.set("pause_until", 1740963600.25)
+        owner.set("realized_pnl", -1.5)
+
+        assert reader.get("pause_until") == 1740963600.25
+        assert reader.get("realized_pnl") == -1.5
+        assert reader.get("accumulated_volume") == 0.0
+    finally:
+        reader.close()
+        owner.close()
+        owner.unlink()
@@ -0,0 +1,48 @@
+from datetime import datetime
+
+from backtest.backtest_simulator import BacktestSimulator
+from backtest.stream_backtest import StreamingBacktest, iter_chunks, make_row_parser
+from tests.helpers import random_walk, write_bars, write_deals
+
+
+def test_deals_csv_uses_t_as_timestamp_not_side(tmp_path):
+    start_ms = int(datetime(2025, 3, 3, 12, 0).timestamp() * 1000)
+    path = write_deals(tmp_path / "deals.csv", [
+        (3000.5, 1, 1, start_ms),
+        (3001.0, 2, 2, start_ms + 500),
+        (2999.5, 3, 1, start_ms + 1500),
+    ])
+
+    rows = [row for chunk in iter_chunks(path, chunk_rows=2) for row in chunk]
+
+    assert rows == [
+        (start_ms / 1000, 3000.5),
+        ((start_ms + 500) / 1000, 3001.0),
+        ((start_ms + 1500) / 1000, 2999.5),
+    ]
+
+
+def test_row_parser_accepts_bar_and_epoch_seconds_columns():
+    bar = make_row_parser(["datetime", "open", "high", "low", "close", "volume"])
+    ticks = make_row_parser(["ts", "price"])
+
+    assert bar(["2025-03-03T00:01:00", "1", "2", "0.5", "1.5", "10"]) == (
+        datetime(2025, 3, 3, 0, 1).timestamp(), 1.5)
+    assert ticks(["1740960000", "3000"]) == (1740960000.0, 3000.0)
+
+
+def test_chunked_run_matches_single_pass(tmp_path):
+    path = write_bars(tmp_path / "bars.csv", random_walk(3000))
+
+    reference = BacktestSimulator(csv_file=path, seed=1, record_fills=True)
+    reference.run_prices(row for chunk in iter_chunks(path, chunk_rows=10**6) for row in chunk)
+
+    streamed = BacktestSimulator(csv_file=path, seed=1, record_fills=True)
+    stats = StreamingBacktest(streamed, chunk_rows=257).run_file(path)
+
+    assert stats["rows"] == 3000
+    assert stats["chunks"] == 12
+    assert reference.order_executor.orders > 0
+    assert streamed.summary() == reference.summary()
+    assert streamed.order_executor.fills == reference.order_executor.fills
+    assert (streamed.strategy.ema1, streamed.strategy.ema3) == (reference.strategy.ema1, reference.strategy.ema3)
@@ -0,0 +1,117 @@
+import random
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from backtest.backtest_simulator import BacktestSimulator
+from backtest.sim_doubles import SimOrderExecutor, SimPositionTracker
+from core.clock import VirtualClock
+from core.risk_manager import RiskManager
+from core.scheduler import Scheduler
+from tests.helpers import random_walk
+
+START = datetime(2025, 3, 3, 9, 0, 0)
+
+
+def test_virtual_clock_sleeps_instantly_and_never_goes_back():
+    clock = VirtualClock(START)
+    started = time.perf_counter()
+    clock.sleep(3600)
+
+    assert time.perf_counter() - started < 0.1
+    assert clock.now() == START + timedelta(hours=1)
+
+    clock.set(START.timestamp())       # 과거로는 이동하지 않음
+    clock.advance(-5)
+    assert clock.now() == START + timedelta(hours=1)
+    clock.set(START.timestamp() + 7200)
+    assert clock.time() == START.timestamp() + 7200
+
+
+@pytest.fixture
+def tracker():
+    tracker = SimPositionTracker(symbol="ETH_USDT", balance=1000.0)
+    tracker.temp_order_executor = SimOrderExecutor(tracker, fee_rate=0.0)
+    tracker.set_initial_balance()
+    return tracker
+
+
+def _risk_manager(tracker, seed=1):
+    clock = VirtualClock(START)
+    scheduler = Scheduler(clock=clock)
+    risk_manager = RiskManager(position_tracker=tracker, user_seed=1000.0, clock=clock, rng=random.Random(seed))
+    risk_manager.set_scheduler(scheduler)
+    return risk_manager, scheduler, clock
+
+
+def test_rest_after_90_minutes_expires_on_scheduler(tracker):
+    risk_manager, scheduler, clock = _risk_manager(tracker)
+
+    clock.advance(89 * 60)
+    risk_manager.record_trade("LONG50_CLOSED")
+    assert not risk_manager.is_paused()
+
+    clock.advance(60)
+    risk_manager.record_trade("LONG50_CLOSED")
+    assert risk_manager.is_paused()
+    rest = (risk_manager.pause_end_time - clock.now()).total_seconds()
+    assert 600 <= rest <= 900
+
+    scheduler.run_until(risk_manager.pause_end_time.timestamp() - 1)
+    assert risk_manager.is_paused()
+    scheduler.run_until(risk_manager.pause_end_time.timestamp())
+    assert not risk_manager.is_paused()
+    assert risk_manager._pause_job.runs == 1
+
+
+def test_rest_is_skipped_while_holding_a_position(tracker):
+    risk_manager, _, clock = _risk_manager(tracker)
+    tracker.set_price(3000.0, clock.time())
+    tracker.temp_order_executor.place_market_order("LONG", 0.5)
+
+    clock.advance(91 * 60)
+    risk_manager.record_trade("LONG50")
+
+    assert not risk_manager.is_paused()
+
+
+def test_volume_goal_pauses_until_15_to_16(tracker):
+    risk_manager, _, _ = _risk_manager(tracker)
+    tracker.add_trade_volume(risk_manager.daily_volume_target)
+
+    risk_manager.check_volume_goal_and_sleep()
+
+    assert risk_manager.is_paused()
+    assert datetime(2025, 3, 3, 15, 0) <= risk_manager.pause_end_time < datetime(2025, 3, 3, 16, 0)
+
+
+def test_sim_doubles_fill_at_current_price_with_fees():
+    tracker = SimPositionTracker(balance=1000.0)
+    executor = SimOrderExecutor(tracker, fee_rate=0.001, record_fills=True)
+
+    tracker.set_price(100.0, ts=1.0)
+    assert executor.place_market_order("LONG", 2.0)
+    assert executor.place_market_order("LONG", 2.0) and tracker.positions["LONG"] == [4.0, 100.0]
+    tracker.set_price(110.0, ts=2.0)
+    assert tracker.get_unrealized_pnl() == pytest.approx(40.0)
+
+    assert executor.close_position("LONG", 10.0)       # 보유 수량(4)까지만 청산
+    assert executor.close_position("SHORT", 1.0) is False
+    assert tracker.get_open_positions() == []
+    assert tracker.get_total_balance() == pytest.approx(1000.0 - 0.4 + 40.0 - 0.44)
+    assert executor.fills[-1] == (2.0, "close", "LONG", 4.0, 110.0)
+
+
+def test_same_seed_replays_identically():
+    start = datetime(2025, 3, 3, 0, 0).timestamp()
+    prices = [(start + i * 0.5, p) for i, p in enumerate(random_walk(20000, seed=5, sigma=0.0005))]
+
+    runs = []
+    for _ in range(2):
+        sim = BacktestSimulator(symbol="ETH_USDT", user_seed=1000.0, seed=11)
+        sim.run_prices(prices)
+        runs.append(sim.summary())
+
+    assert runs[0] == runs[1]
+    assert runs[0]["orders"] > 0
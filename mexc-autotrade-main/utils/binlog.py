@@ -0,0 +1,77 @@
+import os
+import struct
+import sys
+import time
+
+# 틱 레코드: 수신시각(epoch초), 현재가, EMA1, EMA2, EMA3 => 40바이트
+TICK_RECORD = struct.Struct("<ddddd")
+MAGIC = b"MXTICK01"
+
+
+class BinaryTickLog:
+    """
+    고빈도 시세 로그를 텍스트 대신 고정 길이 바이너리 레코드로 기록.
+    - 포맷 문자열/인코딩 없음, struct.pack_into로 미리 잡아 둔 버퍼에 씀
+    - 버퍼가 차거나 flush_sec가 지나면 한 번에 파일로 씀 (틱마다 시스템 콜 없음)
+    - python -m utils.binlog <파일> 로 CSV 변환
+
+    사용 예)
+        tick_log = BinaryTickLog("data/ticks.bin")
+        tick_log.write(time.time(), price, ema1, ema2, ema3)
+        tick_log.close()
+    """
+
+    def __init__(self, path, buffer_records=1024, flush_sec=5.0):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.path = path
+        self.file = open(path, "ab", buffering=0)
+        if new_file:
+            self.file.write(MAGIC)
+        self.buffer = bytearray(TICK_RECORD.size * buffer_records)
+        self.view = memoryview(self.buffer)
+        self.capacity = buffer_records
+        self.count = 0
+        self.flush_sec = flush_sec
+        self._last_flush = time.monotonic()
+        self.records = 0
+
+    def write(self, ts, price, ema1, ema2, ema3):
+        TICK_RECORD.pack_into(self.buffer, self.count * TICK_RECORD.size, ts, price,
+                              ema1 if ema1 is not None else float("nan"),
+                              ema2 if ema2 is not None else float("nan"),
+                              ema3 if ema3 is not None else float("nan"))
+        self.count += 1
+        self.records += 1
+        if self.count >= self.capacity or time.monotonic() - self._last_flush >= self.flush_sec:
+            self.flush()
+
+    def flush(self):
+        if self.count:
+            self.file.write(self.view[:self.count * TICK_RECORD.size])
+            self.count = 0
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+
+def read_ticks(path):
+    """기록된 틱을 (ts, price, ema1, ema2, ema3) 튜플로 순서대로 반환."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"틱 바이너리 로그 파일이 아님: {path}")
+        while True:
+            chunk = f.read(TICK_RECORD.size * 4096)
+            if not chunk:
+                break
+            usable = len(chunk) - len(chunk) % TICK_RECORD.size
+            yield from TICK_RECORD.iter_unpack(chunk[:usable])
+
+
+if __name__ == "__main__":
+    # CSV로 변환: python -m utils.binlog data/ticks.bin > ticks.csv
+    print("ts,price,ema1,ema2,ema3")
+    for row in read_ticks(sys.argv[1]):
+        print(",".join(f"{v:.6f}" for v in row))
@@ -0,0 +1,59 @@
+import sys
+import threading
+import time
+from loguru import logger
+
+# 메시지 위치(key)별 마지막 출력 시각 / 그 사이 생략된 횟수
+_last_emit = {}
+_suppressed = {}
+_lock = threading.Lock()
+
+
+def setup_logging(level="INFO", log_file=None, enqueue=False, rotation="50 MB", retention=5):
+    """
+    loguru sink 구성.
+      - enqueue=True: 로그 레코드를 큐에 넣기만 하고 콘솔/파일 쓰기는 백그라운드 스레드가 처리
+        => 매매 경로(틱 처리, 주문)에서 디스크/콘솔 I/O 대기가 빠짐
+           (대신 레코드마다 pickle 비용 => sink가 빠르면 동기 쓰기가 더 쌈)
+      - log_file: 지정 시 파일 sink 추가 (rotation/retention 적용)
+    종료 시 shutdown_logging()으로 큐에 남은 로그를 비움.
+    """
+    logger.remove()
+    logger.add(sys.stderr, level=level, enqueue=enqueue)
+    if log_file:
+        logger.add(log_file, level=level, enqueue=enqueue, rotation=rotation, retention=retention,
+                   encoding="utf-8")
+
+
+def shutdown_logging():
+    """enqueue된 로그를 모두 기록할 때까지 대기."""
+    logger.complete()
+
+
+def log_throttled(level: str, interval_sec: float, message: str, *args, key=None):
+    """
+    같은 위치(key, 기본값은 message 템플릿)의 로그를 interval_sec에 최대 1번만 출력.
+    생략된 횟수는 다음 출력 끝에 "(+N건 생략)"으로 붙음.
+    포맷은 실제로 출력할 때만 수행되므로 message는 f-string이 아닌 "{}" 템플릿 + args로 넘길 것.
+
+    예) log_throttled("INFO", 5.0, "[시세] lastPrice={:.4f}", price)
+    """
+    key = key or message
+    now = time.monotonic()
+    with _lock:
+        if interval_sec > 0 and now - _last_emit.get(key, -interval_sec) < interval_sec:
+            _suppressed[key] = _suppressed.get(key, 0) + 1
+            return False
+        _last_emit[key] = now
+        skipped = _suppressed.pop(key, 0)
+
+    if skipped:
+        message = message + f" (+{skipped}건 생략)"
+    logger.opt(depth=1).log(level, message, *args)
+    return True
+
+
+def suppressed_counts() -> dict:
+    """key별 아직 출력되지 않은 생략 횟수."""
+    with _lock:
+        return dict(_suppressed)
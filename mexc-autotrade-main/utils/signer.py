@@ -0,0 +1,52 @@
+import hashlib
+import hmac
+import json
+import time
+from urllib.parse import urlencode
+
+
+def sign_request(api_key: str, api_secret: str, params=None, body=None):
+    """
+    MEXC 선물(contract) private API 서명 헤더 생성.
+      signature = HMAC_SHA256(secret, apiKey + reqTime + paramString)
+      - GET/DELETE: paramString = key 오름차순 정렬 후 "a=1&b=2"
+      - POST: paramString = JSON 본문 문자열
+    반환: (headers, body_str)  (POST가 아니면 body_str=None)
+    """
+    req_time = str(int(time.time() * 1000))
+
+    if body is not None:
+        body_str = json.dumps(body, separators=(",", ":"))
+        param_string = body_str
+    else:
+        body_str = None
+        param_string = urlencode(sorted((params or {}).items()))
+
+    signature = hmac.new(
+        api_secret.encode("utf-8"),
+        f"{api_key}{req_time}{param_string}".encode("utf-8"),
+        hashlib.sha256
+    ).hexdigest()
+
+    headers = {
+        "ApiKey": api_key,
+        "Request-Time": req_time,
+        "Signature": signature,
+        "Content-Type": "application/json",
+    }
+    return headers, body_str
+
+
+def sign_ws_login(api_key: str, api_secret: str) -> dict:
+    """
+    MEXC 선물 private WebSocket 로그인 파라미터.
+      signature = HMAC_SHA256(secret, apiKey + reqTime)
+    반환: {"method": "login", "param": {...}} 에 넣을 param dict
+    """
+    req_time = str(int(time.time() * 1000))
+    signature = hmac.new(
+        api_secret.encode("utf-8"),
+        f"{api_key}{req_time}".encode("utf-8"),
+        hashlib.sha256
+    ).hexdigest()
+    return {"apiKey": api_key, "reqTime": req_time, "signature": signature}